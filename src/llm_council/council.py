@@ -6,6 +6,8 @@ Provides a simple interface for running multi-LLM council tasks.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from typing import Any
 
 from llm_council.engine.orchestrator import CouncilResult, Orchestrator, OrchestratorConfig
@@ -179,6 +181,16 @@ class Council:
         """
         return await self._orchestrator.doctor()
 
+    async def iter_doctor(self) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Yield provider health results as each check completes.
+
+        Yields:
+            ``(provider_name, status)`` pairs in completion order.
+        """
+        async with aclosing(self._orchestrator.iter_doctor()) as results:
+            async for item in results:
+                yield item
+
     @property
     def providers(self) -> list[str]:
         """Get the list of configured providers."""
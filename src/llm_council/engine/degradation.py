@@ -11,6 +11,8 @@ actions for different failure types.
 from __future__ import annotations
 
 import logging
+import operator
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -25,6 +27,18 @@ from llm_council.providers.base import (
 
 logger = logging.getLogger(__name__)
 
+# Fetches every FailureEvent field in one C-level call for to_dict()
+_failure_event_fields = operator.attrgetter(
+    "provider",
+    "phase",
+    "error_type",
+    "error_message",
+    "action_taken",
+    "retry_count",
+    "fallback_provider",
+    "timestamp",
+)
+
 
 class DegradationAction(str, Enum):
     """Actions to take when a provider fails."""
@@ -51,15 +65,25 @@ class FailureEvent:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
+        (
+            provider,
+            phase,
+            error_type,
+            error_message,
+            action_taken,
+            retry_count,
+            fallback_provider,
+            timestamp,
+        ) = _failure_event_fields(self)
         return {
-            "provider": self.provider,
-            "phase": self.phase,
-            "error_type": self.error_type.value,
-            "error_message": self.error_message[:200],
-            "action_taken": self.action_taken.value,
-            "retry_count": self.retry_count,
-            "fallback_provider": self.fallback_provider,
-            "timestamp": self.timestamp,
+            "provider": provider,
+            "phase": phase,
+            "error_type": error_type.value,
+            "error_message": error_message[:200],
+            "action_taken": action_taken.value,
+            "retry_count": retry_count,
+            "fallback_provider": fallback_provider,
+            "timestamp": timestamp,
         }
 
 
@@ -157,8 +181,13 @@ class DegradationPolicy:
         self._fallbacks = fallback_providers or {}
         self._min_providers = min_providers_required
         self._abort_on_all_failures = abort_on_all_failures
-        self._retry_counts: dict[str, int] = {}
+        self._retry_counts: Counter[str] = Counter()
         self._report = DegradationReport()
+        # Exponential backoff ladder, capped at MAX_RETRY_DELAY_MS
+        self._retry_delays: tuple[int, ...] = tuple(
+            min(self.BASE_RETRY_DELAY_MS << attempt, self.MAX_RETRY_DELAY_MS)
+            for attempt in range(max(max_retries, 0) + 1)
+        )
 
     def reset(self) -> None:
         """Reset state for a new run."""
@@ -192,7 +221,7 @@ class DegradationPolicy:
 
         # Track retry count
         retry_key = f"{provider}:{phase}"
-        current_retries = self._retry_counts.get(retry_key, 0)
+        current_retries = self._retry_counts[retry_key]
 
         # Determine action based on error type and context
         decision = self._determine_action(
@@ -218,7 +247,7 @@ class DegradationPolicy:
 
         # Update retry count if retrying
         if decision.action == DegradationAction.RETRY:
-            self._retry_counts[retry_key] = current_retries + 1
+            self._retry_counts[retry_key] += 1
 
         if decision.should_log:
             logger.warning(
@@ -280,15 +309,10 @@ class DegradationPolicy:
         # Retryable errors - check retry limit
         if error_type in (ErrorType.RATE_LIMIT, ErrorType.TIMEOUT, ErrorType.NETWORK):
             if current_retries < self._max_retries:
-                # Calculate exponential backoff delay
-                delay = min(
-                    self.BASE_RETRY_DELAY_MS * (2**current_retries),
-                    self.MAX_RETRY_DELAY_MS,
-                )
                 return DegradationDecision(
                     action=DegradationAction.RETRY,
                     reason=f"Retryable error ({error_type.value}), attempt {current_retries + 1}",
-                    retry_delay_ms=delay,
+                    retry_delay_ms=self._retry_delays[current_retries],
                 )
 
         # Model unavailable - try fallback or skip
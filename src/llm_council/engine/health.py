@@ -20,6 +20,11 @@ from llm_council.providers.base import DoctorResult, ErrorType, ProviderAdapter,
 logger = logging.getLogger(__name__)
 
 
+def _enum_value(member: Enum | None) -> Any:
+    """Return an enum member's value, passing None through."""
+    return None if member is None else member.value
+
+
 class HealthStatus(str, Enum):
     """Provider health status."""
 
@@ -79,7 +84,7 @@ class HealthReport:
                     "status": p.status.value,
                     "message": p.message,
                     "latency_ms": p.latency_ms,
-                    "error_type": p.error_type.value if p.error_type else None,
+                    "error_type": _enum_value(p.error_type),
                 }
                 for p in self.providers
             ],
@@ -130,46 +135,33 @@ class HealthChecker:
             if cache_age < self._cache_ttl:
                 return cached
 
-        start = time.monotonic()
+        start = time.perf_counter()
+        error_type: ErrorType | None = None
+        reported_latency_ms: float | None = None
+        details: dict[str, Any] = {}
         try:
             result: DoctorResult = await asyncio.wait_for(
                 adapter.doctor(),
                 timeout=self._timeout,
             )
-            latency_ms = (time.monotonic() - start) * 1000
+            reported_latency_ms = result.latency_ms
+            details = dict(result.details) if result.details else {}
 
             if result.ok:
-                health = ProviderHealth(
-                    provider=name,
-                    status=HealthStatus.OK,
-                    message=result.message or "Healthy",
-                    latency_ms=result.latency_ms or latency_ms,
-                    details=dict(result.details) if result.details else {},
-                )
+                status = HealthStatus.OK
+                message = result.message or "Healthy"
             else:
                 # Provider returned not-ok
+                status = HealthStatus.DOWN
+                message = result.message or "Health check failed"
                 error_type = classify_error(result.message or "", -1)
-                health = ProviderHealth(
-                    provider=name,
-                    status=HealthStatus.DOWN,
-                    message=result.message or "Health check failed",
-                    latency_ms=result.latency_ms or latency_ms,
-                    error_type=error_type,
-                    details=dict(result.details) if result.details else {},
-                )
 
         except asyncio.TimeoutError:
-            latency_ms = (time.monotonic() - start) * 1000
-            health = ProviderHealth(
-                provider=name,
-                status=HealthStatus.DEGRADED,
-                message=f"Health check timed out after {self._timeout}s",
-                latency_ms=latency_ms,
-                error_type=ErrorType.TIMEOUT,
-            )
+            status = HealthStatus.DEGRADED
+            message = f"Health check timed out after {self._timeout}s"
+            error_type = ErrorType.TIMEOUT
 
         except Exception as exc:
-            latency_ms = (time.monotonic() - start) * 1000
             error_text = str(exc)
             error_type = classify_error(error_text, -1)
 
@@ -179,15 +171,19 @@ class HealthChecker:
             else:
                 status = HealthStatus.DEGRADED  # Potentially retryable
 
-            health = ProviderHealth(
-                provider=name,
-                status=status,
-                message=f"Health check error: {error_text[:100]}",
-                latency_ms=latency_ms,
-                error_type=error_type,
-            )
+            message = f"Health check error: {error_text[:100]}"
             logger.debug("Provider %s health check failed: %s", name, exc)
 
+        latency_ms = (time.perf_counter() - start) * 1000
+        health = ProviderHealth(
+            provider=name,
+            status=status,
+            message=message,
+            latency_ms=reported_latency_ms or latency_ms,
+            error_type=error_type,
+            details=details,
+        )
+
         # Cache result
         self._cache[name] = health
         return health
@@ -16,28 +16,38 @@ shape enforcement to JSON Schema + Pydantic models.
 from __future__ import annotations
 
 import asyncio
+import copy
+import io
+import itertools
 import json
 import logging
 import math
 import re
 import time
+from collections import Counter
 from collections.abc import (
+    AsyncGenerator,
     AsyncIterator,
-    Awaitable,
     Callable,
     Iterable,
     Iterator,
     Mapping,
     Sequence,
 )
-from contextlib import contextmanager
+from contextlib import aclosing, contextmanager
+from dataclasses import dataclass, field
 from typing import (
     Any,
-    TypeVar,
+    Literal,
 )
 
 from jsonschema import Draft7Validator
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
 
 from llm_council.config.models import get_council_models, is_multi_model_enabled
 from llm_council.engine.capabilities import CapabilityPlan, select_capability_plan
@@ -80,8 +90,6 @@ from llm_council.subagents import (
 
 logger = logging.getLogger(__name__)
 
-T = TypeVar("T")
-
 _CHUNKING_CONTEXT_CHAR_THRESHOLD = 60_000
 _CHUNKING_TARGET_CHARS = 60_000
 _CHUNKED_DRAFT_MAX_TOKENS = 900
@@ -316,6 +324,45 @@ _PROVIDER_BUDGET_REGISTRY: dict[str, dict[str, Any]] = {
     },
 }
 
+_JSON_DECODER = json.JSONDecoder()
+# Matches a complete JSON string literal or a single structural brace
+_JSON_STRUCTURE_RE = re.compile(r'"(?:\\.|[^"\\])*"|[{}]')
+# Captures the body of a response wrapped in a single ```/```json code fence
+_CODE_FENCE_RE = re.compile(r"\s*```(?:json)?\s*(.*?)\s*```\s*\Z", re.DOTALL)
+# Serializes a whole doctor() result mapping in one call
+_DOCTOR_RESULTS_ADAPTER: TypeAdapter[dict[str, DoctorResult]] = TypeAdapter(dict[str, DoctorResult])
+
+# Upper bound on schema violations fed back into a synthesis retry prompt
+_MAX_SCHEMA_ERRORS = 20
+
+
+@contextmanager
+def _phase_timer(phase: str, phase_timings: list[PhaseTiming]) -> Iterator[None]:
+    """Record how long a run phase took, including phases that raise."""
+
+    start_ns = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        phase_timings.append(PhaseTiming(phase=phase, duration_ms=_elapsed_ms(start_ns)))
+
+
+def _elapsed_ms(start_ns: int) -> int:
+    """Whole milliseconds elapsed since a ``time.perf_counter_ns()`` reading."""
+
+    return (time.perf_counter_ns() - start_ns) // 1_000_000
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON text, using orjson when it is installed.
+
+    ``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``, so callers
+    handle both parsers with the same ``except`` clause.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 class OrchestratorConfig(BaseModel):
     """Configuration for the council orchestrator."""
@@ -323,7 +370,22 @@ class OrchestratorConfig(BaseModel):
     model_config = ConfigDict(extra="allow")
 
     timeout: int = Field(default=120, ge=10, le=600, description="Timeout per provider call.")
+    doctor_timeout: float = Field(
+        default=10.0, gt=0, le=600, description="Timeout per provider doctor() check in seconds."
+    )
+    doctor_concurrency: int = Field(
+        default=8, ge=1, le=64, description="Max provider doctor() checks in flight at once."
+    )
     max_retries: int = Field(default=3, ge=1, le=10, description="Max synthesis retries.")
+    synthesis_parallelism: int = Field(
+        default=1,
+        ge=1,
+        le=4,
+        description=(
+            "Number of synthesis-capable providers whose first attempt is raced "
+            "concurrently; the first response that validates wins."
+        ),
+    )
     summary_tier: SummaryTier = Field(
         default=SummaryTier.ACTIONS, description="Desired summarization depth."
     )
@@ -334,6 +396,14 @@ class OrchestratorConfig(BaseModel):
     critique_temperature: float = Field(default=0.2, ge=0.0, le=2.0)
     synthesis_temperature: float = Field(default=0.2, ge=0.0, le=2.0)
     enable_schema_validation: bool = Field(default=True)
+    validator_backend: Literal["jsonschema", "fastjsonschema", "jsonschema-rs"] = Field(
+        default="jsonschema",
+        description=(
+            "JSON Schema backend for synthesis validation. 'fastjsonschema' compiles the "
+            "schema to Python code and 'jsonschema-rs' validates in Rust; both fall back "
+            "to jsonschema when not installed."
+        ),
+    )
     strict_providers: bool = Field(
         default=True,
         description=(
@@ -494,6 +564,32 @@ class ValidationResult(BaseModel):
     raw: str | None = None
 
 
+@dataclass
+class _ProviderSet:
+    """Adapters built for one resolved provider set, with their capability probes."""
+
+    providers: dict[str, ProviderAdapter]
+    init_errors: dict[str, str]
+    # Adapters keep SDK clients bound to the loop they first ran on; None until a
+    # run claims the set, so adapters built in __init__ serve the first run.
+    loop: asyncio.AbstractEventLoop | None = None
+    capability_cache: dict[tuple[str, str], bool] = field(default_factory=dict)
+    synthesis_order_cache: dict[tuple[str, ...], list[str]] = field(default_factory=dict)
+
+
+@dataclass
+class _SharedCaches:
+    """Caches shared by an orchestrator and the per-run copies made by ``run()``."""
+
+    # Keyed by (registry version, provider names, models); only error-free sets
+    provider_sets: dict[tuple[Any, ...], _ProviderSet] = field(default_factory=dict)
+    # Keyed by the schema's JSON text, since each run loads a fresh schema dict
+    validators: dict[str, Any] = field(default_factory=dict)
+    compiled_validators: dict[str, Callable[[Any], Any]] = field(default_factory=dict)
+    # Schemas already accepted by Draft7Validator.check_schema
+    checked_schemas: set[str] = field(default_factory=set)
+
+
 class Orchestrator:
     """Coordinates multi-LLM council runs using provider adapters."""
 
@@ -504,14 +600,24 @@ class Orchestrator:
         self._registry = get_registry()
         self._providers: dict[str, ProviderAdapter] = {}
         self._provider_init_errors: dict[str, str] = {}
+        self._shared = _SharedCaches()
+        self._provider_set = _ProviderSet({}, {})
+        self._capability_cache = self._provider_set.capability_cache
+        self._synthesis_order_cache = self._provider_set.synthesis_order_cache
         self._initialize_providers()
-        self._cost_calls: dict[str, int] = {}
-        self._input_tokens: dict[str, int] = {}
-        self._output_tokens: dict[str, int] = {}
+        self._cost_calls: Counter[str] = Counter()
+        self._input_tokens: Counter[str] = Counter()
+        self._output_tokens: Counter[str] = Counter()
         self._task: str | None = None
         self._subagent_name: str | None = None
         self._subagent_config: dict[str, Any] | None = None
         self._schema: dict[str, Any] | None = None
+        self._validator: Any | None = None
+        self._validator_schema: dict[str, Any] | None = None
+        self._compiled_validator: Callable[[Any], Any] | None = None
+        self._compiled_validator_schema: dict[str, Any] | None = None
+        self._schema_json_source: dict[str, Any] | None = None
+        self._schema_json_text: str = "{}"
         self._schema_name: str | None = None
         self._schema_source: str | None = None
         self._resolved_mode: str | None = None
@@ -527,6 +633,7 @@ class Orchestrator:
         self._degradation_policy: DegradationPolicy | None = None
         self._health_report: HealthReport | None = None
         self._run_id: str | None = None
+        self._artifact_tasks: set[asyncio.Task[None]] = set()
         self._phase_context_override: str | None = None
         self._prepared_reference_context: str | None = None
         self._prepared_context_prefix: str = ""
@@ -538,19 +645,48 @@ class Orchestrator:
         if self._config.enable_artifacts:
             self._artifact_store = get_store(enabled=True)
 
-        if self._config.enable_graceful_degradation:
-            self._degradation_policy = DegradationPolicy(
-                max_retries=self._provider_retry_budget(),
-                min_providers_required=1,
-                abort_on_all_failures=True,
-            )
+        self._degradation_policy = self._build_degradation_policy()
+
+    def _build_degradation_policy(self) -> DegradationPolicy | None:
+        """Create the degradation policy for a run, if graceful degradation is enabled."""
+
+        if not self._config.enable_graceful_degradation:
+            return None
+        return DegradationPolicy(
+            max_retries=self._provider_retry_budget(),
+            min_providers_required=1,
+            abort_on_all_failures=True,
+        )
 
     async def run(self, task: str, subagent: str) -> CouncilResult:
-        """Run a full council workflow for the given task and subagent."""
+        """Run a full council workflow for the given task and subagent.
 
-        self._cost_calls = {}
-        self._input_tokens = {}
-        self._output_tokens = {}
+        Each call executes on a per-run copy of the orchestrator, so concurrent
+        runs on one instance never share task, schema, usage, or artifact state.
+        """
+
+        return await self._fork_for_run()._execute_run(task, subagent)
+
+    def _fork_for_run(self) -> Orchestrator:
+        """Return a shallow copy that owns fresh containers for per-run state.
+
+        Per-run attributes are rebound (not mutated) during a run, so a shallow
+        copy isolates them; only containers mutated in place need replacing here.
+        Provider sets and compiled validators live in ``_shared``, which the copy
+        keeps, so what one run builds is reused by the next.
+        """
+
+        runner = copy.copy(self)
+        runner._artifact_tasks = set()
+        runner._degradation_policy = self._build_degradation_policy()
+        return runner
+
+    async def _execute_run(self, task: str, subagent: str) -> CouncilResult:
+        """Run the council phases on this (per-run) orchestrator instance."""
+
+        self._cost_calls = Counter()
+        self._input_tokens = Counter()
+        self._output_tokens = Counter()
         self._task = task
         self._subagent_name = subagent
         self._health_report = None
@@ -565,33 +701,22 @@ class Orchestrator:
         self._draft_handoffs = {}
         self._last_draft_budget_decisions = {}
         phase_timings: list[PhaseTiming] = []
-        start_time = time.monotonic()
+        start_time = time.perf_counter_ns()
 
         try:
             self._prepare_run(subagent)
         except Exception as exc:
-            duration_ms = int((time.monotonic() - start_time) * 1000)
-            return CouncilResult(
-                success=False,
-                error=f"Failed to load subagent/schema: {exc}",
-                duration_ms=duration_ms,
-                phase_timings=phase_timings or None,
-                provider_errors=dict(self._provider_init_errors) or None,
-                cost_estimate=self._build_cost_estimate(),
-                execution_plan=self._execution_plan,
+            return self._failure_result(
+                f"Failed to load subagent/schema: {exc}", start_time, phase_timings
             )
 
         provider_errors = self._validate_providers_for_run()
         if provider_errors:
-            duration_ms = int((time.monotonic() - start_time) * 1000)
-            return CouncilResult(
-                success=False,
-                error="Provider resolution failed.",
-                duration_ms=duration_ms,
-                phase_timings=phase_timings or None,
+            return self._failure_result(
+                "Provider resolution failed.",
+                start_time,
+                phase_timings,
                 provider_errors=provider_errors,
-                cost_estimate=self._build_cost_estimate(),
-                execution_plan=self._execution_plan,
             )
 
         # Initialize degradation policy for this run
@@ -614,15 +739,8 @@ class Orchestrator:
                 logger.warning("Provider health resolution failed: %s", exc)
 
         if not self._providers:
-            duration_ms = int((time.monotonic() - start_time) * 1000)
-            return CouncilResult(
-                success=False,
-                error="No usable providers configured.",
-                duration_ms=duration_ms,
-                phase_timings=phase_timings or None,
-                provider_errors=dict(self._provider_init_errors) or None,
-                cost_estimate=self._build_cost_estimate(),
-                execution_plan=self._execution_plan,
+            return self._failure_result(
+                "No usable providers configured.", start_time, phase_timings
             )
 
         drafts: dict[str, str] = {}
@@ -632,69 +750,28 @@ class Orchestrator:
 
         try:
             if self._capability_plan and self._capability_plan.required_capabilities:
-                evidence_bundle, evidence_timing = await self._timed(
-                    self._collect_evidence_for_run, "evidence"
-                )
+                with _phase_timer("evidence", phase_timings):
+                    evidence_bundle = await self._collect_evidence_for_run()
                 self._evidence_bundle = evidence_bundle
-                phase_timings.append(evidence_timing)
-
-                if self._artifact_store and self._run_id and evidence_bundle.items:
-                    try:
-                        self._artifact_store.store_artifact(
-                            run_id=self._run_id,
-                            content=evidence_bundle.to_prompt_block(),
-                            artifact_type=ArtifactType.TOOL_LOG,
-                        )
-                    except Exception as exc:
-                        logger.debug("Failed to store evidence artifact: %s", exc)
-
-            drafts, draft_timing = await self._timed(self._run_parallel_drafts, "drafts")
-            phase_timings.append(draft_timing)
-
-            # Store drafts as artifacts if enabled
-            if self._artifact_store and self._run_id:
-                for _provider_name, draft_text in drafts.items():
-                    if draft_text:
-                        try:
-                            self._artifact_store.store_artifact(
-                                run_id=self._run_id,
-                                content=draft_text,
-                                artifact_type=ArtifactType.DRAFT,
-                            )
-                        except Exception as exc:
-                            logger.debug("Failed to store draft artifact: %s", exc)
+
+                if evidence_bundle.items:
+                    self._schedule_artifact(
+                        evidence_bundle.to_prompt_block(), ArtifactType.TOOL_LOG, "evidence"
+                    )
+
+            with _phase_timer("drafts", phase_timings):
+                drafts = await self._run_parallel_drafts()
         except Exception as exc:
-            duration_ms = int((time.monotonic() - start_time) * 1000)
+            await self._drain_artifact_tasks()
             logger.exception("Council run failed.")
-            return CouncilResult(
-                success=False,
-                error=str(exc),
-                drafts=None,
-                critique=None,
-                synthesis_attempts=0,
-                duration_ms=duration_ms,
-                phase_timings=phase_timings or None,
-                provider_errors=dict(self._provider_init_errors) or None,
-                cost_estimate=self._build_cost_estimate(),
-                execution_plan=self._execution_plan,
-            )
+            return self._failure_result(str(exc), start_time, phase_timings, synthesis_attempts=0)
 
         try:
-            critique, critique_timing = await self._timed(
-                lambda: self._run_critique(drafts), "critique"
-            )
-            phase_timings.append(critique_timing)
+            with _phase_timer("critique", phase_timings):
+                critique = await self._run_critique(drafts)
 
-            # Store critique as artifact if enabled
-            if self._artifact_store and self._run_id and critique:
-                try:
-                    self._artifact_store.store_artifact(
-                        run_id=self._run_id,
-                        content=critique,
-                        artifact_type=ArtifactType.CRITIQUE,
-                    )
-                except Exception as exc:
-                    logger.debug("Failed to store critique artifact: %s", exc)
+            if critique:
+                self._schedule_artifact(critique, ArtifactType.CRITIQUE, "critique")
         except Exception as exc:
             detail = self._format_exception_chain(exc)
             critique = ""
@@ -710,27 +787,17 @@ class Orchestrator:
             logger.warning("Critique phase failed; continuing without critique: %s", detail)
 
         try:
-            synth_result, synth_timing = await self._timed(
-                lambda: self._run_synthesis(drafts, critique), "synthesis"
-            )
-            synthesis_result, synth_attempts = synth_result
-            phase_timings.append(synth_timing)
+            with _phase_timer("synthesis", phase_timings):
+                synthesis_result, synth_attempts = await self._run_synthesis(drafts, critique)
         except Exception as exc:
             logger.warning("Synthesis phase failed; attempting draft fallback: %s", exc)
             synthesis_result, synth_attempts = self._fallback_synthesis_from_drafts(drafts, exc)
 
-        # Store synthesis as artifact if enabled
-        if self._artifact_store and self._run_id and synthesis_result.raw:
-            try:
-                self._artifact_store.store_artifact(
-                    run_id=self._run_id,
-                    content=synthesis_result.raw,
-                    artifact_type=ArtifactType.SYNTHESIS,
-                )
-            except Exception as exc:
-                logger.debug("Failed to store synthesis artifact: %s", exc)
+        if synthesis_result.raw:
+            self._schedule_artifact(synthesis_result.raw, ArtifactType.SYNTHESIS, "synthesis")
+        await self._drain_artifact_tasks()
 
-        duration_ms = int((time.monotonic() - start_time) * 1000)
+        duration_ms = _elapsed_ms(start_time)
 
         cost_estimate = self._build_cost_estimate()
 
@@ -769,44 +836,114 @@ class Orchestrator:
             execution_plan=self._execution_plan,
         )
 
+    def _failure_result(
+        self,
+        error: str,
+        start_time: int,
+        phase_timings: list[PhaseTiming],
+        *,
+        provider_errors: dict[str, str] | None = None,
+        synthesis_attempts: int = 1,
+    ) -> CouncilResult:
+        """Build the result for a run that stopped before synthesis.
+
+        Every field is produced internally, so pydantic validation is skipped. The
+        provider error mapping is shared rather than copied because
+        ``_initialize_providers`` hands each run a fresh dict.
+        """
+
+        return CouncilResult.model_construct(
+            success=False,
+            error=error,
+            synthesis_attempts=synthesis_attempts,
+            duration_ms=_elapsed_ms(start_time),
+            phase_timings=phase_timings or None,
+            provider_errors=provider_errors or self._provider_init_errors or None,
+            cost_estimate=self._build_cost_estimate(),
+            execution_plan=self._execution_plan,
+        )
+
     async def _run_parallel_drafts(self) -> dict[str, str]:
         """Generate draft responses from all configured providers in parallel."""
 
         if self._task is None or self._subagent_config is None:
             raise RuntimeError("Orchestrator.run must be called before drafting.")
 
-        draft_tasks = [
-            self._generate_draft(provider_name, adapter)
+        # Seed in provider order so the result keeps a stable ordering no matter
+        # which provider finishes first.
+        drafts: dict[str, str] = dict.fromkeys(self._providers, "")
+        pending: dict[asyncio.Task[tuple[str, str]], str] = {
+            asyncio.create_task(self._generate_draft(provider_name, adapter)): provider_name
             for provider_name, adapter in self._providers.items()
-        ]
+        }
+        failed = 0
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    provider_name = pending.pop(task)
+                    error = asyncio.CancelledError() if task.cancelled() else task.exception()
+                    if error is None:
+                        name, text = task.result()
+                        drafts[name] = text
+                        # Persist each draft while slower providers are still generating
+                        if text:
+                            self._schedule_artifact(text, ArtifactType.DRAFT, "draft")
+                        continue
 
-        results = await asyncio.gather(*draft_tasks, return_exceptions=True)
+                    failed += 1
+                    self._provider_init_errors[provider_name] = self._format_exception_chain(error)
 
-        drafts: dict[str, str] = {}
-        for provider_name, result in zip(self._providers.keys(), results, strict=True):
-            if isinstance(result, BaseException):
-                error_msg = self._format_exception_chain(result)
-                self._provider_init_errors[provider_name] = error_msg
+                    # Use degradation policy to decide action
+                    if self._degradation_policy:
+                        decision = self._degradation_policy.decide(
+                            provider=provider_name,
+                            error=error if isinstance(error, Exception) else Exception(str(error)),
+                            phase="drafts",
+                            remaining_providers=len(drafts) - failed,
+                        )
+                        if decision.action == DegradationAction.ABORT:
+                            raise RuntimeError(
+                                f"Aborting due to provider failure: {decision.reason}"
+                            )
+        finally:
+            # Also covers outside cancellation and timeouts, so no draft keeps
+            # making provider calls after the phase is gone.
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
-                # Use degradation policy to decide action
-                if self._degradation_policy:
-                    remaining = len(self._providers) - len(self._provider_init_errors)
-                    decision = self._degradation_policy.decide(
-                        provider=provider_name,
-                        error=result if isinstance(result, Exception) else Exception(str(result)),
-                        phase="drafts",
-                        remaining_providers=remaining,
-                    )
-                    if decision.action == DegradationAction.ABORT:
-                        raise RuntimeError(f"Aborting due to provider failure: {decision.reason}")
+        return drafts
 
-                drafts[provider_name] = ""
-                continue
-            # result is tuple[str, str] here
-            name, text = result
-            drafts[name] = text
+    def _schedule_artifact(self, content: str, artifact_type: ArtifactType, label: str) -> None:
+        """Store an artifact in the background; ``run()`` drains pending writes."""
 
-        return drafts
+        if not self._artifact_store or not self._run_id:
+            return
+        task = asyncio.create_task(self._store_artifact(content, artifact_type, label))
+        self._artifact_tasks.add(task)
+        task.add_done_callback(self._artifact_tasks.discard)
+
+    async def _drain_artifact_tasks(self) -> None:
+        """Wait for background artifact writes scheduled during the current run."""
+
+        if self._artifact_tasks:
+            await asyncio.gather(*self._artifact_tasks, return_exceptions=True)
+
+    async def _store_artifact(self, content: str, artifact_type: ArtifactType, label: str) -> None:
+        """Persist an artifact for the current run without blocking the event loop."""
+
+        if not self._artifact_store or not self._run_id:
+            return
+        try:
+            await asyncio.to_thread(
+                self._artifact_store.store_artifact,
+                run_id=self._run_id,
+                content=content,
+                artifact_type=artifact_type,
+            )
+        except Exception as exc:
+            logger.debug("Failed to store %s artifact: %s", label, exc)
 
     def _format_exception_chain(self, error: BaseException) -> str:
         """Render an exception with its direct cause chain for diagnostics."""
@@ -921,96 +1058,91 @@ class Orchestrator:
         if not candidates:
             raise RuntimeError("No healthy providers available for synthesis.")
 
-        schema = self._schema
         errors: list[str] = []
         last_raw: str | None = None
         total_attempts = 0
         last_error: Exception | None = None
-
-        for provider_index, (provider_name, adapter) in enumerate(candidates):
-            force_inline_schema = False
-            for _attempt in range(1, self._config.max_retries + 1):
+        # Drafts are fixed for the whole phase; render each draft layout once and
+        # reuse it across prompt profiles, retries, and fallback providers.
+        draft_block_cache: dict[tuple[Any, ...], str] = {}
+
+        # Optionally race the first attempt across several providers and keep the
+        # first response that validates; remaining attempts run sequentially. A raced
+        # failure is handled as the sequential loop would: a structured-output failure
+        # moves the provider to inline-schema mode, anything else drops it.
+        attempts_used: dict[str, int] = {}
+        inline_schema_providers: set[str] = set()
+        failed_providers: set[str] = set()
+        parallelism = min(self._config.synthesis_parallelism, len(candidates))
+        if parallelism > 1:
+            pending: dict[asyncio.Task[GenerateResponse], str] = {}
+            for provider_index, (provider_name, adapter) in enumerate(candidates[:parallelism]):
                 total_attempts += 1
-                system_prompt = (
-                    "You are the synthesizer. Combine drafts and critique into a single response. "
-                    "Return ONLY valid JSON that matches the provided schema."
-                )
-                supports_structured_output = (
-                    bool(schema)
-                    and await adapter.supports("structured_output")
-                    and not force_inline_schema
-                )
-                use_raw_drafts = bool(errors) and any(
-                    handoff.get("findings") for handoff in self._draft_handoffs.values()
-                )
-
-                def _build_synthesis_prompt(
-                    profile: Mapping[str, int | None],
-                    *,
-                    _errors: tuple[str, ...] = tuple(errors),
-                    _use_raw_drafts: bool = use_raw_drafts,
-                    _inline_schema: bool = not supports_structured_output,
-                ) -> str:
-                    return self._format_synthesis_prompt(
-                        task=self._task or "",
-                        drafts=drafts,
-                        critique=critique,
-                        schema=schema,
-                        errors=_errors,
-                        context_override=self._phase_context_override,
-                        use_raw_drafts=_use_raw_drafts,
-                        draft_limit=profile.get("draft_limit"),
-                        excerpt_limit=int(profile.get("excerpt_limit") or 320),
-                        max_sources=profile.get("max_sources"),
-                        max_findings=profile.get("max_findings"),
-                        critique_limit=profile.get("critique_limit"),
-                        omit_drafts=bool(profile.get("omit_drafts")),
-                        inline_schema=_inline_schema,
-                        omit_context=bool(profile.get("omit_context")),
-                    )
-
-                user_prompt, _prompt_meta = self._select_prompt_profile(
-                    provider_name=provider_name,
-                    phase="synthesis",
-                    system_prompt=system_prompt,
-                    prompt_builder=_build_synthesis_prompt,
+                attempts_used[provider_name] = 1
+                request, _use_raw_drafts = await self._build_synthesis_request(
+                    provider_name,
+                    adapter,
+                    drafts,
+                    critique,
+                    errors,
+                    force_inline_schema=False,
+                    attempt=total_attempts,
+                    draft_block_cache=draft_block_cache,
                 )
-
-                request = GenerateRequest(
-                    model=self._model_override(provider_name),
-                    messages=[
-                        Message(role="system", content=system_prompt),
-                        Message(role="user", content=user_prompt),
-                    ],
-                    timeout_seconds=self._provider_request_timeout_seconds(
-                        "synthesis", provider_name=provider_name
-                    ),
-                    max_tokens=self._phase_max_tokens(
-                        self._config.max_synthesis_tokens,
+                task = asyncio.create_task(
+                    self._call_provider(
+                        provider_name,
+                        adapter,
+                        request,
                         phase="synthesis",
-                    ),
-                    temperature=self._phase_temperature(self._config.synthesis_temperature),
-                    reasoning=self._reasoning,
+                        remaining_providers=max(len(candidates) - provider_index - 1, 0),
+                    )
                 )
+                pending[task] = provider_name
+            try:
+                while pending:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        provider_name = pending.pop(task)
+                        if task.cancelled():
+                            continue
+                        error = task.exception()
+                        if error is not None:
+                            if not isinstance(error, Exception):
+                                failed_providers.add(provider_name)
+                            elif self._synthesis_falls_back_to_inline_schema(provider_name, error):
+                                inline_schema_providers.add(provider_name)
+                            else:
+                                last_error = error
+                                failed_providers.add(provider_name)
+                            continue
+                        last_raw = task.result().text or ""
+                        result = self._validate_response(last_raw)
+                        if result.ok:
+                            self._record_phase_provider_used("synthesis", provider_name)
+                            return result, total_attempts
+                        errors = result.errors
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
 
-                if supports_structured_output:
-                    request.structured_output = StructuredOutputConfig(
-                        json_schema=schema or {},
-                        name=self._subagent_name or "council_output",
-                        strict=True,
-                    )
-                self._record_phase_prompt_metrics(
-                    "synthesis",
-                    system_prompt=system_prompt,
-                    user_prompt=user_prompt,
-                    provider_name=provider_name,
-                    max_tokens=request.max_tokens,
-                    timeout_seconds=request.timeout_seconds,
-                    structured_output=request.structured_output is not None,
+        for provider_index, (provider_name, adapter) in enumerate(candidates):
+            if provider_name in failed_providers:
+                continue
+            force_inline_schema = provider_name in inline_schema_providers
+            first_attempt = attempts_used.get(provider_name, 0) + 1
+            for _attempt in range(first_attempt, self._config.max_retries + 1):
+                total_attempts += 1
+                request, use_raw_drafts = await self._build_synthesis_request(
+                    provider_name,
+                    adapter,
+                    drafts,
+                    critique,
+                    errors,
+                    force_inline_schema=force_inline_schema,
                     attempt=total_attempts,
-                    raw_source_chars=self._prepared_context_metadata.get("raw_source_chars", 0),
-                    evidence_pack_chars=len(self._context_source(self._phase_context_override))
-                    + len(user_prompt),
+                    draft_block_cache=draft_block_cache,
                 )
 
                 try:
@@ -1022,17 +1154,11 @@ class Orchestrator:
                         remaining_providers=max(len(candidates) - provider_index - 1, 0),
                     )
                 except Exception as exc:
-                    if schema and not force_inline_schema:
-                        detail = self._format_exception_chain(exc)
-                        error_type = classify_error(detail)
-                        if error_type in {ErrorType.UNKNOWN, ErrorType.NETWORK, ErrorType.TIMEOUT}:
-                            force_inline_schema = True
-                            if self._execution_plan is not None:
-                                self._execution_plan.setdefault("warnings", []).append(
-                                    f"{provider_name} synthesis fell back to inline-schema JSON mode "
-                                    "after structured-output request failure."
-                                )
-                            continue
+                    if not force_inline_schema and self._synthesis_falls_back_to_inline_schema(
+                        provider_name, exc
+                    ):
+                        force_inline_schema = True
+                        continue
                     last_error = exc
                     break
 
@@ -1057,6 +1183,119 @@ class Orchestrator:
             raise last_error
         raise RuntimeError("Synthesis failed without a usable provider response.")
 
+    def _synthesis_falls_back_to_inline_schema(self, provider_name: str, exc: Exception) -> bool:
+        """Return True when a failed synthesis call should retry with the schema inlined.
+
+        Soft failures (unknown, network, timeout) may come from the provider rejecting
+        the structured-output request, so the next attempt embeds the schema in the
+        prompt instead. Auth, billing and similar hard errors return False.
+        """
+
+        if not self._schema:
+            return False
+        error_type = classify_error(self._format_exception_chain(exc))
+        if error_type not in {ErrorType.UNKNOWN, ErrorType.NETWORK, ErrorType.TIMEOUT}:
+            return False
+        if self._execution_plan is not None:
+            self._execution_plan.setdefault("warnings", []).append(
+                f"{provider_name} synthesis fell back to inline-schema JSON mode "
+                "after structured-output request failure."
+            )
+        return True
+
+    async def _build_synthesis_request(
+        self,
+        provider_name: str,
+        adapter: ProviderAdapter,
+        drafts: dict[str, str],
+        critique: str,
+        errors: list[str],
+        *,
+        force_inline_schema: bool,
+        attempt: int,
+        draft_block_cache: dict[tuple[Any, ...], str],
+    ) -> tuple[GenerateRequest, bool]:
+        """Build one synthesis attempt's request and whether it forces raw drafts."""
+
+        schema = self._schema
+        system_prompt = (
+            "You are the synthesizer. Combine drafts and critique into a single response. "
+            "Return ONLY valid JSON that matches the provided schema."
+        )
+        supports_structured_output = (
+            bool(schema)
+            and await self._adapter_supports(provider_name, adapter, "structured_output")
+            and not force_inline_schema
+        )
+        use_raw_drafts = bool(errors) and any(
+            handoff.get("findings") for handoff in self._draft_handoffs.values()
+        )
+
+        def _build_synthesis_prompt(profile: Mapping[str, int | None]) -> str:
+            return self._format_synthesis_prompt(
+                task=self._task or "",
+                drafts=drafts,
+                critique=critique,
+                schema=schema,
+                errors=errors,
+                context_override=self._phase_context_override,
+                use_raw_drafts=use_raw_drafts,
+                draft_limit=profile.get("draft_limit"),
+                excerpt_limit=int(profile.get("excerpt_limit") or 320),
+                max_sources=profile.get("max_sources"),
+                max_findings=profile.get("max_findings"),
+                critique_limit=profile.get("critique_limit"),
+                omit_drafts=bool(profile.get("omit_drafts")),
+                inline_schema=not supports_structured_output,
+                omit_context=bool(profile.get("omit_context")),
+                draft_block_cache=draft_block_cache,
+            )
+
+        user_prompt, _prompt_meta = self._select_prompt_profile(
+            provider_name=provider_name,
+            phase="synthesis",
+            system_prompt=system_prompt,
+            prompt_builder=_build_synthesis_prompt,
+        )
+
+        request = GenerateRequest(
+            model=self._model_override(provider_name),
+            messages=[
+                Message(role="system", content=system_prompt),
+                Message(role="user", content=user_prompt),
+            ],
+            timeout_seconds=self._provider_request_timeout_seconds(
+                "synthesis", provider_name=provider_name
+            ),
+            max_tokens=self._phase_max_tokens(
+                self._config.max_synthesis_tokens,
+                phase="synthesis",
+            ),
+            temperature=self._phase_temperature(self._config.synthesis_temperature),
+            reasoning=self._reasoning,
+        )
+
+        if supports_structured_output:
+            request.structured_output = StructuredOutputConfig(
+                json_schema=schema or {},
+                name=self._subagent_name or "council_output",
+                strict=True,
+            )
+        self._record_phase_prompt_metrics(
+            "synthesis",
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            provider_name=provider_name,
+            max_tokens=request.max_tokens,
+            timeout_seconds=request.timeout_seconds,
+            structured_output=request.structured_output is not None,
+            attempt=attempt,
+            raw_source_chars=self._prepared_context_metadata.get("raw_source_chars", 0),
+            evidence_pack_chars=len(self._context_source(self._phase_context_override))
+            + len(user_prompt),
+        )
+        return request, use_raw_drafts
+
     async def _generate_draft(
         self, provider_name: str, adapter: ProviderAdapter
     ) -> tuple[str, str]:
@@ -1195,14 +1434,14 @@ class Orchestrator:
         """Execute a provider request with timeout and usage tracking."""
 
         async def _consume_stream(stream: AsyncIterator[GenerateResponse]) -> GenerateResponse:
-            text_parts: list[str] = []
+            buffer = io.StringIO()
             usage: dict[str, int] | None = None
             async for chunk in stream:
                 if chunk.text:
-                    text_parts.append(chunk.text)
+                    buffer.write(chunk.text)
                 if chunk.usage:
                     usage = dict(chunk.usage)
-            return GenerateResponse(text="".join(text_parts), usage=usage)
+            return GenerateResponse(text=buffer.getvalue(), usage=usage)
 
         prompt_cache_requested = bool(request.prompt_cache and request.prompt_cache.enabled)
         compiled = compile_request_for_provider(provider_name, request)
@@ -1327,6 +1566,14 @@ class Orchestrator:
             self._schema_name = get_effective_schema(self._subagent_config, self._resolved_mode)
             self._schema_source = "subagent"
             self._schema = load_schema(self._schema_name) if self._schema_name else None
+        if self._schema:
+            # Checking the schema costs milliseconds, so each distinct schema is
+            # checked once per process rather than on every run.
+            schema_key = self._schema_json(self._schema)
+            if schema_key not in self._shared.checked_schemas:
+                Draft7Validator.check_schema(self._schema)
+                self._shared.checked_schemas.add(schema_key)
+        self._validator = None
 
         reasoning_budget = get_reasoning_budget(self._subagent_config, self._resolved_mode)
         self._reasoning = self._build_reasoning_config(reasoning_budget)
@@ -2474,13 +2721,13 @@ class Orchestrator:
     def _record_usage(self, provider: str, usage: Mapping[str, int] | None) -> None:
         """Accumulate token usage and call counts for cost estimation."""
 
-        self._cost_calls[provider] = self._cost_calls.get(provider, 0) + 1
+        self._cost_calls[provider] += 1
         if not usage:
             return
         prompt_tokens = usage.get("prompt_tokens") or usage.get("input_tokens") or 0
         completion_tokens = usage.get("completion_tokens") or usage.get("output_tokens") or 0
-        self._input_tokens[provider] = self._input_tokens.get(provider, 0) + prompt_tokens
-        self._output_tokens[provider] = self._output_tokens.get(provider, 0) + completion_tokens
+        self._input_tokens[provider] += prompt_tokens
+        self._output_tokens[provider] += completion_tokens
         self._record_cache_usage(provider, usage)
 
     def _record_cache_usage(self, provider: str, usage: Mapping[str, int]) -> None:
@@ -2632,13 +2879,15 @@ class Orchestrator:
         total_tokens = total_input + total_output
         estimated_cost = 0.0
 
-        for provider in self._provider_names:
-            in_tokens = self._input_tokens.get(provider, 0)
-            out_tokens = self._output_tokens.get(provider, 0)
-            in_rate = self._config.cost_per_1k_input.get(provider, 0.0)
-            out_rate = self._config.cost_per_1k_output.get(provider, 0.0)
-            estimated_cost += (in_tokens / 1000.0) * in_rate
-            estimated_cost += (out_tokens / 1000.0) * out_rate
+        # Rates are opt-in and usually empty; only providers with a rate can add cost.
+        in_rates = self._config.cost_per_1k_input
+        out_rates = self._config.cost_per_1k_output
+        if in_rates or out_rates:
+            for provider in {**in_rates, **out_rates}:
+                in_tokens = self._input_tokens[provider]
+                out_tokens = self._output_tokens[provider]
+                estimated_cost += (in_tokens / 1000.0) * in_rates.get(provider, 0.0)
+                estimated_cost += (out_tokens / 1000.0) * out_rates.get(provider, 0.0)
 
         return CostEstimate(
             provider_calls=dict(self._cost_calls),
@@ -2659,13 +2908,98 @@ class Orchestrator:
             return ValidationResult(ok=False, errors=["Failed to parse JSON."])
 
         if self._config.enable_schema_validation and self._schema:
-            validator = Draft7Validator(self._schema)
-            errors = [err.message for err in validator.iter_errors(parsed)]
+            errors = self._schema_errors(parsed)
             if errors:
                 return ValidationResult(ok=False, errors=errors, raw=raw_text)
 
         return ValidationResult(ok=True, data=parsed, raw=raw_text)
 
+    def _schema_errors(self, parsed: Any) -> list[str]:
+        """Return schema validation error messages for a parsed synthesis payload."""
+
+        compiled = self._compiled_schema_validator()
+        if compiled is not None:
+            try:
+                compiled(parsed)
+            except ValueError as exc:  # fastjsonschema.JsonSchemaValueException
+                return [getattr(exc, "message", str(exc))]
+            return []
+
+        validator = self._schema_validator()
+        if validator is None or validator.is_valid(parsed):
+            return []
+        # Only materialize error objects once the cheap pass/fail check fails, and
+        # stop walking the schema once the retry prompt has enough to act on.
+        return [
+            err.message
+            for err in itertools.islice(validator.iter_errors(parsed), _MAX_SCHEMA_ERRORS)
+        ]
+
+    def _compiled_schema_validator(self) -> Callable[[Any], Any] | None:
+        """Return a fastjsonschema-compiled validator when that backend is selected."""
+
+        schema = self._schema
+        if not schema or self._config.validator_backend != "fastjsonschema":
+            return None
+        if self._compiled_validator is not None and self._compiled_validator_schema is schema:
+            return self._compiled_validator
+
+        schema_key = self._schema_json(schema)
+        compiled = self._shared.compiled_validators.get(schema_key)
+        if compiled is None:
+            try:
+                import fastjsonschema
+            except ImportError:
+                logger.debug("fastjsonschema is not installed; validating with jsonschema.")
+                return None
+            try:
+                # use_default=False keeps validation read-only: by default the compiled
+                # function fills schema defaults into the payload it checks.
+                compiled = fastjsonschema.compile(schema, use_default=False)
+            except fastjsonschema.JsonSchemaDefinitionException as exc:
+                logger.debug("fastjsonschema could not compile schema; using jsonschema: %s", exc)
+                return None
+            self._shared.compiled_validators[schema_key] = compiled
+        self._compiled_validator = compiled
+        self._compiled_validator_schema = schema
+        return compiled
+
+    def _schema_validator(self) -> Any | None:
+        """Return the validator for the active schema, compiling it once per schema.
+
+        Both backends expose ``is_valid`` and ``iter_errors`` yielding errors with a
+        ``message``, so callers do not care which one is in use.
+        """
+
+        schema = self._schema
+        if not schema:
+            return None
+        if self._validator is None or self._validator_schema is not schema:
+            schema_key = self._schema_json(schema)
+            validator = self._shared.validators.get(schema_key)
+            if validator is None:
+                validator = self._rust_schema_validator(schema) or Draft7Validator(schema)
+                self._shared.validators[schema_key] = validator
+            self._validator = validator
+            self._validator_schema = schema
+        return self._validator
+
+    def _rust_schema_validator(self, schema: dict[str, Any]) -> Any | None:
+        """Return a jsonschema-rs Draft 7 validator when that backend is selected."""
+
+        if self._config.validator_backend != "jsonschema-rs":
+            return None
+        try:
+            import jsonschema_rs
+        except ImportError:
+            logger.debug("jsonschema-rs is not installed; validating with jsonschema.")
+            return None
+        try:
+            return jsonschema_rs.Draft7Validator(schema)
+        except ValueError as exc:  # jsonschema_rs.ValidationError for invalid schemas
+            logger.debug("jsonschema-rs could not compile schema; using jsonschema: %s", exc)
+            return None
+
     def _fallback_synthesis_from_drafts(
         self, drafts: Mapping[str, str], phase_error: Exception
     ) -> tuple[ValidationResult, int]:
@@ -2935,33 +3269,39 @@ class Orchestrator:
     def _extract_json(self, text: str) -> dict[str, Any] | None:
         """Extract the first JSON object from a response string.
 
-        Uses balanced brace matching to find complete JSON objects,
-        which is more robust than simple find/rfind.
+        Decodes in place from the first ``{`` with the C-level
+        ``JSONDecoder.raw_decode`` scanner, so trailing commentary is ignored
+        without slicing and re-parsing. Balanced brace matching remains as a
+        last resort.
         """
-        cleaned = text.strip()
-
         # Handle markdown code blocks
-        if cleaned.startswith("```"):
-            # Find closing triple backticks
-            end_fence = cleaned.rfind("```")
-            cleaned = cleaned[3:end_fence].strip() if end_fence > 3 else cleaned.strip("`")
-            # Remove optional language identifier
-            if cleaned.startswith("json"):
-                cleaned = cleaned[4:].strip()
+        fenced = _CODE_FENCE_RE.match(text)
+        cleaned = fenced.group(1) if fenced else text.strip()
 
         # Try direct parsing first
         try:
-            parsed = json.loads(cleaned)
+            parsed = _json_loads(cleaned)
             if isinstance(parsed, dict):
                 return parsed
         except json.JSONDecodeError:
             pass
 
-        # Use balanced brace matching to extract JSON object
+        # Decode the first embedded object, ignoring any surrounding commentary
+        start = cleaned.find("{")
+        if start == -1:
+            return None
+        try:
+            parsed, _end = _JSON_DECODER.raw_decode(cleaned, start)
+            if isinstance(parsed, dict):
+                return parsed
+        except json.JSONDecodeError:
+            pass
+
+        # Fall back to balanced brace matching
         extracted = self._extract_balanced_json(cleaned)
         if extracted:
             try:
-                parsed = json.loads(extracted)
+                parsed = _json_loads(extracted)
                 if isinstance(parsed, dict):
                     return parsed
             except json.JSONDecodeError:
@@ -2974,37 +3314,22 @@ class Orchestrator:
 
         This handles cases where LLMs include commentary after the JSON
         or when there are multiple JSON-like structures in the response.
+        String literals are skipped whole by ``_JSON_STRUCTURE_RE`` so only
+        structural braces reach the Python loop.
         """
         start = text.find("{")
         if start == -1:
             return None
 
         depth = 0
-        in_string = False
-        escape_next = False
-
-        for i, char in enumerate(text[start:], start=start):
-            if escape_next:
-                escape_next = False
-                continue
-
-            if char == "\\":
-                escape_next = True
-                continue
-
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-
-            if in_string:
-                continue
-
-            if char == "{":
+        for match in _JSON_STRUCTURE_RE.finditer(text, start):
+            token = match.group()
+            if token == "{":
                 depth += 1
-            elif char == "}":
+            elif token == "}":
                 depth -= 1
                 if depth == 0:
-                    return text[start : i + 1]
+                    return text[start : match.end()]
 
         return None
 
@@ -3269,7 +3594,7 @@ class Orchestrator:
             draft_blocks = "No successful draft responses available."
         schema_hint = ""
         if self._schema and self._config.runtime_profile != RuntimeProfile.BOUNDED:
-            schema_hint = "\nSchema (JSON):\n" + json.dumps(self._schema, indent=2)
+            schema_hint = "\nSchema (JSON):\n" + self._schema_json(self._schema)
         elif self._schema:
             schema_hint = (
                 "\nFocus on correctness and contradictions in the "
@@ -3301,8 +3626,13 @@ class Orchestrator:
         omit_drafts: bool = False,
         inline_schema: bool = True,
         omit_context: bool = False,
+        draft_block_cache: dict[tuple[Any, ...], str] | None = None,
     ) -> str:
-        """Format synthesis prompt."""
+        """Format synthesis prompt.
+
+        ``draft_block_cache`` lets synthesis retries reuse draft blocks rendered
+        for the same ``drafts`` mapping instead of rebuilding them per attempt.
+        """
 
         context_block = "" if omit_context else self._build_context_block(context_override)
         collected_evidence = self._build_collected_evidence_block()
@@ -3313,17 +3643,23 @@ class Orchestrator:
                 "Rely on the critique plus prior draft analysis summaries."
             )
         else:
-            draft_blocks, _draft_chars = self._compose_draft_blocks(
-                drafts,
-                use_raw_drafts=use_raw_drafts,
-                draft_limit=draft_limit,
-                excerpt_limit=excerpt_limit,
-                max_sources=max_sources,
-                max_findings=max_findings,
+            cache_key = (use_raw_drafts, draft_limit, excerpt_limit, max_sources, max_findings)
+            cached_blocks = (
+                draft_block_cache.get(cache_key) if draft_block_cache is not None else None
             )
-            if not draft_blocks:
-                draft_blocks = "No successful draft responses available."
-        schema_block = json.dumps(schema, indent=2) if schema and inline_schema else "{}"
+            if cached_blocks is None:
+                cached_blocks, _draft_chars = self._compose_draft_blocks(
+                    drafts,
+                    use_raw_drafts=use_raw_drafts,
+                    draft_limit=draft_limit,
+                    excerpt_limit=excerpt_limit,
+                    max_sources=max_sources,
+                    max_findings=max_findings,
+                )
+                if draft_block_cache is not None:
+                    draft_block_cache[cache_key] = cached_blocks
+            draft_blocks = cached_blocks or "No successful draft responses available."
+        schema_block = self._schema_json(schema) if schema and inline_schema else "{}"
         error_block = "\n".join(f"- {err}" for err in errors) if errors else "None"
         critique_block = self._compact_text(critique, critique_limit)
         schema_hint = (
@@ -3341,6 +3677,14 @@ class Orchestrator:
             "\n\nReturn ONLY JSON that matches the schema."
         )
 
+    def _schema_json(self, schema: dict[str, Any]) -> str:
+        """Return a schema as indented JSON, serializing each schema object once."""
+
+        if self._schema_json_source is not schema:
+            self._schema_json_text = json.dumps(schema, indent=2)
+            self._schema_json_source = schema
+        return self._schema_json_text
+
     def _model_override(self, provider_name: str) -> str | None:
         """Return the model override for a provider if configured."""
 
@@ -3360,17 +3704,34 @@ class Orchestrator:
             return []
 
         if phase == "synthesis":
-            structured = []
-            fallback = []
-            for name, provider in healthy:
-                if await provider.supports("structured_output"):
-                    structured.append((name, provider))
-                else:
-                    fallback.append((name, provider))
-            return structured or fallback
+            key = tuple(name for name, _ in healthy)
+            ordered = self._synthesis_order_cache.get(key)
+            if ordered is None:
+                supported = await asyncio.gather(
+                    *(
+                        self._adapter_supports(name, provider, "structured_output")
+                        for name, provider in healthy
+                    )
+                )
+                structured = [name for name, ok in zip(key, supported, strict=True) if ok]
+                ordered = structured or list(key)
+                self._synthesis_order_cache[key] = ordered
+            return [(name, self._providers[name]) for name in ordered]
 
         return healthy
 
+    async def _adapter_supports(
+        self, provider_name: str, adapter: ProviderAdapter, capability: str
+    ) -> bool:
+        """Return ``adapter.supports(capability)``, awaiting it once per adapter."""
+
+        key = (provider_name, capability)
+        supported = self._capability_cache.get(key)
+        if supported is None:
+            supported = bool(await adapter.supports(capability))
+            self._capability_cache[key] = supported
+        return supported
+
     def _record_phase_provider_candidates(self, phase: str, provider_names: list[str]) -> None:
         """Record ordered candidate providers for a phase in the execution plan."""
 
@@ -3429,16 +3790,6 @@ class Orchestrator:
             "reason": reason,
         }
 
-    async def _timed(
-        self, coro_factory: Callable[[], Awaitable[T]], phase: str
-    ) -> tuple[T, PhaseTiming]:
-        """Measure duration for an async phase."""
-
-        start = time.monotonic()
-        result = await coro_factory()
-        duration_ms = int((time.monotonic() - start) * 1000)
-        return result, PhaseTiming(phase=phase, duration_ms=duration_ms)
-
     async def doctor(self) -> dict[str, Any]:
         """Check provider availability.
 
@@ -3446,22 +3797,74 @@ class Orchestrator:
             A dict mapping provider name to a serialized DoctorResult-like payload.
         """
 
-        results: dict[str, Any] = {}
+        results = {name: result async for name, result in self._iter_doctor_results()}
+        ordered = {
+            name: results[name] for name in self._configured_provider_names if name in results
+        }
+        payload: dict[str, Any] = _DOCTOR_RESULTS_ADAPTER.dump_python(ordered)
+        return payload
+
+    async def iter_doctor(self) -> AsyncGenerator[tuple[str, dict[str, Any]], None]:
+        """Yield ``(provider, payload)`` pairs as each provider check finishes.
+
+        Fast providers report immediately while slower ones keep running, each
+        bounded by ``doctor_timeout``. Checks still pending when the caller stops
+        iterating are cancelled.
+        """
+
+        # aclosing() runs the inner generator's cleanup as soon as this one is closed
+        async with aclosing(self._iter_doctor_results()) as results:
+            async for name, result in results:
+                yield name, result.model_dump()
+
+    async def _iter_doctor_results(self) -> AsyncGenerator[tuple[str, DoctorResult], None]:
+        """Run provider doctor checks, yielding each DoctorResult as it completes.
+
+        Adapters already built by ``_initialize_providers`` are checked as-is unless
+        they belong to another event loop; other names are instantiated from the
+        registry with their provider config.
+        """
+
+        # Created per call so the semaphore binds to the running event loop
+        semaphore = asyncio.Semaphore(self._config.doctor_concurrency)
+        provider_set = self._provider_set
+        built: dict[str, ProviderAdapter] = (
+            provider_set.providers
+            if provider_set.loop in (None, asyncio.get_running_loop())
+            else {}
+        )
 
         async def _check(name: str) -> tuple[str, DoctorResult]:
-            try:
-                adapter = self._registry.get_provider(name)
-            except Exception as exc:
-                return name, DoctorResult(ok=False, message=str(exc))
-            try:
-                return name, await adapter.doctor()
-            except Exception as exc:
-                return name, DoctorResult(ok=False, message=str(exc))
+            async with semaphore:
+                try:
+                    adapter = built.get(name)
+                    if adapter is None:
+                        kwargs = self._config.provider_configs.get(name, {})
+                        adapter = self._registry.get_provider(name, **kwargs)
+                except Exception as exc:
+                    return name, DoctorResult(ok=False, message=str(exc))
+                timeout = self._config.doctor_timeout
+                try:
+                    return name, await asyncio.wait_for(adapter.doctor(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    return name, DoctorResult(
+                        ok=False,
+                        message=f"Doctor check timed out after {timeout:g}s",
+                        details={"error": "timeout"},
+                    )
+                except Exception as exc:
+                    return name, DoctorResult(ok=False, message=str(exc))
 
-        pairs = await asyncio.gather(*[_check(name) for name in self._configured_provider_names])
-        for name, result in pairs:
-            results[name] = result.model_dump()
-        return results
+        tasks = [asyncio.create_task(_check(name)) for name in self._configured_provider_names]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
     def _initialize_providers(self) -> None:
         """Instantiate provider adapters from the registry.
@@ -3470,29 +3873,61 @@ class Orchestrator:
         and only 'openrouter' is in the provider list, this method creates virtual
         providers for each model to enable parallel drafts from different LLMs.
         """
-        self._providers = {}
-        self._provider_init_errors = {}
-
         # Check for multi-model configuration
         models = self._config.models
         if models is None and is_multi_model_enabled():
             models = get_council_models()
 
-        # If we have multiple models and only openrouter is configured,
-        # create virtual providers for each model
-        if models and len(models) > 1 and self._provider_names == ["openrouter"]:
-            logger.info(
-                "Multi-model council enabled with %d models: %s",
-                len(models),
-                ", ".join(models),
-            )
-            self._providers, self._provider_init_errors = self._instantiate_providers(
-                list(models), treat_as_models=True
-            )
-        else:
-            self._providers, self._provider_init_errors = self._instantiate_providers(
-                self._provider_names
-            )
+        # Adapters are reused while the provider set, registry and event loop are
+        # unchanged, so the call from _prepare_run does not rebuild adapters built in
+        # __init__, and later runs on the same loop reuse them too. Sets with init
+        # errors are never cached, so a key exported after a failed run is picked up.
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        registry_version = self._registry.version
+        cache_key = (
+            registry_version,
+            tuple(self._provider_names),
+            tuple(models) if models else None,
+        )
+        provider_sets = self._shared.provider_sets
+        provider_set = provider_sets.get(cache_key)
+        if provider_set is not None and loop is not None:
+            if provider_set.loop is None:
+                provider_set.loop = loop
+            elif provider_set.loop is not loop:
+                provider_set = None
+        if provider_set is None:
+            # If we have multiple models and only openrouter is configured,
+            # create virtual providers for each model
+            if models and len(models) > 1 and self._provider_names == ["openrouter"]:
+                logger.info(
+                    "Multi-model council enabled with %d models: %s",
+                    len(models),
+                    ", ".join(models),
+                )
+                provider_set = _ProviderSet(
+                    *self._instantiate_providers(list(models), treat_as_models=True)
+                )
+            else:
+                provider_set = _ProviderSet(*self._instantiate_providers(self._provider_names))
+            provider_set.loop = loop
+            # Sets built against an older registry can no longer be selected
+            for stale in [key for key in provider_sets if key[0] != registry_version]:
+                del provider_sets[stale]
+            if provider_set.init_errors:
+                provider_sets.pop(cache_key, None)
+            else:
+                provider_sets[cache_key] = provider_set
+        self._provider_set = provider_set
+        self._capability_cache = provider_set.capability_cache
+        self._synthesis_order_cache = provider_set.synthesis_order_cache
+
+        # Runs prune and annotate these mappings, so hand out copies of the cache.
+        self._providers = dict(provider_set.providers)
+        self._provider_init_errors = dict(provider_set.init_errors)
 
         if self._provider_init_errors:
             logger.debug("Provider initialization errors: %s", self._provider_init_errors)
@@ -6,13 +6,20 @@ Direct integration with the Anthropic API for Claude models.
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import functools
 import logging
 import os
+import re
+import threading
 import time
 from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from typing import Any, ClassVar, cast
 
+import httpx
+
 from llm_council.providers.base import (
     DoctorResult,
     GenerateRequest,
@@ -20,6 +27,7 @@ from llm_council.providers.base import (
     ProviderAdapter,
     ProviderCapabilities,
 )
+from llm_council.providers.cache import ResponseCache, canonical_json
 
 DEFAULT_MODEL = "claude-opus-4-6"
 ENV_MODEL = "ANTHROPIC_MODEL"
@@ -54,6 +62,32 @@ STRUCTURED_OUTPUT_MODELS = frozenset(
     }
 )
 
+# AsyncAnthropic clients shared across provider instances, keyed by API key, so
+# per-model virtual providers reuse one connection pool. Each entry records the
+# event loop it was built on because httpx pools cannot cross event loops.
+_CLIENTS: dict[str, tuple[asyncio.AbstractEventLoop | None, Any]] = {}
+_CLIENTS_LOCK = threading.Lock()
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30)
+# Matches the SDK's own default timeout, which a custom http_client would otherwise drop
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+# Semaphores capping concurrent Messages API calls per API key and limit, bound to
+# the event loop they were created on like the shared clients above.
+_LIMITERS: dict[tuple[str, int], tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+DEFAULT_MAX_CONCURRENT = 16
+
+# Successful health checks per API key, reused by provider instances sharing the key
+_DOCTOR_RESULTS: dict[str, tuple[float, DoctorResult]] = {}
+_DOCTOR_CACHE_TTL_SECONDS = 30.0
+# Fallback probe for SDK versions that predate the models resource
+_DOCTOR_FALLBACK_MODEL = "claude-3-haiku-20240307"
+
+# Anthropic caches prefixes of at least 1024 tokens; ~4 characters per token
+_MIN_CACHEABLE_SYSTEM_CHARS = 4096
+
+# Release-date suffix on pinned model ids, e.g. "-20251201"
+_MODEL_DATE_SUFFIX_RE = re.compile(r"-202[456]")
+
 _SCHEMA_META_FIELDS = frozenset({"$schema", "$id", "$ref", "$comment"})
 _ANTHROPIC_UNSUPPORTED_SCHEMA_FIELDS = frozenset(
     {
@@ -78,6 +112,70 @@ _ANTHROPIC_UNSUPPORTED_SCHEMA_FIELDS = frozenset(
 )
 
 
+@functools.lru_cache(maxsize=512)
+def _model_supports_structured_output(model: str) -> bool:
+    """Memoized model check behind AnthropicProvider._model_supports_structured_output."""
+    # Direct match against known models
+    if model in STRUCTURED_OUTPUT_MODELS:
+        return True
+
+    # Strip date suffix for comparison
+    # e.g., "claude-sonnet-4-5-20251201" -> "claude-sonnet-4-5"
+    match = _MODEL_DATE_SUFFIX_RE.search(model)
+    base_model = model[: match.start()] if match else model
+
+    # Check if base model is in the known set
+    if base_model in STRUCTURED_OUTPUT_MODELS:
+        return True
+
+    # Check if model starts with any supported prefix (Claude 4.x family)
+    return model.startswith(STRUCTURED_OUTPUT_MODEL_PREFIXES)
+
+
+@dataclass
+class _InflightCall:
+    """A Messages API call shared by every identical request awaiting it."""
+
+    task: asyncio.Future[Any]
+    waiters: int = 0
+
+
+def _shared_client(client_class: Any, api_key: str) -> Any:
+    """Return the process-wide client for ``api_key`` on the running event loop."""
+    try:
+        loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    with _CLIENTS_LOCK:
+        entry = _CLIENTS.get(api_key)
+        if entry is not None and entry[0] is loop:
+            return entry[1]
+        # A client from another loop is dropped rather than closed: its pool can only
+        # be closed on its own loop, and requests still running there hold their own
+        # reference to it.
+        client = client_class(
+            api_key=api_key,
+            # Retries are handled by the council's degradation policy
+            max_retries=0,
+            http_client=httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT),
+        )
+        _CLIENTS[api_key] = (loop, client)
+        return client
+
+
+def _shared_limiter(api_key: str, max_concurrent: int) -> asyncio.Semaphore:
+    """Return the semaphore gating calls for ``api_key`` on the running event loop."""
+    loop = asyncio.get_running_loop()
+    key = (api_key, max_concurrent)
+    with _CLIENTS_LOCK:
+        entry = _LIMITERS.get(key)
+        if entry is not None and entry[0] is loop:
+            return entry[1]
+        limiter = asyncio.Semaphore(max_concurrent)
+        _LIMITERS[key] = (loop, limiter)
+        return limiter
+
+
 def _prepare_schema_for_anthropic(schema: dict[str, Any]) -> dict[str, Any]:
     """Normalize JSON schema for Anthropic structured outputs.
 
@@ -159,36 +257,52 @@ class AnthropicProvider(ProviderAdapter):
         self,
         api_key: str | None = None,
         default_model: str | None = None,
+        cache_system: bool = True,
+        response_cache: ResponseCache | None = None,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
     ) -> None:
         """Initialize the Anthropic provider.
 
         Args:
             api_key: Anthropic API key. Falls back to ANTHROPIC_API_KEY env var.
             default_model: Default model to use if not specified in request.
+            cache_system: Put a cache breakpoint on long system prompts when the
+                request enables prompt caching.
+            response_cache: Optional cache that answers exact repeats of
+                temperature-0, tool-free requests without calling the API.
+            max_concurrent: Maximum number of non-streaming calls in flight at once
+                across every provider instance sharing this API key.
         """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
         self._api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self._default_model = default_model or os.environ.get(ENV_MODEL) or DEFAULT_MODEL
-        self._client: Any = None
+        self._cache_system = cache_system
+        self._response_cache = response_cache
+        self._max_concurrent = max_concurrent
+        self._inflight: dict[bytes, _InflightCall] = {}
 
     def _get_client(self) -> Any:
-        """Get or create the Anthropic client."""
-        if self._client is None:
-            try:
-                from anthropic import AsyncAnthropic
-            except ImportError as e:
-                raise ImportError(
-                    "The 'anthropic' package is required for the Anthropic provider. "
-                    "Install it with: pip install the-llm-council[anthropic]"
-                ) from e
-
-            if not self._api_key:
-                raise ValueError(
-                    "Anthropic API key not configured. "
-                    "Set ANTHROPIC_API_KEY environment variable or pass api_key."
-                )
+        """Return the process-wide Anthropic client for this key.
 
-            self._client = AsyncAnthropic(api_key=self._api_key)
-        return self._client
+        Clients live only in the module-level cache, which also checks the event
+        loop, so every lookup goes through it rather than an instance attribute.
+        """
+        try:
+            from anthropic import AsyncAnthropic
+        except ImportError as e:
+            raise ImportError(
+                "The 'anthropic' package is required for the Anthropic provider. "
+                "Install it with: pip install the-llm-council[anthropic]"
+            ) from e
+
+        if not self._api_key:
+            raise ValueError(
+                "Anthropic API key not configured. "
+                "Set ANTHROPIC_API_KEY environment variable or pass api_key."
+            )
+
+        return _shared_client(AsyncAnthropic, self._api_key)
 
     async def generate(
         self, request: GenerateRequest
@@ -197,34 +311,57 @@ class AnthropicProvider(ProviderAdapter):
         client = self._get_client()
 
         # Build messages
-        messages = []
+        messages: list[dict[str, Any]] = []
         system = None
-        if request.messages:
-            for m in request.messages:
-                if m.role == "system":
-                    system = m.content
-                else:
-                    messages.append({"role": m.role, "content": m.content})
+        request_messages = request.messages
+        if request_messages:
+            messages = [
+                {"role": m.role, "content": m.content}
+                for m in request_messages
+                if m.role != "system"
+            ]
+            # The last system message wins, as Anthropic takes a single system prompt
+            system = next(
+                (m.content for m in reversed(request_messages) if m.role == "system"), None
+            )
         elif request.prompt:
             messages = [{"role": "user", "content": request.prompt}]
         else:
             raise ValueError("Either 'messages' or 'prompt' must be provided")
 
+        model = request.model or self._default_model
         kwargs: dict[str, Any] = {
-            "model": request.model or self._default_model,
+            "model": model,
             "messages": messages,
             "max_tokens": request.max_tokens or 4096,
         }
 
+        cache_control = self._cache_control_for_request(request)
         if system:
-            kwargs["system"] = system
+            if (
+                self._cache_system
+                and cache_control is not None
+                and len(system) >= _MIN_CACHEABLE_SYSTEM_CHARS
+            ):
+                # Explicit breakpoint on the shared system prefix, so council phases that
+                # differ only in user content still read it from cache. Automatic
+                # caching below only marks the end of the prompt.
+                kwargs["system"] = [
+                    {"type": "text", "text": system, "cache_control": cache_control}
+                ]
+            else:
+                kwargs["system"] = system
         if request.temperature is not None:
             kwargs["temperature"] = request.temperature
         if request.stop:
-            kwargs["stop_sequences"] = list(request.stop)
+            # The SDK only iterates these, so already-validated lists are passed through
+            kwargs["stop_sequences"] = (
+                request.stop if isinstance(request.stop, list) else list(request.stop)
+            )
         if request.tools:
-            kwargs["tools"] = list(request.tools)
-        cache_control = self._cache_control_for_request(request)
+            kwargs["tools"] = (
+                request.tools if isinstance(request.tools, list) else list(request.tools)
+            )
         if cache_control is not None:
             # anthropic 0.75.0 does not expose cache_control as a typed keyword yet.
             kwargs["extra_body"] = {"cache_control": cache_control}
@@ -232,7 +369,6 @@ class AnthropicProvider(ProviderAdapter):
         # Handle structured output - requires beta header and output_format
         # See: https://docs.anthropic.com/en/docs/build-with-claude/structured-outputs
         use_beta = False
-        model = request.model or self._default_model
 
         if request.structured_output:
             if self._model_supports_structured_output(model):
@@ -286,6 +422,44 @@ class AnthropicProvider(ProviderAdapter):
         if request.stream:
             return self._generate_stream(client, kwargs, use_beta=use_beta)
 
+        key = canonical_json([use_beta, kwargs])
+        # Only deterministic, tool-free calls are safe to replay from the response cache
+        cache_key = None
+        if (
+            self._response_cache is not None
+            and kwargs.get("temperature") == 0
+            and "tools" not in kwargs
+        ):
+            cache_key = ResponseCache.hash_canonical(key)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return self._parse_response(cached)
+
+        # Identical requests already in flight on this provider share one API call
+        entry = self._inflight.get(key)
+        if entry is None:
+            entry = _InflightCall(asyncio.ensure_future(self._create(client, kwargs, use_beta)))
+            self._inflight[key] = entry
+            entry.task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        entry.waiters += 1
+        try:
+            response = await asyncio.shield(entry.task)
+        finally:
+            entry.waiters -= 1
+            if entry.waiters == 0 and not entry.task.done():
+                # Every caller was cancelled, so nobody is left to use the response
+                entry.task.cancel()
+        if cache_key is not None and self._response_cache is not None:
+            self._response_cache.set(cache_key, response)
+        return self._parse_response(response)
+
+    async def _create(self, client: Any, kwargs: dict[str, Any], use_beta: bool) -> Any:
+        """Send one non-streaming call once a concurrency slot for this key is free."""
+        async with _shared_limiter(self._api_key or "", self._max_concurrent):
+            return await self._send(client, kwargs, use_beta)
+
+    async def _send(self, client: Any, kwargs: dict[str, Any], use_beta: bool) -> Any:
+        """Send one non-streaming Messages API call and return the raw response."""
         structured_output_requested = "output_format" in kwargs
 
         if use_beta:
@@ -315,22 +489,31 @@ class AnthropicProvider(ProviderAdapter):
                     response = await client.messages.create(**retry_kwargs)
         else:
             response = await client.messages.create(**kwargs)
-        return self._parse_response(response)
+        return response
 
     async def _generate_stream(
         self, client: Any, kwargs: dict[str, Any], *, use_beta: bool = False
     ) -> AsyncIterator[GenerateResponse]:
-        """Stream responses from Anthropic API."""
+        """Stream responses from Anthropic API.
+
+        Uses raw ``stream=True`` events rather than the SDK's ``messages.stream`` helper,
+        which rebuilds a full message snapshot on every delta.
+        """
         if use_beta:
-            async with client.beta.messages.stream(
-                betas=[STRUCTURED_OUTPUTS_BETA], **kwargs
-            ) as stream:
-                async for text in stream.text_stream:
-                    yield GenerateResponse(text=text, content=text)
+            stream = await client.beta.messages.create(
+                betas=[STRUCTURED_OUTPUTS_BETA], stream=True, **kwargs
+            )
         else:
-            async with client.messages.stream(**kwargs) as stream:
-                async for text in stream.text_stream:
-                    yield GenerateResponse(text=text, content=text)
+            stream = await client.messages.create(stream=True, **kwargs)
+        try:
+            async for event in stream:
+                if event.type != "content_block_delta":
+                    continue
+                delta = event.delta
+                if delta.type == "text_delta":
+                    yield GenerateResponse.model_construct(text=delta.text, content=delta.text)
+        finally:
+            await stream.close()
 
     def _model_supports_structured_output(self, model: str) -> bool:
         """Check if a specific model supports structured output.
@@ -348,24 +531,7 @@ class AnthropicProvider(ProviderAdapter):
         Returns:
             True if the model supports output_format with json_schema.
         """
-        # Direct match against known models
-        if model in STRUCTURED_OUTPUT_MODELS:
-            return True
-
-        # Strip date suffix for comparison
-        # e.g., "claude-sonnet-4-5-20251201" -> "claude-sonnet-4-5"
-        base_model = model
-        for suffix in ("-2024", "-2025", "-2026"):
-            if suffix in model:
-                base_model = model.split(suffix)[0]
-                break
-
-        # Check if base model is in the known set
-        if base_model in STRUCTURED_OUTPUT_MODELS:
-            return True
-
-        # Check if model starts with any supported prefix (Claude 4.x family)
-        return any(model.startswith(prefix) for prefix in STRUCTURED_OUTPUT_MODEL_PREFIXES)
+        return _model_supports_structured_output(model)
 
     def _cache_control_for_request(self, request: GenerateRequest) -> dict[str, str] | None:
         """Build Anthropic top-level automatic cache control."""
@@ -380,13 +546,14 @@ class AnthropicProvider(ProviderAdapter):
 
     def _parse_response(self, response: Any) -> GenerateResponse:
         """Parse Anthropic API response."""
-        text = ""
+        text_parts: list[str] = []
         tool_calls = None
 
         for block in response.content:
-            if hasattr(block, "text"):
-                text += block.text
-            elif hasattr(block, "type") and block.type == "tool_use":
+            block_type = getattr(block, "type", "text")
+            if block_type == "text":
+                text_parts.append(block.text)
+            elif block_type == "tool_use":
                 if tool_calls is None:
                     tool_calls = []
                 tool_calls.append(
@@ -427,7 +594,9 @@ class AnthropicProvider(ProviderAdapter):
                 if cache_creation_1h_tokens:
                     usage["cache_creation_1h_tokens"] = cache_creation_1h_tokens
 
-        return GenerateResponse(
+        text = "".join(text_parts)
+        # Every field is built above from SDK-typed values, so skip re-validation
+        return GenerateResponse.model_construct(
             text=text,
             content=text,
             tool_calls=tool_calls,
@@ -463,21 +632,26 @@ class AnthropicProvider(ProviderAdapter):
                 details={"error": "missing_package"},
             )
 
+        cached = _DOCTOR_RESULTS.get(self._api_key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
         try:
             client = self._get_client()
-            # Minimal API call
-            await client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=1,
-                messages=[{"role": "user", "content": "Hi"}],
-            )
+            await self._probe(client)
             latency_ms = (time.time() - start_time) * 1000
 
-            return DoctorResult(
+            result = DoctorResult(
                 ok=True,
                 message="Anthropic API is accessible",
                 latency_ms=latency_ms,
             )
+            # Only successes are reused, so a fixed key or network is seen immediately
+            _DOCTOR_RESULTS[self._api_key] = (
+                time.monotonic() + _DOCTOR_CACHE_TTL_SECONDS,
+                result,
+            )
+            return result
         except Exception as e:
             latency_ms = (time.time() - start_time) * 1000
             return DoctorResult(
@@ -487,6 +661,24 @@ class AnthropicProvider(ProviderAdapter):
                 details={"error": str(e)},
             )
 
+    @staticmethod
+    async def _probe(client: Any) -> None:
+        """Authenticate the key as cheaply as the installed SDK allows."""
+        models = getattr(client, "models", None)
+        if models is not None:
+            try:
+                # Listing models authenticates the key without running (and billing) inference
+                await models.list(limit=1)
+                return
+            except Exception as exc:
+                if getattr(exc, "status_code", None) != 404:
+                    raise
+        await client.messages.create(
+            model=_DOCTOR_FALLBACK_MODEL,
+            max_tokens=1,
+            messages=[{"role": "user", "content": "Hi"}],
+        )
+
 
 def _register() -> None:
     """Register the Anthropic provider with the global registry."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
 from enum import Enum
@@ -119,6 +120,27 @@ _SERVER_ERROR_PATTERNS = (
 )
 
 
+def _compile_patterns(patterns: Sequence[str]) -> re.Pattern[str]:
+    return re.compile("|".join(re.escape(pattern) for pattern in patterns))
+
+
+# Checked in priority order; each category is a single alternation over lowercase text.
+_ERROR_CLASSIFIERS: tuple[tuple[re.Pattern[str], ErrorType], ...] = (
+    # Billing first (most critical, don't waste money retrying)
+    (_compile_patterns(_BILLING_PATTERNS), ErrorType.BILLING),
+    # Rate limiting (retryable with backoff)
+    (_compile_patterns(_RATE_LIMIT_PATTERNS), ErrorType.RATE_LIMIT),
+    # Auth errors (permanent, fix API key)
+    (_compile_patterns(_AUTH_PATTERNS), ErrorType.AUTH),
+    (_compile_patterns(_MODEL_UNAVAILABLE_PATTERNS), ErrorType.MODEL_UNAVAILABLE),
+    # Timeouts before general network issues so read/deadline failures retry correctly
+    (_compile_patterns(_TIMEOUT_PATTERNS), ErrorType.TIMEOUT),
+    (_compile_patterns(_NETWORK_PATTERNS), ErrorType.NETWORK),
+    # Server/API errors are transient and retryable like network failures
+    (_compile_patterns(_SERVER_ERROR_PATTERNS), ErrorType.NETWORK),
+)
+
+
 def classify_error(error_text: str, return_code: int = -1) -> ErrorType:
     """Classify an error based on error text and return code.
 
@@ -134,44 +156,28 @@ def classify_error(error_text: str, return_code: int = -1) -> ErrorType:
 
     error_lower = error_text.lower() if error_text else ""
 
-    # Check billing errors first (most critical, don't waste money retrying)
-    for pattern in _BILLING_PATTERNS:
-        if pattern.lower() in error_lower:
-            return ErrorType.BILLING
-
-    # Check rate limiting (retryable with backoff)
-    for pattern in _RATE_LIMIT_PATTERNS:
-        if pattern.lower() in error_lower:
-            return ErrorType.RATE_LIMIT
-
-    # Check auth errors (permanent, fix API key)
-    for pattern in _AUTH_PATTERNS:
-        if pattern.lower() in error_lower:
-            return ErrorType.AUTH
-
-    # Check model availability
-    for pattern in _MODEL_UNAVAILABLE_PATTERNS:
-        if pattern.lower() in error_lower:
-            return ErrorType.MODEL_UNAVAILABLE
-
-    # Check timeouts before general network issues so read/deadline failures retry correctly
-    for pattern in _TIMEOUT_PATTERNS:
-        if pattern in error_lower:
-            return ErrorType.TIMEOUT
-
-    # Check for network issues (retryable)
-    for pattern in _NETWORK_PATTERNS:
-        if pattern in error_lower:
-            return ErrorType.NETWORK
-
-    # Check for server/API errors (transient, retryable like network)
-    for pattern in _SERVER_ERROR_PATTERNS:
-        if pattern in error_lower:
-            return ErrorType.NETWORK
+    for pattern, error_type in _ERROR_CLASSIFIERS:
+        if pattern.search(error_lower):
+            return error_type
 
     return ErrorType.UNKNOWN
 
 
+_BILLING_URLS: dict[str, str] = {
+    "openai": "https://platform.openai.com/account/billing",
+    "codex": "https://platform.openai.com/account/billing",
+    "codex-cli": "https://platform.openai.com/account/billing",
+    "anthropic": "https://console.anthropic.com/settings/billing",
+    "claude": "https://console.anthropic.com/settings/billing",
+    "claude-code": "https://console.anthropic.com/settings/billing",
+    "google": "https://console.cloud.google.com/billing",
+    "gemini": "https://console.cloud.google.com/billing",
+    "gemini-cli": "https://console.cloud.google.com/billing",
+    "openrouter": "https://openrouter.ai/account/credits",
+}
+_DEFAULT_BILLING_HELP = "Check your provider's billing page"
+
+
 def get_billing_help_url(provider: str) -> str:
     """Get the billing help URL for a provider.
 
@@ -181,19 +187,7 @@ def get_billing_help_url(provider: str) -> str:
     Returns:
         URL to the provider's billing page
     """
-    urls = {
-        "openai": "https://platform.openai.com/account/billing",
-        "codex": "https://platform.openai.com/account/billing",
-        "codex-cli": "https://platform.openai.com/account/billing",
-        "anthropic": "https://console.anthropic.com/settings/billing",
-        "claude": "https://console.anthropic.com/settings/billing",
-        "claude-code": "https://console.anthropic.com/settings/billing",
-        "google": "https://console.cloud.google.com/billing",
-        "gemini": "https://console.cloud.google.com/billing",
-        "gemini-cli": "https://console.cloud.google.com/billing",
-        "openrouter": "https://openrouter.ai/account/credits",
-    }
-    return urls.get(provider.lower(), "Check your provider's billing page")
+    return _BILLING_URLS.get(provider.lower(), _DEFAULT_BILLING_HELP)
 
 
 class ProviderCapabilities(BaseModel):
@@ -220,6 +214,8 @@ class ProviderCapabilities(BaseModel):
     )
 
 
+_CAPABILITY_NAMES: frozenset[str] = frozenset(ProviderCapabilities.model_fields)
+
 ProviderCapabilityName = Literal[
     "streaming",
     "tool_use",
@@ -505,13 +501,13 @@ class ProviderAdapter(ABC):
     def capability_names(cls) -> Iterable[str]:
         """Return supported capability attribute names."""
 
-        return ProviderCapabilities.model_fields.keys()
+        return _CAPABILITY_NAMES
 
     @classmethod
     def supports_capability_name(cls, capability: str) -> bool:
         """Return True if *capability* is a known capability field name."""
 
-        return capability in ProviderCapabilities.model_fields
+        return capability in _CAPABILITY_NAMES
 
     @classmethod
     def supports_capability(cls, capability: ProviderCapabilityName | str) -> bool:
@@ -0,0 +1,92 @@
+"""In-process response cache for deterministic provider calls.
+
+Council phases often re-send the same judge prompt at temperature 0. Adapters can
+opt into a :class:`ResponseCache` so an exact repeat is answered from memory
+instead of making another network round-trip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def canonical_json(payload: Any) -> bytes:
+    """Serialize ``payload`` to JSON bytes with sorted keys, for use as a lookup key.
+
+    Uses orjson when it is installed and the payload fits its type rules, and the
+    standard library otherwise. Keys are only compared within one process, so the
+    two encodings never need to agree.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str
+            )
+        except TypeError:
+            pass
+    return json.dumps(payload, sort_keys=True, default=str).encode()
+
+
+class ResponseCache:
+    """Bounded LRU cache whose entries expire after ``ttl_seconds``."""
+
+    def __init__(self, maxsize: int = 256, ttl_seconds: float = 300.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before the least recently
+                used one is evicted.
+            ttl_seconds: Lifetime of an entry, measured on the monotonic clock.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    @staticmethod
+    def make_key(payload: Any) -> str:
+        """Hash a JSON-serializable request payload into a compact cache key."""
+        return ResponseCache.hash_canonical(canonical_json(payload))
+
+    @staticmethod
+    def hash_canonical(encoded: bytes) -> str:
+        """Hash bytes already produced by :func:`canonical_json` into a cache key."""
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for ``key``, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
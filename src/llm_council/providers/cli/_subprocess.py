@@ -33,4 +33,8 @@ async def terminate_process_tree(
     except asyncio.TimeoutError:
         with contextlib.suppress(ProcessLookupError):
             proc.kill()
-        await proc.communicate()
+        # wait() only resolves once every pipe has closed, so a child that escaped
+        # the process group and still holds stdout can block it indefinitely. Bound
+        # the wait and give up on reaping rather than stall the run.
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(proc.wait(), timeout=grace_seconds)
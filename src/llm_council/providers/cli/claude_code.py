@@ -38,14 +38,16 @@ logger = logging.getLogger(__name__)
 DEFAULT_MODEL = "sonnet"
 
 # Minimal environment allowlist for subprocess
-_ENV_ALLOWLIST = {
-    "PATH",
-    "HOME",
-    "ANTHROPIC_API_KEY",
-    "TERM",
-    "LANG",
-    "LC_ALL",
-}
+_ENV_ALLOWLIST = frozenset(
+    {
+        "PATH",
+        "HOME",
+        "ANTHROPIC_API_KEY",
+        "TERM",
+        "LANG",
+        "LC_ALL",
+    }
+)
 
 
 def _extract_text_payload(payload: Any) -> str:
@@ -176,7 +178,7 @@ class ClaudeCodeCLIProvider(ProviderAdapter):
 
     def _get_minimal_env(self) -> dict[str, str]:
         """Get minimal environment with only allowlisted variables."""
-        return {k: v for k, v in os.environ.items() if k in _ENV_ALLOWLIST}
+        return {k: v for k in _ENV_ALLOWLIST if (v := os.environ.get(k)) is not None}
 
     def _request_timeout(self, request: GenerateRequest) -> float:
         """Return the effective timeout for this request."""
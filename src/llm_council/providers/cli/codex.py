@@ -21,7 +21,7 @@ import shutil
 import signal
 import tempfile
 import warnings
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, ClassVar
@@ -90,7 +90,7 @@ def _extract_usage_payload(stdout_text: str) -> dict[str, int] | None:
     return None
 
 
-def _prepare_schema_for_codex(schema: dict[str, Any]) -> dict[str, Any]:
+def _prepare_schema_for_codex(schema: Mapping[str, Any]) -> dict[str, Any]:
     """Transform a JSON schema for Codex structured output strictness."""
 
     result: dict[str, Any] = {}
@@ -322,6 +322,8 @@ class CodexCLIProvider(ProviderAdapter):
         self._cli_path = cli_path or shutil.which("codex")
         self._default_model = default_model or DEFAULT_MODEL
         self._default_flags = default_flags or DEFAULT_FLAGS
+        self._flag_argv = shlex.split(self._default_flags)
+        self._unsafe_flags = any(flag in self._default_flags for flag in _UNSAFE_FLAGS)
         self._timeout = timeout
         self._login_status_checked = False
         self._login_status_cache: str | None = None
@@ -338,8 +340,7 @@ class CodexCLIProvider(ProviderAdapter):
         if not self._cli_path:
             raise RuntimeError("Codex CLI not found.")
 
-        cmd = [self._cli_path, "exec"]
-        cmd.extend(shlex.split(self._default_flags))
+        cmd = [self._cli_path, "exec", *self._flag_argv]
         cmd.extend(["--json", "--color", "never"])
         cmd.extend(["-m", model])
         if output_schema_path:
@@ -349,8 +350,7 @@ class CodexCLIProvider(ProviderAdapter):
 
         prompt = ""
         if request.messages:
-            parts = [m.content for m in request.messages if m.role == "user"]
-            prompt = "\n\n".join(parts)
+            prompt = "\n\n".join(m.content for m in request.messages if m.role == "user")
         elif request.prompt:
             prompt = request.prompt
         else:
@@ -361,11 +361,8 @@ class CodexCLIProvider(ProviderAdapter):
 
     def _check_unsafe_flags(self) -> None:
         """Emit warning if using unsafe permissive flags."""
-        flags_str = self._default_flags
-        for unsafe_flag in _UNSAFE_FLAGS:
-            if unsafe_flag in flags_str:
-                warnings.warn(_UNSAFE_WARNING, UserWarning, stacklevel=3)
-                break
+        if self._unsafe_flags:
+            warnings.warn(_UNSAFE_WARNING, UserWarning, stacklevel=3)
 
     def _get_subprocess_env(self) -> dict[str, str]:
         """Get a Codex-safe subprocess environment."""
@@ -499,7 +496,7 @@ class CodexCLIProvider(ProviderAdapter):
                 )
                 with os.fdopen(schema_fd, "w", encoding="utf-8") as schema_file:
                     json.dump(
-                        _prepare_schema_for_codex(dict(request.structured_output.json_schema)),
+                        _prepare_schema_for_codex(request.structured_output.json_schema),
                         schema_file,
                     )
             cmd = self._build_command(
@@ -56,30 +56,36 @@ _UNSAFE_WARNING = (
 )
 
 # Minimal environment allowlist for subprocess
-_COMMON_ENV_ALLOWLIST = {
-    "PATH",
-    "HOME",
-    "TERM",
-    "LANG",
-    "LC_ALL",
-    "TMPDIR",
-}
-_GEMINI_API_ENV_ALLOWLIST = {"GEMINI_API_KEY"}
-_VERTEX_ENV_ALLOWLIST = {
-    "GOOGLE_API_KEY",
-    "GOOGLE_CLOUD_PROJECT",
-    "GOOGLE_CLOUD_PROJECT_ID",
-    "GOOGLE_CLOUD_LOCATION",
-    "GOOGLE_APPLICATION_CREDENTIALS",
-    "GOOGLE_GENAI_USE_VERTEXAI",
-    "GOOGLE_GENAI_USE_GCA",
-    "GEMINI_CLI_USE_COMPUTE_ADC",
-}
-_OAUTH_ENV_ALLOWLIST = {
-    "GOOGLE_GENAI_USE_GCA",
-    "GOOGLE_APPLICATION_CREDENTIALS",
-    "GEMINI_CLI_USE_COMPUTE_ADC",
-}
+_COMMON_ENV_ALLOWLIST = frozenset(
+    {
+        "PATH",
+        "HOME",
+        "TERM",
+        "LANG",
+        "LC_ALL",
+        "TMPDIR",
+    }
+)
+_GEMINI_API_ENV_ALLOWLIST = frozenset({"GEMINI_API_KEY"})
+_VERTEX_ENV_ALLOWLIST = frozenset(
+    {
+        "GOOGLE_API_KEY",
+        "GOOGLE_CLOUD_PROJECT",
+        "GOOGLE_CLOUD_PROJECT_ID",
+        "GOOGLE_CLOUD_LOCATION",
+        "GOOGLE_APPLICATION_CREDENTIALS",
+        "GOOGLE_GENAI_USE_VERTEXAI",
+        "GOOGLE_GENAI_USE_GCA",
+        "GEMINI_CLI_USE_COMPUTE_ADC",
+    }
+)
+_OAUTH_ENV_ALLOWLIST = frozenset(
+    {
+        "GOOGLE_GENAI_USE_GCA",
+        "GOOGLE_APPLICATION_CREDENTIALS",
+        "GEMINI_CLI_USE_COMPUTE_ADC",
+    }
+)
 _KNOWN_AUTH_ENV_ALLOWLIST = _GEMINI_API_ENV_ALLOWLIST | _VERTEX_ENV_ALLOWLIST
 _AUTH_TYPE_VERTEX = "vertex-ai"
 _AUTH_TYPE_GEMINI_API_KEY = "gemini-api-key"
@@ -219,7 +225,7 @@ class GeminiCLIProvider(ProviderAdapter):
     def _get_minimal_env(self, auth_settings: dict[str, Any] | None) -> dict[str, str]:
         """Get a minimal environment that preserves the configured Gemini auth mode."""
 
-        env = {k: v for k, v in os.environ.items() if k in _COMMON_ENV_ALLOWLIST}
+        env = {k: v for k in _COMMON_ENV_ALLOWLIST if (v := os.environ.get(k)) is not None}
         selected_type = self._selected_auth_type(auth_settings)
 
         if selected_type == _AUTH_TYPE_VERTEX:
@@ -321,8 +327,7 @@ class GeminiCLIProvider(ProviderAdapter):
 
         prompt = ""
         if request.messages:
-            parts = [m.content for m in request.messages if m.role == "user"]
-            prompt = "\n\n".join(parts)
+            prompt = "\n\n".join(m.content for m in request.messages if m.role == "user")
         elif request.prompt:
             prompt = request.prompt
         else:
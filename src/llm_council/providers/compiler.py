@@ -452,8 +452,8 @@ def _drop_cli_only_options(
 
 
 def _openai_supports_structured_output(model: str) -> bool:
-    return model in OPENAI_STRUCTURED_OUTPUT_MODELS or any(
-        model.startswith(prefix) for prefix in OPENAI_STRUCTURED_OUTPUT_MODEL_PREFIXES
+    return model in OPENAI_STRUCTURED_OUTPUT_MODELS or model.startswith(
+        OPENAI_STRUCTURED_OUTPUT_MODEL_PREFIXES
     )
 
 
@@ -467,19 +467,19 @@ def _openai_supports_temperature(model: str) -> bool:
 
 def _anthropic_supports_structured_output(model: str) -> bool:
     normalized = _normalize_model_name(model)
-    return normalized in ANTHROPIC_STRUCTURED_OUTPUT_MODELS or any(
-        normalized.startswith(prefix) for prefix in ANTHROPIC_STRUCTURED_OUTPUT_MODEL_PREFIXES
+    return normalized in ANTHROPIC_STRUCTURED_OUTPUT_MODELS or normalized.startswith(
+        ANTHROPIC_STRUCTURED_OUTPUT_MODEL_PREFIXES
     )
 
 
 def _gemini_supports_structured_output(model: str) -> bool:
     normalized = _normalize_model_name(model)
-    return any(normalized.startswith(prefix) for prefix in STRUCTURED_OUTPUT_MODEL_PREFIXES)
+    return normalized.startswith(STRUCTURED_OUTPUT_MODEL_PREFIXES)
 
 
 def _gemini_is_legacy_model(model: str) -> bool:
     normalized = _normalize_model_name(model)
-    return any(normalized.startswith(prefix) for prefix in LEGACY_MODEL_PREFIXES)
+    return normalized.startswith(LEGACY_MODEL_PREFIXES)
 
 
 def _vertex_is_claude_model(model: str) -> bool:
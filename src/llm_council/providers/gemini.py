@@ -6,12 +6,14 @@ Direct integration with the Gemini API via Google's ``google-genai`` SDK.
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import inspect
 import logging
 import os
+import threading
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Mapping
 from typing import Any, ClassVar, cast
 
 from llm_council.providers.base import (
@@ -20,6 +22,7 @@ from llm_council.providers.base import (
     GenerateResponse,
     ProviderAdapter,
     ProviderCapabilities,
+    ReasoningConfig,
 )
 
 DEFAULT_MODEL = "gemini-3.1-pro-preview"
@@ -56,8 +59,33 @@ LEGACY_MODEL_PREFIXES = (
 )
 
 
+# Fields NOT supported by Google's Schema protobuf
+# Note: "title" is handled specially - only stripped at schema level, not as property name
+_UNSUPPORTED_SCHEMA_FIELDS = frozenset(
+    {
+        "$schema",
+        "$id",
+        "$ref",
+        "$comment",
+        "additionalProperties",
+        "default",
+        "examples",
+        "minLength",
+        "maxLength",
+        "minimum",
+        "maximum",
+        "pattern",
+        "format",
+        # Array validation fields (Issue #14)
+        "minItems",
+        "maxItems",
+        "uniqueItems",
+    }
+)
+
+
 def _strip_schema_meta_fields(
-    schema: dict[str, Any], *, _inside_properties: bool = False
+    schema: Mapping[str, Any], *, _inside_properties: bool = False
 ) -> dict[str, Any]:
     """Strip fields from JSON schema that Google's SDK doesn't accept.
 
@@ -72,6 +100,10 @@ def _strip_schema_meta_fields(
     - {"title": "MySchema", "type": "object"} -> "title" is stripped (meta field)
     - {"properties": {"title": {"type": "string"}}} -> "title" is kept (property name)
 
+    Every dict and list is rebuilt, so the result shares nothing with ``schema``.
+    google-genai rewrites ``response_schema`` in place (property ordering, nullable
+    types, inlined ``$ref``), and sharing subtrees would let it edit the caller's schema.
+
     Args:
         schema: The original JSON schema.
         _inside_properties: Internal flag - True when processing children of "properties".
@@ -79,38 +111,13 @@ def _strip_schema_meta_fields(
     Returns:
         A new schema with only Google-supported fields.
     """
-    # Fields NOT supported by Google's Schema protobuf
-    # Note: "title" is handled specially - only stripped at schema level, not as property name
-    unsupported_fields = {
-        "$schema",
-        "$id",
-        "$ref",
-        "$comment",
-        "additionalProperties",
-        "default",
-        "examples",
-        "minLength",
-        "maxLength",
-        "minimum",
-        "maximum",
-        "pattern",
-        "format",
-        # Array validation fields (Issue #14)
-        "minItems",
-        "maxItems",
-        "uniqueItems",
-    }
-
     result: dict[str, Any] = {}
 
     for key, value in schema.items():
         # Skip unsupported fields
-        if key in unsupported_fields:
-            continue
-
         # "title" is only a meta field at the schema level, not inside properties
         # e.g., {"properties": {"title": {"type": "string"}}} - "title" is a property name
-        if key == "title" and not _inside_properties:
+        if key in _UNSUPPORTED_SCHEMA_FIELDS or (key == "title" and not _inside_properties):
             continue
 
         if key == "properties" and isinstance(value, dict):
@@ -140,6 +147,64 @@ def _strip_schema_meta_fields(
 
 logger = logging.getLogger(__name__)
 
+# Gemini 3.x thinking levels, keyed by ReasoningConfig.thinking_level
+_THINKING_LEVELS = {
+    "minimal": "MINIMAL",
+    "low": "LOW",
+    "medium": "MEDIUM",
+    "high": "HIGH",
+}
+# Gemini 2.5 thinking_budget upper bound
+MAX_THINKING_BUDGET = 24576
+# Upper bound on the doctor() model-list probe
+_DOCTOR_TIMEOUT_SECONDS = 5.0
+
+# genai clients shared across provider instances, keyed by API key, timeout and
+# retry attempts, so per-model virtual providers reuse one connection pool. Each
+# entry records the event loop it was built on because async HTTP pools cannot
+# cross event loops.
+_CLIENTS: dict[tuple[str, int, int], tuple[asyncio.AbstractEventLoop | None, Any]] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# Semaphores capping concurrent generate_content calls per API key and limit,
+# bound to the event loop they were created on like the shared clients above.
+_LIMITERS: dict[tuple[str, int], tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+DEFAULT_MAX_CONCURRENT = 16
+
+
+def _shared_limiter(api_key: str, max_concurrent: int) -> asyncio.Semaphore:
+    """Return the semaphore gating calls for ``api_key`` on the running event loop."""
+    loop = asyncio.get_running_loop()
+    key = (api_key, max_concurrent)
+    with _CLIENTS_LOCK:
+        entry = _LIMITERS.get(key)
+        if entry is not None and entry[0] is loop:
+            return entry[1]
+        limiter = asyncio.Semaphore(max_concurrent)
+        _LIMITERS[key] = (loop, limiter)
+        return limiter
+
+
+def _thinking_config(reasoning: ReasoningConfig, provider_label: str) -> dict[str, Any]:
+    """Map an enabled ReasoningConfig to Gemini's thinking_config.
+
+    Gemini 3.x uses thinking_level, Gemini 2.5 uses thinking_budget. Without
+    either, the medium thinking level is requested.
+    """
+    if reasoning.thinking_level:
+        return {"thinking_level": _THINKING_LEVELS[reasoning.thinking_level]}
+    if reasoning.budget_tokens:
+        if reasoning.budget_tokens > MAX_THINKING_BUDGET:
+            logger.warning(
+                "%s thinking_budget capped from %d to %d (provider maximum)",
+                provider_label,
+                reasoning.budget_tokens,
+                MAX_THINKING_BUDGET,
+            )
+            return {"thinking_budget": MAX_THINKING_BUDGET}
+        return {"thinking_budget": reasoning.budget_tokens}
+    return {"thinking_level": "MEDIUM"}
+
 
 def _positive_int(value: Any) -> int:
     if isinstance(value, int) and not isinstance(value, bool) and value > 0:
@@ -199,13 +264,18 @@ class GeminiProvider(ProviderAdapter):
         default_model: str | None = None,
         timeout_ms: int | None = None,
         retry_attempts: int | None = None,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
     ) -> None:
         """Initialize the Gemini API provider.
 
         Args:
             api_key: Google AI API key. Falls back to GOOGLE_API_KEY or GEMINI_API_KEY env var.
             default_model: Default model to use if not specified in request.
+            max_concurrent: Maximum number of non-streaming calls in flight at once
+                across every provider instance sharing this API key.
         """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
         self._api_key = (
             api_key or os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
         )
@@ -233,7 +303,7 @@ class GeminiProvider(ProviderAdapter):
             if env_retry_attempts is not None
             else DEFAULT_RETRY_ATTEMPTS
         )
-        self._client: Any = None
+        self._max_concurrent = max_concurrent
 
     def _client_timeout_ms(self, request: GenerateRequest | None = None) -> int:
         """Resolve the SDK timeout for a request."""
@@ -241,8 +311,13 @@ class GeminiProvider(ProviderAdapter):
             return max(int(request.timeout_seconds * 1000), 1)
         return self._timeout_ms
 
-    def _build_client(self, *, timeout_ms: int) -> Any:
-        """Build a Google GenAI client with the requested timeout."""
+    def _get_client(self, *, timeout_ms: int | None = None) -> Any:
+        """Return the process-wide Google GenAI client for this key and timeout.
+
+        Clients live only in the module-level cache, which also checks the event
+        loop, so every lookup goes through it rather than an instance attribute.
+        """
+        timeout_ms = timeout_ms or self._timeout_ms
         try:
             from google import genai
         except ImportError as e:
@@ -257,24 +332,26 @@ class GeminiProvider(ProviderAdapter):
                 "Set GOOGLE_API_KEY or GEMINI_API_KEY environment variable or pass api_key."
             )
 
-        return genai.Client(
-            api_key=self._api_key,
-            http_options=genai.types.HttpOptions(
-                timeout=timeout_ms,
-                retry_options=genai.types.HttpRetryOptions(
-                    attempts=self._retry_attempts,
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        key = (self._api_key, timeout_ms, self._retry_attempts)
+        with _CLIENTS_LOCK:
+            entry = _CLIENTS.get(key)
+            if entry is not None and entry[0] is loop:
+                return entry[1]
+            client = genai.Client(
+                api_key=self._api_key,
+                http_options=genai.types.HttpOptions(
+                    timeout=timeout_ms,
+                    retry_options=genai.types.HttpRetryOptions(
+                        attempts=self._retry_attempts,
+                    ),
                 ),
-            ),
-        )
-
-    def _get_client(self, *, timeout_ms: int | None = None) -> Any:
-        """Get or create the Google GenAI client."""
-        resolved_timeout = timeout_ms or self._timeout_ms
-        if resolved_timeout != self._timeout_ms:
-            return self._build_client(timeout_ms=resolved_timeout)
-        if self._client is None:
-            self._client = self._build_client(timeout_ms=resolved_timeout)
-        return self._client
+            )
+            _CLIENTS[key] = (loop, client)
+            return client
 
     def _cache_client(self, client: Any) -> Any:
         aio_client = getattr(client, "aio", None)
@@ -397,10 +474,10 @@ class GeminiProvider(ProviderAdapter):
         contents: str | list[dict[str, Any]]
         if request.messages:
             # Convert messages to the format expected by the new SDK
-            contents = []
-            for m in request.messages:
-                role = "user" if m.role == "user" else "model"
-                contents.append({"role": role, "parts": [{"text": m.content}]})
+            contents = [
+                {"role": "user" if m.role == "user" else "model", "parts": [{"text": m.content}]}
+                for m in request.messages
+            ]
         elif request.prompt:
             contents = request.prompt
         else:
@@ -425,7 +502,7 @@ class GeminiProvider(ProviderAdapter):
                 config["response_mime_type"] = "application/json"
                 # Strip $schema and other meta fields Google doesn't accept
                 config["response_schema"] = _strip_schema_meta_fields(
-                    dict(request.structured_output.json_schema)
+                    request.structured_output.json_schema
                 )
             elif self._is_legacy_model(model):
                 # Fall back to simple JSON mode for older models (no schema enforcement)
@@ -433,31 +510,8 @@ class GeminiProvider(ProviderAdapter):
             # else: model doesn't support structured output, skip
 
         # Handle reasoning/thinking configuration
-        # Gemini 3.x uses thinking_level, Gemini 2.5 uses thinking_budget
         if request.reasoning and request.reasoning.enabled:
-            if request.reasoning.thinking_level:
-                # Gemini 3.x style: minimal, low, medium, high
-                config["thinking_config"] = {
-                    "thinking_level": request.reasoning.thinking_level.upper(),
-                }
-            elif request.reasoning.budget_tokens:
-                # Gemini 2.5 style: token budget (max 24576)
-                max_budget = 24576
-                budget = min(request.reasoning.budget_tokens, max_budget)
-                if request.reasoning.budget_tokens > max_budget:
-                    logger.warning(
-                        "Google thinking_budget capped from %d to %d (provider maximum)",
-                        request.reasoning.budget_tokens,
-                        max_budget,
-                    )
-                config["thinking_config"] = {
-                    "thinking_budget": budget,
-                }
-            else:
-                # Default: medium thinking level
-                config["thinking_config"] = {
-                    "thinking_level": "MEDIUM",
-                }
+            config["thinking_config"] = _thinking_config(request.reasoning, "Google")
 
         if request.stream:
             return self._generate_stream_with_cache_lifecycle(
@@ -465,13 +519,15 @@ class GeminiProvider(ProviderAdapter):
             )
 
         # Use async client for generate_content
+        limiter = _shared_limiter(self._api_key or "", self._max_concurrent)
         try:
             try:
-                response = await client.aio.models.generate_content(
-                    model=model,
-                    contents=contents,
-                    config=config if config else None,
-                )
+                async with limiter:
+                    response = await client.aio.models.generate_content(
+                        model=model,
+                        contents=contents,
+                        config=config if config else None,
+                    )
             except Exception as exc:
                 prompt_cache = request.prompt_cache
                 if (
@@ -489,11 +545,12 @@ class GeminiProvider(ProviderAdapter):
                         "cached-content resource expired or was unavailable; recreated once"
                     )
                     config["cached_content"] = cache_name
-                    response = await client.aio.models.generate_content(
-                        model=model,
-                        contents=contents,
-                        config=config if config else None,
-                    )
+                    async with limiter:
+                        response = await client.aio.models.generate_content(
+                            model=model,
+                            contents=contents,
+                            config=config if config else None,
+                        )
                 else:
                     raise
         finally:
@@ -558,28 +615,30 @@ class GeminiProvider(ProviderAdapter):
             config=config if config else None,
         )
         async for chunk in stream:
-            if chunk.text:
-                yield GenerateResponse(text=chunk.text, content=chunk.text)
+            # chunk.text joins the candidate parts on every access, so read it once
+            if text := chunk.text:
+                yield GenerateResponse.model_construct(text=text, content=text)
 
     def _parse_response(
         self, response: Any, *, prompt_cache: dict[str, Any] | None = None
     ) -> GenerateResponse:
         """Parse Gemini API response."""
+        candidates = getattr(response, "candidates", None)
+        first_candidate = candidates[0] if candidates else None
+
         text = ""
         try:
             text = response.text
         except Exception:
             # Try to extract text from parts if .text fails
-            if hasattr(response, "candidates") and response.candidates:
-                candidate = response.candidates[0]
-                if hasattr(candidate, "content") and candidate.content:
-                    parts = candidate.content.parts
-                    if parts:
-                        text = "".join(part.text for part in parts if hasattr(part, "text"))
+            content = getattr(first_candidate, "content", None)
+            parts = getattr(content, "parts", None) if content else None
+            if parts:
+                text = "".join(part.text for part in parts if hasattr(part, "text"))
 
         usage = None
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            um = response.usage_metadata
+        um = getattr(response, "usage_metadata", None)
+        if um:
             usage = {
                 "prompt_tokens": getattr(um, "prompt_token_count", 0) or 0,
                 "completion_tokens": getattr(um, "candidates_token_count", 0) or 0,
@@ -589,11 +648,8 @@ class GeminiProvider(ProviderAdapter):
             if cache_read_tokens:
                 usage["cache_read_tokens"] = cache_read_tokens
 
-        finish_reason = None
-        if hasattr(response, "candidates") and response.candidates:
-            fr = getattr(response.candidates[0], "finish_reason", None)
-            if fr:
-                finish_reason = str(fr)
+        fr = getattr(first_candidate, "finish_reason", None)
+        finish_reason = str(fr) if fr else None
 
         return GenerateResponse(
             text=text,
@@ -617,7 +673,7 @@ class GeminiProvider(ProviderAdapter):
             True if the model supports response_schema in generation_config.
         """
         # Check if model starts with any supported prefix (Gemini 2.0+)
-        return any(model.startswith(prefix) for prefix in STRUCTURED_OUTPUT_MODEL_PREFIXES)
+        return model.startswith(STRUCTURED_OUTPUT_MODEL_PREFIXES)
 
     def _is_legacy_model(self, model: str) -> bool:
         """Check if a model is a legacy model that only supports JSON mode.
@@ -628,7 +684,7 @@ class GeminiProvider(ProviderAdapter):
         Returns:
             True if the model only supports simple JSON mode (no schema).
         """
-        return any(model.startswith(prefix) for prefix in LEGACY_MODEL_PREFIXES)
+        return model.startswith(LEGACY_MODEL_PREFIXES)
 
     async def supports(self, capability: str) -> bool:
         """Check if the provider supports a capability."""
@@ -656,9 +712,11 @@ class GeminiProvider(ProviderAdapter):
 
         try:
             client = self._get_client()
-            # List models to verify API key works
-            # The new SDK uses client.models.list()
-            list(client.models.list())
+            # Fetch a single-entry page of models to verify the API key works
+            await asyncio.wait_for(
+                client.aio.models.list(config={"page_size": 1}),
+                timeout=_DOCTOR_TIMEOUT_SECONDS,
+            )
             latency_ms = (time.time() - start_time) * 1000
 
             return DoctorResult(
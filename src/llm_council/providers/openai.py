@@ -10,7 +10,7 @@ import contextlib
 import logging
 import os
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Mapping
 from typing import Any, ClassVar
 
 from llm_council.providers.base import (
@@ -114,7 +114,7 @@ REASONING_MODEL_PREFIXES = ("o1", "o3", "o4")
 MAX_COMPLETION_TOKENS_PREFIXES = ("gpt-5", "o1", "o3", "o4")
 
 
-def _make_schema_strict_compatible(schema: dict[str, Any]) -> dict[str, Any]:
+def _make_schema_strict_compatible(schema: Mapping[str, Any]) -> dict[str, Any]:
     """Transform a JSON schema for OpenAI strict mode compatibility.
 
     OpenAI's strict mode requires:
@@ -290,7 +290,7 @@ class OpenAIProvider(ProviderAdapter):
         if request.max_tokens is not None:
             model = request.model or self._default_model
             # GPT-5.x and o-series use max_completion_tokens instead of max_tokens
-            if any(model.startswith(p) for p in MAX_COMPLETION_TOKENS_PREFIXES):
+            if model.startswith(MAX_COMPLETION_TOKENS_PREFIXES):
                 kwargs["max_completion_tokens"] = request.max_tokens
             else:
                 kwargs["max_tokens"] = request.max_tokens
@@ -319,7 +319,7 @@ class OpenAIProvider(ProviderAdapter):
                 # Transform schema for strict mode compatibility
                 # OpenAI strict mode requires ALL properties in required array
                 transformed_schema = _make_schema_strict_compatible(
-                    dict(request.structured_output.json_schema)
+                    request.structured_output.json_schema
                 )
                 kwargs["response_format"] = {
                     "type": "json_schema",
@@ -440,7 +440,7 @@ class OpenAIProvider(ProviderAdapter):
             return True
 
         # Check if model starts with any supported prefix
-        if any(model.startswith(prefix) for prefix in STRUCTURED_OUTPUT_MODEL_PREFIXES):
+        if model.startswith(STRUCTURED_OUTPUT_MODEL_PREFIXES):
             return True
 
         # Check for version-less model names (e.g., "gpt-4o-2024-08-06" -> "gpt-4o")
@@ -469,7 +469,7 @@ class OpenAIProvider(ProviderAdapter):
             return True
 
         # Check if model starts with any o-series prefix
-        return any(model.startswith(prefix) for prefix in REASONING_MODEL_PREFIXES)
+        return model.startswith(REASONING_MODEL_PREFIXES)
 
     def _model_supports_temperature(self, model: str) -> bool:
         """Check if a model supports the temperature parameter.
@@ -477,7 +477,7 @@ class OpenAIProvider(ProviderAdapter):
         OpenAI o-series reasoning models reject temperature entirely.
         """
 
-        return not any(model.startswith(prefix) for prefix in REASONING_MODEL_PREFIXES)
+        return not model.startswith(REASONING_MODEL_PREFIXES)
 
     async def supports(self, capability: str) -> bool:
         """Check if the provider supports a capability."""
@@ -13,7 +13,7 @@ import json
 import logging
 import os
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Mapping
 from typing import Any, ClassVar
 
 import httpx
@@ -89,7 +89,7 @@ def _schema_is_strict_compatible(schema: Any) -> bool:
 
 
 def _prepare_structured_output_schema(
-    schema: dict[str, Any], *, strict: bool
+    schema: Mapping[str, Any], *, strict: bool
 ) -> tuple[dict[str, Any], bool]:
     """Prepare a JSON schema for OpenRouter without changing its meaning."""
     sanitized = _strip_schema_metadata(schema)
@@ -258,7 +258,7 @@ class OpenRouterProvider(ProviderAdapter):
         # We apply the format for all models and let OpenRouter handle compatibility.
         if request.structured_output:
             transformed_schema, strict_mode = _prepare_structured_output_schema(
-                dict(request.structured_output.json_schema),
+                request.structured_output.json_schema,
                 strict=request.structured_output.strict,
             )
             if request.structured_output.strict and not strict_mode:
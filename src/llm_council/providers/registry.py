@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from importlib import metadata
 from threading import RLock
 from typing import Any
@@ -64,16 +65,34 @@ class ProviderRegistry:
         if self._initialized:
             return
         self._providers: dict[str, type[ProviderAdapter]] = {}
+        # Providers known by name whose module is imported on first instantiation
+        self._pending: dict[str, Callable[[], Any]] = {}
         self._lock: RLock = RLock()
+        self._version = 0
+        # Entry points are scanned on first lookup rather than here: provider modules
+        # call get_registry() at import time, and scanning every installed
+        # distribution would otherwise be paid by any import of those modules.
+        self._discovered = False
         self._initialized = True
-        self._discover_entry_points()
 
-    def register_provider(self, name: str, adapter_class: type[ProviderAdapter]) -> None:
-        """Register a provider adapter class under the given name."""
+    def register_provider(self, name: str, adapter_class: type[ProviderAdapter] | str) -> None:
+        """Register a provider adapter class under the given name.
+
+        ``adapter_class`` may also be a ``"module:ClassName"`` import path, in which
+        case the module is only imported when the provider is first instantiated.
+        """
 
         normalized = name.strip().lower()
         if not normalized:
             raise ValueError("Provider name must be a non-empty string.")
+        if isinstance(adapter_class, str):
+            module_name, _, attribute = adapter_class.partition(":")
+            if not module_name or not attribute:
+                raise ValueError("Provider import path must look like 'module:ClassName'.")
+            self._register_lazy(
+                normalized, lambda: getattr(importlib.import_module(module_name), attribute)
+            )
+            return
         if not issubclass(adapter_class, ProviderAdapter):
             raise TypeError("adapter_class must subclass ProviderAdapter.")
         with self._lock:
@@ -82,7 +101,26 @@ class ProviderRegistry:
                 raise ValueError(
                     f"Provider '{normalized}' is already registered to {existing.__name__}."
                 )
-            self._providers[normalized] = adapter_class
+            if existing is None:
+                self._providers[normalized] = adapter_class
+                if self._pending.pop(normalized, None) is None:
+                    self._version += 1
+
+    def _register_lazy(self, name: str, loader: Callable[[], Any]) -> None:
+        """Record a provider whose adapter class is resolved by *loader* on first use."""
+
+        with self._lock:
+            if name in self._providers or name in self._pending:
+                return
+            self._pending[name] = loader
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped whenever the set of registered provider names changes."""
+
+        self._ensure_discovered()
+        return self._version
 
     def get_provider(self, name: str, **kwargs: Any) -> ProviderAdapter:
         """Instantiate and return the provider adapter.
@@ -93,8 +131,12 @@ class ProviderRegistry:
                 (e.g. ``default_model``).
         """
         normalized = self.resolve_name(name)
+        self._ensure_discovered()
         with self._lock:
             adapter_class = self._providers.get(normalized)
+            loader = self._pending.get(normalized) if adapter_class is None else None
+        if loader is not None:
+            adapter_class = self._load_pending(normalized, loader)
         if adapter_class is None:
             available = ", ".join(self.list_providers())
             raise KeyError(f"Provider '{normalized}' is not registered. Available: [{available}]")
@@ -107,11 +149,24 @@ class ProviderRegistry:
     def list_providers(self) -> list[str]:
         """Return a sorted list of registered provider names."""
 
+        self._ensure_discovered()
         with self._lock:
-            return sorted(self._providers.keys())
+            return sorted(self._providers.keys() | self._pending.keys())
+
+    def _ensure_discovered(self) -> None:
+        """Load entry-point providers once, on the first lookup."""
+
+        if self._discovered:
+            return
+        with self._lock:
+            if self._discovered:
+                return
+            # Set first: loading an entry point imports a module that registers itself.
+            self._discovered = True
+            self._discover_entry_points()
 
     def _discover_entry_points(self) -> None:
-        """Load and register provider adapters from entry points."""
+        """Record provider entry points without importing their modules."""
 
         try:
             entry_points = metadata.entry_points()
@@ -119,40 +174,47 @@ class ProviderRegistry:
             _log.debug("Failed to read provider entry points.", exc_info=True)
             return
 
-        group = self._select_entry_points(entry_points, _ENTRY_POINT_GROUP)
+        for entry_point in self._select_entry_points(entry_points, _ENTRY_POINT_GROUP):
+            normalized = entry_point.name.strip().lower()
+            if normalized:
+                self._register_lazy(normalized, entry_point.load)
 
-        for entry_point in group:
-            try:
-                adapter_class = entry_point.load()
-            except Exception:
-                _log.debug(
-                    "Failed to load provider entry point '%s'.", entry_point.name, exc_info=True
-                )
-                continue
+    def _load_pending(self, name: str, loader: Callable[[], Any]) -> type[ProviderAdapter] | None:
+        """Import and register a pending provider.
 
-            if not isinstance(adapter_class, type):
-                _log.debug(
-                    "Provider entry point '%s' resolved to non-class %r; skipping.",
-                    entry_point.name,
-                    adapter_class,
-                )
-                continue
+        The import runs without holding the registry lock, because provider modules
+        register themselves while they are being imported.
+        """
 
-            if not issubclass(adapter_class, ProviderAdapter):
+        adapter_class: type[ProviderAdapter] | None = None
+        try:
+            loaded = loader()
+        except Exception:
+            _log.debug("Failed to load provider '%s'.", name, exc_info=True)
+        else:
+            if not isinstance(loaded, type):
+                _log.debug("Provider '%s' resolved to non-class %r; skipping.", name, loaded)
+            elif not issubclass(loaded, ProviderAdapter):
                 _log.debug(
-                    "Provider entry point '%s' resolved to %s, not a ProviderAdapter; skipping.",
-                    entry_point.name,
-                    adapter_class.__name__,
+                    "Provider '%s' resolved to %s, not a ProviderAdapter; skipping.",
+                    name,
+                    loaded.__name__,
                 )
-                continue
+            else:
+                adapter_class = loaded
 
-            try:
-                self.register_provider(entry_point.name, adapter_class)
-            except Exception:
-                _log.debug(
-                    "Failed to register provider entry point '%s'.", entry_point.name, exc_info=True
-                )
-                continue
+        with self._lock:
+            # Importing the module may already have registered the class under this name
+            registered = self._providers.get(name)
+            if registered is not None:
+                self._pending.pop(name, None)
+                return registered
+            if adapter_class is None:
+                if self._pending.pop(name, None) is not None:
+                    self._version += 1
+                return None
+            self.register_provider(name, adapter_class)
+            return adapter_class
 
     @staticmethod
     def _select_entry_points(entry_points: Any, group: str) -> Iterable[Any]:
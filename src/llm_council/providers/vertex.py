@@ -12,6 +12,7 @@ Supports both Application Default Credentials (ADC) and service account authenti
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import inspect
 import logging
@@ -42,9 +43,11 @@ from llm_council.providers.base import (
 
 # Import shared schema stripping logic from Gemini API provider
 from llm_council.providers.gemini import (
+    _DOCTOR_TIMEOUT_SECONDS,
     LEGACY_MODEL_PREFIXES,
     STRUCTURED_OUTPUT_MODEL_PREFIXES,
     _strip_schema_meta_fields,
+    _thinking_config,
 )
 
 DEFAULT_MODEL = "gemini-3.1-pro-preview"
@@ -227,12 +230,14 @@ class VertexAIProvider(ProviderAdapter):
 
         # Clients for each model type
         self._gemini_client: Any = None
+        # Gemini clients for per-request timeouts that differ from the default
+        self._gemini_timeout_clients: dict[int, Any] = {}
         self._claude_client: Any = None
 
     def _is_claude_model(self, model: str) -> bool:
         """Check if a model is a Claude model."""
         normalized = _normalize_vertex_model(model)
-        return any(normalized.startswith(prefix) for prefix in CLAUDE_MODEL_PREFIXES)
+        return normalized.startswith(CLAUDE_MODEL_PREFIXES)
 
     def _client_timeout_ms(self, request: GenerateRequest | None = None) -> int:
         """Resolve the SDK timeout for a request."""
@@ -277,7 +282,11 @@ class VertexAIProvider(ProviderAdapter):
         """Get or create the Gemini Vertex AI client."""
         resolved_timeout = timeout_ms or self._timeout_ms
         if resolved_timeout != self._timeout_ms:
-            return self._build_gemini_client(timeout_ms=resolved_timeout)
+            client = self._gemini_timeout_clients.get(resolved_timeout)
+            if client is None:
+                client = self._build_gemini_client(timeout_ms=resolved_timeout)
+                self._gemini_timeout_clients[resolved_timeout] = client
+            return client
         if self._gemini_client is None:
             self._gemini_client = self._build_gemini_client(timeout_ms=resolved_timeout)
         return self._gemini_client
@@ -459,10 +468,10 @@ class VertexAIProvider(ProviderAdapter):
         # Build content - same format as GeminiProvider
         contents: str | list[dict[str, Any]]
         if request.messages:
-            contents = []
-            for m in request.messages:
-                role = "user" if m.role == "user" else "model"
-                contents.append({"role": role, "parts": [{"text": m.content}]})
+            contents = [
+                {"role": "user" if m.role == "user" else "model", "parts": [{"text": m.content}]}
+                for m in request.messages
+            ]
         elif request.prompt:
             contents = request.prompt
         else:
@@ -485,33 +494,14 @@ class VertexAIProvider(ProviderAdapter):
             if self._model_supports_structured_output(model):
                 config["response_mime_type"] = "application/json"
                 config["response_schema"] = _strip_schema_meta_fields(
-                    dict(request.structured_output.json_schema)
+                    request.structured_output.json_schema
                 )
             elif self._is_legacy_model(model):
                 config["response_mime_type"] = "application/json"
 
         # Handle reasoning/thinking configuration
         if request.reasoning and request.reasoning.enabled:
-            if request.reasoning.thinking_level:
-                config["thinking_config"] = {
-                    "thinking_level": request.reasoning.thinking_level.upper(),
-                }
-            elif request.reasoning.budget_tokens:
-                max_budget = 24576
-                budget = min(request.reasoning.budget_tokens, max_budget)
-                if request.reasoning.budget_tokens > max_budget:
-                    logger.warning(
-                        "Vertex AI thinking_budget capped from %d to %d (provider maximum)",
-                        request.reasoning.budget_tokens,
-                        max_budget,
-                    )
-                config["thinking_config"] = {
-                    "thinking_budget": budget,
-                }
-            else:
-                config["thinking_config"] = {
-                    "thinking_level": "MEDIUM",
-                }
+            config["thinking_config"] = _thinking_config(request.reasoning, "Vertex AI")
 
         if request.stream:
             return self._generate_stream_with_cache_lifecycle(
@@ -610,27 +600,30 @@ class VertexAIProvider(ProviderAdapter):
             config=config if config else None,
         )
         async for chunk in stream:
-            if chunk.text:
-                yield GenerateResponse(text=chunk.text, content=chunk.text)
+            # chunk.text joins the candidate parts on every access, so read it once
+            if text := chunk.text:
+                yield GenerateResponse.model_construct(text=text, content=text)
 
     def _parse_response(
         self, response: Any, *, prompt_cache: dict[str, Any] | None = None
     ) -> GenerateResponse:
         """Parse Vertex AI response."""
+        candidates = getattr(response, "candidates", None)
+        first_candidate = candidates[0] if candidates else None
+
         text = ""
         try:
             text = response.text
         except Exception:
-            if hasattr(response, "candidates") and response.candidates:
-                candidate = response.candidates[0]
-                if hasattr(candidate, "content") and candidate.content:
-                    parts = candidate.content.parts
-                    if parts:
-                        text = "".join(part.text for part in parts if hasattr(part, "text"))
+            # Try to extract text from parts if .text fails
+            content = getattr(first_candidate, "content", None)
+            parts = getattr(content, "parts", None) if content else None
+            if parts:
+                text = "".join(part.text for part in parts if hasattr(part, "text"))
 
         usage = None
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            um = response.usage_metadata
+        um = getattr(response, "usage_metadata", None)
+        if um:
             usage = {
                 "prompt_tokens": getattr(um, "prompt_token_count", 0) or 0,
                 "completion_tokens": getattr(um, "candidates_token_count", 0) or 0,
@@ -640,11 +633,8 @@ class VertexAIProvider(ProviderAdapter):
             if cache_read_tokens:
                 usage["cache_read_tokens"] = cache_read_tokens
 
-        finish_reason = None
-        if hasattr(response, "candidates") and response.candidates:
-            fr = getattr(response.candidates[0], "finish_reason", None)
-            if fr:
-                finish_reason = str(fr)
+        fr = getattr(first_candidate, "finish_reason", None)
+        finish_reason = str(fr) if fr else None
 
         return GenerateResponse(
             text=text,
@@ -800,15 +790,15 @@ class VertexAIProvider(ProviderAdapter):
         base_model = model.split("@")[0] if "@" in model else model
         if base_model in ANTHROPIC_STRUCTURED_OUTPUT_MODELS:
             return True
-        return any(base_model.startswith(prefix) for prefix in ANTHROPIC_STRUCTURED_OUTPUT_PREFIXES)
+        return base_model.startswith(ANTHROPIC_STRUCTURED_OUTPUT_PREFIXES)
 
     def _model_supports_structured_output(self, model: str) -> bool:
         """Check if a Gemini model supports structured output with response_schema."""
-        return any(model.startswith(prefix) for prefix in STRUCTURED_OUTPUT_MODEL_PREFIXES)
+        return model.startswith(STRUCTURED_OUTPUT_MODEL_PREFIXES)
 
     def _is_legacy_model(self, model: str) -> bool:
         """Check if a model only supports simple JSON mode (no schema)."""
-        return any(model.startswith(prefix) for prefix in LEGACY_MODEL_PREFIXES)
+        return model.startswith(LEGACY_MODEL_PREFIXES)
 
     async def supports(self, capability: str) -> bool:
         """Check if the provider supports a capability."""
@@ -849,8 +839,11 @@ class VertexAIProvider(ProviderAdapter):
 
         try:
             client = self._get_gemini_client()
-            # List models to verify credentials work
-            list(client.models.list())
+            # Fetch a single-entry page of models to verify credentials work
+            await asyncio.wait_for(
+                client.aio.models.list(config={"page_size": 1}),
+                timeout=_DOCTOR_TIMEOUT_SECONDS,
+            )
             latency_ms = (time.time() - start_time) * 1000
 
             msg = (
@@ -7,6 +7,7 @@ import pytest
 from llm_council.engine import (
     DegradationAction,
     DegradationPolicy,
+    FailureEvent,
     HealthChecker,
     HealthReport,
     HealthStatus,
@@ -176,6 +177,16 @@ class TestDegradationPolicy:
         assert decision.action == DegradationAction.RETRY
         assert decision.retry_delay_ms > 0
 
+    def test_retry_delay_backs_off_exponentially(self):
+        """Test that retry delays double per attempt up to the cap."""
+        policy = create_default_policy(max_retries=2)
+
+        first = policy.decide("test", "rate_limit exceeded", "drafts", 2)
+        second = policy.decide("test", "rate_limit exceeded", "drafts", 2)
+
+        assert first.retry_delay_ms == DegradationPolicy.BASE_RETRY_DELAY_MS
+        assert second.retry_delay_ms == DegradationPolicy.BASE_RETRY_DELAY_MS * 2
+
     def test_max_retries_exceeded(self):
         """Test behavior when max retries exceeded."""
         policy = create_default_policy(max_retries=1)
@@ -241,6 +252,25 @@ class TestDegradationPolicy:
         policy.reset()
         assert len(policy.get_report().failures) == 0
 
+    def test_failure_event_to_dict(self):
+        """Test FailureEvent serialization unwraps enums and truncates messages."""
+        event = FailureEvent(
+            provider="test",
+            phase="drafts",
+            error_type=ErrorType.RATE_LIMIT,
+            error_message="x" * 500,
+            action_taken=DegradationAction.RETRY,
+            retry_count=1,
+        )
+
+        data = event.to_dict()
+
+        assert data["error_type"] == "rate_limit"
+        assert data["action_taken"] == "retry"
+        assert len(data["error_message"]) == 200
+        assert data["retry_count"] == 1
+        assert data["fallback_provider"] is None
+
 
 class TestHealthStatusMethods:
     """Tests for HealthStatus and related methods."""
@@ -275,3 +305,25 @@ class TestHealthStatusMethods:
         assert data["all_healthy"] is False
         assert data["usable_count"] == 1
         assert len(data["providers"]) == 2
+
+    def test_health_report_to_dict_reflects_current_results(self):
+        """Test HealthReport serialization unwraps enums and tracks later changes."""
+        report = HealthReport(
+            providers=[
+                ProviderHealth(
+                    provider="p1",
+                    status=HealthStatus.DOWN,
+                    error_type=ErrorType.AUTH,
+                ),
+            ],
+            all_healthy=False,
+            usable_count=0,
+            total_count=1,
+        )
+
+        data = report.to_dict()
+        report.providers[0].status = HealthStatus.OK
+
+        assert data["providers"][0]["error_type"] == ErrorType.AUTH.value
+        assert data["providers"][0]["status"] == "down"
+        assert report.to_dict()["providers"][0]["status"] == "ok"
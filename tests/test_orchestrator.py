@@ -18,12 +18,14 @@ from llm_council.engine.orchestrator import (
     Orchestrator,
     OrchestratorConfig,
     ValidationResult,
+    _phase_timer,
 )
 from llm_council.protocol.types import ReasoningProfile, RuntimeProfile
 from llm_council.providers.base import (
     DoctorResult,
     GenerateRequest,
     GenerateResponse,
+    Message,
     ProviderAdapter,
     ProviderCapabilities,
 )
@@ -88,6 +90,23 @@ class InvalidJsonProvider(CaptureProvider):
         return GenerateResponse(text="Still not JSON; tighten the benchmark claim.")
 
 
+class StreamingProvider(CaptureProvider):
+    """Provider stub that streams its response in several chunks."""
+
+    async def generate(
+        self, request: GenerateRequest
+    ) -> GenerateResponse | AsyncIterator[GenerateResponse]:
+        self.last_request = request
+        self.requests.append(request)
+
+        async def _stream() -> AsyncIterator[GenerateResponse]:
+            yield GenerateResponse(text='{"ok": ')
+            yield GenerateResponse(text="")
+            yield GenerateResponse(text="true}", usage={"prompt_tokens": 7, "completion_tokens": 3})
+
+        return _stream()
+
+
 def build_file_system_context(*, file_count: int = 3, file_chars: int = 35000) -> str:
     """Build CLI-style file context large enough to trigger chunking tests."""
 
@@ -257,6 +276,56 @@ class TestCacheUsageReporting:
             "cache_creation_5m_tokens": 12,
         }
 
+    def test_record_usage_accumulates_into_plain_cost_estimate(self):
+        orchestrator = Orchestrator(
+            providers=[],
+            config=OrchestratorConfig(enable_artifacts=False, enable_graceful_degradation=False),
+        )
+
+        orchestrator._record_usage("openai", {"prompt_tokens": 10, "completion_tokens": 2})
+        orchestrator._record_usage("openai", {"input_tokens": 5, "output_tokens": 1})
+        orchestrator._record_usage("anthropic", None)
+
+        estimate = orchestrator._build_cost_estimate()
+        assert type(estimate.provider_calls) is dict
+        assert estimate.provider_calls == {"openai": 2, "anthropic": 1}
+        assert estimate.total_input_tokens == 15
+        assert estimate.total_output_tokens == 3
+
+    async def test_call_provider_joins_streamed_chunks(self):
+        orchestrator = Orchestrator(
+            providers=[],
+            config=OrchestratorConfig(enable_artifacts=False, enable_graceful_degradation=False),
+        )
+        request = GenerateRequest(messages=[Message(role="user", content="hi")])
+
+        response = await orchestrator._call_provider(
+            "streaming", StreamingProvider(), request, phase="synthesis"
+        )
+
+        assert response.text == '{"ok": true}'
+        assert response.usage == {"prompt_tokens": 7, "completion_tokens": 3}
+        assert orchestrator._output_tokens["streaming"] == 3
+
+    def test_cost_estimate_prices_only_providers_with_rates(self):
+        orchestrator = Orchestrator(
+            providers=[],
+            config=OrchestratorConfig(
+                enable_artifacts=False,
+                enable_graceful_degradation=False,
+                cost_per_1k_input={"openai": 2.0},
+                cost_per_1k_output={"openai": 10.0, "anthropic": 15.0},
+            ),
+        )
+
+        orchestrator._record_usage("openai", {"prompt_tokens": 1000, "completion_tokens": 100})
+        orchestrator._record_usage("gemini", {"prompt_tokens": 5000, "completion_tokens": 500})
+
+        estimate = orchestrator._build_cost_estimate()
+        assert estimate.estimated_cost_usd == 3.0
+        assert estimate.tokens == 6600
+        assert "anthropic" not in orchestrator._output_tokens
+
     def test_record_usage_ignores_missing_zero_and_non_int_cache_values(self):
         orchestrator = Orchestrator(
             providers=[],
@@ -394,6 +463,18 @@ class TestOrchestratorValidation:
         result = orch._extract_json('```json\n{"key": "value"}\n```')
         assert result == {"key": "value"}
 
+    def test_extract_json_with_unusual_fences(self):
+        """Bare, unclosed, and commented fences still yield the JSON body."""
+        config = OrchestratorConfig()
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_reg.return_value = MagicMock()
+            mock_reg.return_value.get_provider.return_value = MagicMock()
+            orch = Orchestrator(providers=["mock"], config=config)
+
+        assert orch._extract_json('  ```\n{"key": "value"}\n```  ') == {"key": "value"}
+        assert orch._extract_json('```json\n{"key": "value"}') == {"key": "value"}
+        assert orch._extract_json('```json\n{"key": "```"}\n```\nDone.') == {"key": "```"}
+
     def test_extract_json_embedded(self):
         """Test JSON extraction from text with embedded JSON."""
         config = OrchestratorConfig()
@@ -405,6 +486,29 @@ class TestOrchestratorValidation:
         result = orch._extract_json('Here is the result: {"key": "value"} done.')
         assert result == {"key": "value"}
 
+    def test_extract_json_ignores_trailing_commentary(self):
+        """Test JSON extraction stops at the end of the first embedded object."""
+        config = OrchestratorConfig()
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_reg.return_value = MagicMock()
+            mock_reg.return_value.get_provider.return_value = MagicMock()
+            orch = Orchestrator(providers=["mock"], config=config)
+
+        result = orch._extract_json('Result: {"key": {"nested": "a } b"}} and {"other": 1}')
+        assert result == {"key": {"nested": "a } b"}}
+
+    def test_extract_balanced_json_skips_braces_inside_strings(self):
+        """Test brace counting ignores braces and escaped quotes in string literals."""
+        config = OrchestratorConfig()
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_reg.return_value = MagicMock()
+            mock_reg.return_value.get_provider.return_value = MagicMock()
+            orch = Orchestrator(providers=["mock"], config=config)
+
+        text = 'Note {"a": "}\\"{", "b": {"c": 1}} trailing {'
+        assert orch._extract_balanced_json(text) == '{"a": "}\\"{", "b": {"c": 1}}'
+        assert orch._extract_balanced_json("{ unclosed") is None
+
     def test_extract_json_invalid(self):
         """Test JSON extraction from invalid content."""
         config = OrchestratorConfig()
@@ -453,6 +557,130 @@ class TestOrchestratorValidation:
         assert result.ok is False
         assert "Empty synthesis response" in result.errors[0]
 
+    def test_validate_response_reuses_compiled_validator(self):
+        """The schema validator is compiled once and rebuilt only when the schema changes."""
+        config = OrchestratorConfig()
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_reg.return_value = MagicMock()
+            mock_reg.return_value.get_provider.return_value = MagicMock()
+            orch = Orchestrator(providers=["mock"], config=config)
+        orch._schema = {"type": "object", "required": ["key"]}
+
+        assert orch._validate_response('{"key": 1}').ok is True
+        validator = orch._validator
+        assert orch._validate_response('{"other": 1}').ok is False
+        assert orch._validator is validator
+
+        orch._schema = {"type": "object", "required": ["other"]}
+        assert orch._validate_response('{"other": 1}').ok is True
+        assert orch._validator is not validator
+
+    def test_validate_response_collects_all_errors_after_fast_check(self):
+        """Invalid payloads still report every violation after the pass/fail check."""
+        config = OrchestratorConfig()
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_reg.return_value = MagicMock()
+            mock_reg.return_value.get_provider.return_value = MagicMock()
+            orch = Orchestrator(providers=["mock"], config=config)
+        orch._schema = {"type": "object", "required": ["key", "other"]}
+
+        assert orch._validate_response('{"key": 1, "other": 2}').ok is True
+        result = orch._validate_response("{}")
+        assert result.ok is False
+        assert result.errors == [
+            "'key' is a required property",
+            "'other' is a required property",
+        ]
+
+    def test_validate_response_caps_reported_errors(self):
+        """Pathological payloads report a bounded number of schema violations."""
+        config = OrchestratorConfig()
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_reg.return_value = MagicMock()
+            mock_reg.return_value.get_provider.return_value = MagicMock()
+            orch = Orchestrator(providers=["mock"], config=config)
+        orch._schema = {"type": "object", "required": [f"field_{i}" for i in range(50)]}
+
+        result = orch._validate_response("{}")
+
+        assert result.ok is False
+        assert len(result.errors) == 20
+        assert result.errors[0] == "'field_0' is a required property"
+
+    def test_validate_response_with_fastjsonschema_backend(self):
+        """The fastjsonschema backend reports the first violation like jsonschema does."""
+        pytest.importorskip("fastjsonschema")
+        config = OrchestratorConfig(validator_backend="fastjsonschema")
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_reg.return_value = MagicMock()
+            mock_reg.return_value.get_provider.return_value = MagicMock()
+            orch = Orchestrator(providers=["mock"], config=config)
+        orch._schema = {"type": "object", "required": ["key"]}
+
+        assert orch._validate_response('{"key": 1}').ok is True
+        result = orch._validate_response('{"other": 1}')
+
+        assert result.ok is False
+        assert result.errors and "key" in result.errors[0]
+        assert orch._compiled_validator is not None
+
+    def test_fastjsonschema_backend_returns_data_unchanged(self):
+        """fastjsonschema does not fill schema defaults into the validated payload."""
+        pytest.importorskip("fastjsonschema")
+        schema = {
+            "type": "object",
+            "required": ["task"],
+            "properties": {
+                "task": {"type": "string"},
+                "complexity": {"type": "string", "default": "normal"},
+            },
+        }
+        results = {}
+        for backend in ("jsonschema", "fastjsonschema"):
+            config = OrchestratorConfig(validator_backend=backend)
+            with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+                mock_reg.return_value = MagicMock()
+                mock_reg.return_value.get_provider.return_value = MagicMock()
+                orch = Orchestrator(providers=["mock"], config=config)
+            orch._schema = schema
+            results[backend] = orch._validate_response('{"task": "route"}')
+
+        assert results["fastjsonschema"].ok is True
+        assert results["fastjsonschema"].data == {"task": "route"}
+        assert results["fastjsonschema"].data == results["jsonschema"].data
+
+    def test_validate_response_with_jsonschema_rs_backend(self):
+        """The jsonschema-rs backend reports every violation through the same interface."""
+        jsonschema_rs = pytest.importorskip("jsonschema_rs")
+        config = OrchestratorConfig(validator_backend="jsonschema-rs")
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_reg.return_value = MagicMock()
+            mock_reg.return_value.get_provider.return_value = MagicMock()
+            orch = Orchestrator(providers=["mock"], config=config)
+        orch._schema = {"type": "object", "required": ["key", "other"]}
+
+        assert orch._validate_response('{"key": 1, "other": 2}').ok is True
+        result = orch._validate_response("{}")
+
+        assert result.ok is False
+        assert len(result.errors) == 2
+        assert isinstance(orch._validator, jsonschema_rs.Draft7Validator)
+
+    def test_schema_json_is_serialized_once_per_schema(self):
+        """Prompt formatters reuse the indented schema JSON until the schema changes."""
+        config = OrchestratorConfig()
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_reg.return_value = MagicMock()
+            mock_reg.return_value.get_provider.return_value = MagicMock()
+            orch = Orchestrator(providers=["mock"], config=config)
+        schema = {"type": "object"}
+
+        first = orch._schema_json(schema)
+
+        assert first == '{\n  "type": "object"\n}'
+        assert orch._schema_json(schema) is first
+        assert orch._schema_json({"type": "array"}) != first
+
     def test_bounded_draft_prompt_prefers_concise_analysis_over_schema_json(self):
         """Bounded mode should keep draft prompts lightweight."""
         config = OrchestratorConfig(
@@ -722,6 +950,128 @@ class TestOrchestratorDoctor:
             "draft": [{"provider": "mock", "wait_ms": 42.5}]
         }
 
+    @pytest.mark.asyncio
+    async def test_doctor_times_out_unresponsive_provider(self):
+        """A hung provider check is reported as a timeout instead of stalling doctor()."""
+        config = OrchestratorConfig(doctor_timeout=0.01)
+        hung_provider = MagicMock()
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        hung_provider.doctor = hang
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_registry = MagicMock()
+            mock_registry.get_provider.return_value = hung_provider
+            mock_reg.return_value = mock_registry
+            orch = Orchestrator(providers=["mock"], config=config)
+
+        results = await orch.doctor()
+
+        assert results["mock"]["ok"] is False
+        assert results["mock"]["message"] == "Doctor check timed out after 0.01s"
+        assert results["mock"]["details"] == {"error": "timeout"}
+
+    @pytest.mark.asyncio
+    async def test_doctor_bounds_concurrent_checks(self):
+        """No more than doctor_concurrency checks run at the same time."""
+        config = OrchestratorConfig(doctor_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def probe():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return DoctorResult(ok=True, message="OK")
+
+        provider = MagicMock()
+        provider.doctor = probe
+        names = [f"mock-{i}" for i in range(6)]
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_registry = MagicMock()
+            mock_registry.get_provider.return_value = provider
+            mock_reg.return_value = mock_registry
+            orch = Orchestrator(providers=names, config=config)
+
+        results = await orch.doctor()
+
+        assert all(results[name]["ok"] for name in names)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_iter_doctor_yields_results_in_completion_order(self):
+        """Fast providers report first; doctor() keeps the configured order."""
+
+        def make_provider(delay: float) -> MagicMock:
+            async def probe():
+                await asyncio.sleep(delay)
+                return DoctorResult(ok=True, message=f"ok after {delay}")
+
+            provider = MagicMock()
+            provider.doctor = probe
+            return provider
+
+        providers = {"slow": make_provider(0.03), "fast": make_provider(0)}
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_registry = MagicMock()
+            mock_registry.get_provider.side_effect = lambda name, **_: providers[name]
+            mock_reg.return_value = mock_registry
+            orch = Orchestrator(providers=["slow", "fast"], config=OrchestratorConfig())
+
+        streamed = [name async for name, _ in orch.iter_doctor()]
+        results = await orch.doctor()
+
+        assert streamed == ["fast", "slow"]
+        assert list(results) == ["slow", "fast"]
+        assert results["fast"]["message"] == "ok after 0"
+
+    @pytest.mark.asyncio
+    async def test_iter_doctor_awaits_cancelled_checks_when_closed_early(self):
+        """Stopping the stream early cancels pending checks and waits for them to finish."""
+        finished: list[str] = []
+
+        async def fast_probe():
+            return DoctorResult(ok=True, message="fast")
+
+        async def slow_probe():
+            try:
+                await asyncio.sleep(10)
+            finally:
+                finished.append("slow")
+            return DoctorResult(ok=True, message="slow")
+
+        providers = {"fast": MagicMock(doctor=fast_probe), "slow": MagicMock(doctor=slow_probe)}
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_registry = MagicMock()
+            mock_registry.get_provider.side_effect = lambda name, **_: providers[name]
+            mock_reg.return_value = mock_registry
+            orch = Orchestrator(providers=["slow", "fast"], config=OrchestratorConfig())
+
+        stream = orch.iter_doctor()
+        name, _ = await stream.__anext__()
+        await stream.aclose()
+
+        assert name == "fast"
+        assert finished == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_doctor_reuses_initialized_adapters(self):
+        """doctor() checks the adapters built at init instead of re-instantiating them."""
+        config = OrchestratorConfig(provider_configs={"mock": {"default_model": "m-1"}})
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_registry = MagicMock()
+            mock_registry.get_provider.return_value = CaptureProvider()
+            mock_reg.return_value = mock_registry
+            orch = Orchestrator(providers=["mock"], config=config)
+
+        results = await orch.doctor()
+
+        assert results["mock"]["ok"] is True
+        mock_registry.get_provider.assert_called_once_with("mock", default_model="m-1")
+
     @pytest.mark.asyncio
     async def test_doctor_with_failure(self, failing_provider):
         """Test doctor when a provider fails."""
@@ -779,6 +1129,263 @@ class TestOrchestratorRuntimeTruthfulness:
         }
         assert "diff-review" in orch._execution_plan["required_capabilities"]
 
+    def test_phase_timer_records_failed_phases(self):
+        """Phase timings are kept even when the phase raises."""
+        phase_timings = []
+
+        with _phase_timer("drafts", phase_timings):
+            pass
+        with pytest.raises(RuntimeError), _phase_timer("critique", phase_timings):
+            raise RuntimeError("provider down")
+
+        assert [timing.phase for timing in phase_timings] == ["drafts", "critique"]
+        assert all(timing.duration_ms >= 0 for timing in phase_timings)
+
+    async def test_run_reports_subagent_load_failure(self):
+        """Early failures still produce a serializable result with cost metadata."""
+        orch = Orchestrator(
+            providers=[],
+            config=OrchestratorConfig(enable_artifacts=False, enable_graceful_degradation=False),
+        )
+
+        result = await orch.run("Review this change", "no-such-subagent")
+
+        assert result.success is False
+        assert result.error is not None
+        assert result.error.startswith("Failed to load subagent/schema:")
+        assert result.synthesis_attempts == 1
+        assert result.cost_estimate == CostEstimate()
+        assert result.model_dump()["provider_errors"] is None
+
+    async def test_parallel_drafts_count_remaining_from_draft_failures(self):
+        """Earlier init errors do not shrink the providers still drafting."""
+        orch = Orchestrator(
+            providers=[],
+            config=OrchestratorConfig(enable_artifacts=False, enable_graceful_degradation=True),
+        )
+        orch._providers = {"broken": MagicMock(), "healthy": MagicMock()}
+        orch._provider_init_errors = {"missing": "Provider 'missing' is not registered."}
+        orch._task = "Review this change"
+        orch._subagent_config = {}
+
+        async def fake_generate_draft(provider_name, adapter):
+            if provider_name == "broken":
+                raise RuntimeError("connection reset")
+            return provider_name, "healthy draft"
+
+        with (
+            patch.object(orch, "_generate_draft", side_effect=fake_generate_draft),
+            patch.object(
+                orch._degradation_policy, "decide", wraps=orch._degradation_policy.decide
+            ) as decide,
+        ):
+            drafts = await orch._run_parallel_drafts()
+
+        assert drafts == {"broken": "", "healthy": "healthy draft"}
+        assert orch._provider_init_errors["broken"] == "connection reset"
+        assert decide.call_args.kwargs["remaining_providers"] == 1
+
+    async def test_capability_probe_is_awaited_once_per_provider(self):
+        """Synthesis candidate selection and retries share one supports() probe."""
+        orch = Orchestrator(
+            providers=[],
+            config=OrchestratorConfig(enable_artifacts=False, enable_graceful_degradation=False),
+        )
+        adapter = CaptureProvider()
+        orch._providers = {"capture": adapter}
+
+        with patch.object(adapter, "supports", wraps=adapter.supports) as supports:
+            candidates = await orch._candidate_providers_for_phase("synthesis")
+            assert await orch._adapter_supports("capture", adapter, "structured_output")
+            assert await orch._adapter_supports("capture", adapter, "structured_output")
+
+        assert candidates == [("capture", adapter)]
+        supports.assert_awaited_once_with("structured_output")
+
+    async def test_synthesis_candidates_are_ordered_once_per_provider_set(self):
+        """Structured-output providers lead, and the ordering is reused across calls."""
+        orch = Orchestrator(
+            providers=[],
+            config=OrchestratorConfig(enable_artifacts=False, enable_graceful_degradation=False),
+        )
+        plain = MagicMock()
+        plain.supports = AsyncMock(return_value=False)
+        structured = CaptureProvider()
+        orch._providers = {"plain": plain, "structured": structured}
+
+        first = await orch._candidate_providers_for_phase("synthesis")
+        orch._capability_cache.clear()
+        second = await orch._candidate_providers_for_phase("synthesis")
+        orch._provider_init_errors["structured"] = "auth failed"
+        degraded = await orch._candidate_providers_for_phase("synthesis")
+
+        assert first == [("structured", structured)]
+        assert second == first
+        assert degraded == [("plain", plain)]
+        # Probed for the first provider set and again for the new, degraded one
+        assert plain.supports.await_count == 2
+
+    async def test_parallel_drafts_store_artifacts_as_providers_finish(self):
+        """Drafts keep provider order while artifacts are written in the background."""
+        orch = Orchestrator(
+            providers=[],
+            config=OrchestratorConfig(enable_artifacts=False, enable_graceful_degradation=False),
+        )
+        orch._providers = {"slow": MagicMock(), "fast": MagicMock()}
+        orch._task = "Review this change"
+        orch._subagent_config = {}
+        orch._artifact_store = MagicMock()
+        orch._run_id = "run-1"
+
+        async def fake_generate_draft(provider_name, adapter):
+            await asyncio.sleep(0.05 if provider_name == "slow" else 0)
+            return provider_name, f"{provider_name} draft"
+
+        with patch.object(orch, "_generate_draft", side_effect=fake_generate_draft):
+            drafts = await orch._run_parallel_drafts()
+        await orch._drain_artifact_tasks()
+
+        assert not orch._artifact_tasks
+        assert list(drafts) == ["slow", "fast"]
+        assert drafts == {"slow": "slow draft", "fast": "fast draft"}
+        stored = [
+            call.kwargs["content"] for call in orch._artifact_store.store_artifact.call_args_list
+        ]
+        assert stored == ["fast draft", "slow draft"]
+
+    async def test_parallel_drafts_cancel_pending_drafts_on_outside_timeout(self):
+        """A phase timeout must not leave draft tasks making provider calls."""
+        orch = Orchestrator(
+            providers=[],
+            config=OrchestratorConfig(enable_artifacts=False, enable_graceful_degradation=False),
+        )
+        orch._providers = {"a": MagicMock(), "b": MagicMock()}
+        orch._task = "Review this change"
+        orch._subagent_config = {}
+        cancelled: list[str] = []
+
+        async def fake_generate_draft(provider_name, adapter):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(provider_name)
+                raise
+            return provider_name, "draft"
+
+        with (
+            patch.object(orch, "_generate_draft", side_effect=fake_generate_draft),
+            pytest.raises(asyncio.TimeoutError),
+        ):
+            await asyncio.wait_for(orch._run_parallel_drafts(), timeout=0.05)
+
+        assert sorted(cancelled) == ["a", "b"]
+
+    def test_prepare_run_reuses_providers_until_registry_changes(self):
+        """Provider adapters built in __init__ are reused unless the registry changes."""
+        config = OrchestratorConfig(runtime_profile=RuntimeProfile.BOUNDED)
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_registry = MagicMock()
+            mock_registry.version = 1
+            mock_registry.get_provider.side_effect = lambda name, **kwargs: MagicMock()
+            mock_reg.return_value = mock_registry
+            orch = Orchestrator(providers=["openrouter"], config=config)
+
+        adapter = orch._providers["openrouter"]
+        orch._prepare_run("critic")
+        assert orch._providers["openrouter"] is adapter
+        assert mock_registry.get_provider.call_count == 1
+
+        mock_registry.version = 2
+        orch._prepare_run("critic")
+        assert orch._providers["openrouter"] is not adapter
+        assert mock_registry.get_provider.call_count == 2
+
+    def test_prepare_run_checks_each_schema_once(self):
+        """Per-run copies skip the schema check for a schema an earlier run accepted."""
+        from jsonschema import Draft7Validator
+
+        config = OrchestratorConfig(runtime_profile=RuntimeProfile.BOUNDED)
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_registry = MagicMock()
+            mock_registry.version = 1
+            mock_registry.get_provider.side_effect = lambda name, **kwargs: MagicMock()
+            mock_reg.return_value = mock_registry
+            orch = Orchestrator(providers=["openrouter"], config=config)
+
+        with patch.object(
+            Draft7Validator, "check_schema", wraps=Draft7Validator.check_schema
+        ) as check_schema:
+            orch._fork_for_run()._prepare_run("critic")
+            orch._fork_for_run()._prepare_run("critic")
+
+        assert check_schema.call_count == 1
+
+    def test_per_run_copies_share_provider_sets_and_capability_caches(self):
+        """Adapters a run builds outlive it, and runs never clear each other's caches."""
+        config = OrchestratorConfig(runtime_profile=RuntimeProfile.BOUNDED)
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_registry = MagicMock()
+            mock_registry.version = 1
+            mock_registry.get_provider.side_effect = lambda name, **kwargs: MagicMock()
+            mock_reg.return_value = mock_registry
+            orch = Orchestrator(providers=["openrouter"], config=config)
+        orch._capability_cache[("openrouter", "structured_output")] = True
+
+        first = orch._fork_for_run()
+        first._provider_names = ["openai", "anthropic"]
+        first._initialize_providers()
+        second = orch._fork_for_run()
+        second._provider_names = ["openai", "anthropic"]
+        second._initialize_providers()
+
+        assert second._providers["openai"] is first._providers["openai"]
+        assert mock_registry.get_provider.call_count == 3
+        assert orch._capability_cache == {("openrouter", "structured_output"): True}
+
+    def test_provider_sets_with_init_errors_are_not_cached(self):
+        """A provider that failed to initialize is retried on the next run."""
+        config = OrchestratorConfig(runtime_profile=RuntimeProfile.BOUNDED)
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_registry = MagicMock()
+            mock_registry.version = 1
+            mock_registry.get_provider.side_effect = ValueError("OPENAI_API_KEY is not set")
+            mock_reg.return_value = mock_registry
+            orch = Orchestrator(providers=["openai"], config=config)
+
+        assert "openai" in orch._provider_init_errors
+        assert orch._shared.provider_sets == {}
+
+        adapter = MagicMock()
+        mock_registry.get_provider.side_effect = None
+        mock_registry.get_provider.return_value = adapter
+        orch._prepare_run("critic")
+
+        assert orch._providers["openai"] is adapter
+        assert orch._provider_init_errors == {}
+
+    def test_provider_sets_are_rebuilt_for_a_new_event_loop(self):
+        """Adapters whose clients belong to a finished loop are not reused by later runs."""
+        config = OrchestratorConfig(runtime_profile=RuntimeProfile.BOUNDED)
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_registry = MagicMock()
+            mock_registry.version = 1
+            mock_registry.get_provider.side_effect = lambda name, **kwargs: MagicMock()
+            mock_reg.return_value = mock_registry
+            orch = Orchestrator(providers=["openrouter"], config=config)
+        built_in_init = orch._providers["openrouter"]
+
+        async def prepare() -> ProviderAdapter:
+            run = orch._fork_for_run()
+            run._prepare_run("critic")
+            return run._providers["openrouter"]
+
+        first = asyncio.run(prepare())
+        second = asyncio.run(prepare())
+
+        assert first is built_in_init
+        assert second is not first
+        assert mock_registry.get_provider.call_count == 2
+
     def test_prepare_run_records_provider_specific_timeout_map_for_multi_provider_runs(self):
         """Multi-provider execution plans should expose per-provider phase caps explicitly."""
         config = OrchestratorConfig(runtime_profile=RuntimeProfile.BOUNDED)
@@ -1124,6 +1731,131 @@ class TestOrchestratorRuntimeTruthfulness:
         ]
         assert orch._execution_plan["phase_provider_used"]["synthesis"] == "vertex-ai"
 
+    async def test_run_synthesis_races_first_attempt_across_providers(self):
+        """With synthesis_parallelism, the first valid response wins the race."""
+        config = OrchestratorConfig(enable_graceful_degradation=False, synthesis_parallelism=2)
+        slow_started = asyncio.Event()
+        slow_cancelled = False
+
+        async def slow_generate(_request):
+            nonlocal slow_cancelled
+            slow_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                slow_cancelled = True
+                raise
+            return GenerateResponse(text='{"ok": true}')
+
+        async def fast_generate(_request):
+            await slow_started.wait()
+            return GenerateResponse(text='{"ok": true}')
+
+        openai_provider = MagicMock()
+        openai_provider.supports = AsyncMock(return_value=True)
+        openai_provider.generate = AsyncMock(side_effect=slow_generate)
+        vertex_provider = MagicMock()
+        vertex_provider.supports = AsyncMock(return_value=True)
+        vertex_provider.generate = AsyncMock(side_effect=fast_generate)
+
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_registry = MagicMock()
+            mock_registry.get_provider.side_effect = lambda name, **_kwargs: {
+                "openai": openai_provider,
+                "vertex-ai": vertex_provider,
+            }[name]
+            mock_reg.return_value = mock_registry
+            orch = Orchestrator(providers=["openai", "vertex-ai"], config=config)
+
+        orch._task = "Review this change"
+        orch._subagent_name = "critic"
+        orch._prepare_run("critic")
+        orch._schema = None
+
+        result, attempts = await orch._run_synthesis({"openai": '{"draft": "ok"}'}, "critique")
+
+        assert result.ok is True
+        assert attempts == 2
+        assert slow_cancelled is True
+        assert orch._execution_plan["phase_provider_used"]["synthesis"] == "vertex-ai"
+
+    async def test_run_synthesis_retries_sequentially_after_failed_race(self):
+        """Raced providers only get their remaining retry budget afterwards."""
+        config = OrchestratorConfig(
+            enable_graceful_degradation=False, synthesis_parallelism=2, max_retries=2
+        )
+        openai_provider = MagicMock()
+        openai_provider.supports = AsyncMock(return_value=True)
+        openai_provider.generate = AsyncMock(
+            side_effect=[GenerateResponse(text="not json"), GenerateResponse(text='{"ok": 1}')]
+        )
+        vertex_provider = MagicMock()
+        vertex_provider.supports = AsyncMock(return_value=True)
+        vertex_provider.generate = AsyncMock(return_value=GenerateResponse(text="still not json"))
+
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_registry = MagicMock()
+            mock_registry.get_provider.side_effect = lambda name, **_kwargs: {
+                "openai": openai_provider,
+                "vertex-ai": vertex_provider,
+            }[name]
+            mock_reg.return_value = mock_registry
+            orch = Orchestrator(providers=["openai", "vertex-ai"], config=config)
+
+        orch._task = "Review this change"
+        orch._subagent_name = "critic"
+        orch._prepare_run("critic")
+        orch._schema = None
+
+        result, attempts = await orch._run_synthesis({"openai": '{"draft": "ok"}'}, "critique")
+
+        assert result.ok is True
+        assert result.data == {"ok": 1}
+        assert attempts == 3
+        assert openai_provider.generate.await_count == 2
+        assert vertex_provider.generate.await_count == 1
+
+    async def test_run_synthesis_handles_raced_failures_like_sequential_ones(self):
+        """A raced hard failure drops the provider; a soft one retries with inline schema."""
+        config = OrchestratorConfig(
+            enable_graceful_degradation=False, synthesis_parallelism=2, max_retries=2
+        )
+        openai_provider = MagicMock()
+        openai_provider.supports = AsyncMock(return_value=True)
+        openai_provider.generate = AsyncMock(
+            side_effect=RuntimeError("401 Unauthorized: invalid api key")
+        )
+        vertex_provider = MagicMock()
+        vertex_provider.supports = AsyncMock(return_value=True)
+        vertex_provider.generate = AsyncMock(
+            side_effect=[RuntimeError("schema rejected"), GenerateResponse(text='{"ok": 1}')]
+        )
+
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_registry = MagicMock()
+            mock_registry.get_provider.side_effect = lambda name, **_kwargs: {
+                "openai": openai_provider,
+                "vertex-ai": vertex_provider,
+            }[name]
+            mock_reg.return_value = mock_registry
+            orch = Orchestrator(providers=["openai", "vertex-ai"], config=config)
+
+        orch._task = "Review this change"
+        orch._subagent_name = "critic"
+        orch._prepare_run("critic")
+        orch._schema = {"type": "object"}
+
+        result, attempts = await orch._run_synthesis({"openai": '{"draft": "ok"}'}, "critique")
+
+        assert result.ok is True
+        assert attempts == 3
+        assert openai_provider.generate.await_count == 1
+        assert vertex_provider.generate.await_count == 2
+        assert orch._execution_plan["warnings"] == [
+            "vertex-ai synthesis fell back to inline-schema JSON mode "
+            "after structured-output request failure."
+        ]
+
     @pytest.mark.asyncio
     async def test_phase_prompt_metrics_capture_prompt_sizes(self):
         """Execution plan should record prompt sizing diagnostics per phase."""
@@ -1827,6 +2559,47 @@ class TestOrchestratorRuntimeTruthfulness:
         assert "Critique failed" in result.execution_plan["degradation_notes"][0]
         mock_synthesis.assert_awaited_once_with({"openai": '{"ok": true}'}, "")
 
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_on_one_instance_keep_separate_state(self):
+        """Each run executes on its own copy, leaving the shared instance untouched."""
+        config = OrchestratorConfig(enable_artifacts=False)
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_registry = MagicMock()
+            mock_registry.get_provider.return_value = CaptureProvider()
+            mock_reg.return_value = mock_registry
+            orch = Orchestrator(providers=["openai"], config=config)
+
+        async def slow_drafts():
+            await asyncio.sleep(0.01)
+            return {"openai": '{"ok": true}'}
+
+        with (
+            patch.object(orch, "_run_parallel_drafts", AsyncMock(side_effect=slow_drafts)),
+            patch.object(orch, "_run_critique", AsyncMock(return_value="critique")),
+            patch.object(
+                orch,
+                "_run_synthesis",
+                AsyncMock(
+                    return_value=(
+                        ValidationResult(ok=True, data={"ok": True}, raw='{"ok": true}'),
+                        1,
+                    )
+                ),
+            ),
+        ):
+            critic, planner = await asyncio.gather(
+                orch.run("Review this change", "critic"),
+                orch.run("Plan this change", "planner"),
+            )
+
+        assert critic.success is True
+        assert planner.success is True
+        assert critic.execution_plan["subagent"] == "critic"
+        assert planner.execution_plan["subagent"] == "planner"
+        assert critic.degradation_report is not planner.degradation_report
+        assert orch._task is None
+        assert orch._execution_plan is None
+
     @pytest.mark.asyncio
     async def test_run_uses_valid_draft_when_synthesis_fails(self):
         """A synthesis failure should fall back to a validated draft when possible."""
@@ -2189,3 +2962,28 @@ class TestOrchestratorPromptFormatting:
         assert "Drafts:" in prompt
         assert "Validation errors" in prompt
         assert "Previous error" in prompt
+
+    def test_format_synthesis_prompt_reuses_cached_draft_blocks(self):
+        """Synthesis retries render the draft blocks once per layout."""
+        config = OrchestratorConfig()
+        with patch("llm_council.engine.orchestrator.get_registry") as mock_reg:
+            mock_reg.return_value = MagicMock()
+            mock_reg.return_value.get_provider.return_value = MagicMock()
+            orch = Orchestrator(providers=["mock"], config=config)
+
+        drafts = {"provider1": "Draft content"}
+        cache: dict = {}
+        with patch.object(
+            orch, "_compose_draft_blocks", wraps=orch._compose_draft_blocks
+        ) as compose:
+            first = orch._format_synthesis_prompt(
+                "Test task", drafts, "", None, [], draft_block_cache=cache
+            )
+            retry = orch._format_synthesis_prompt(
+                "Test task", drafts, "", None, ["missing key"], draft_block_cache=cache
+            )
+
+        assert compose.call_count == 1
+        assert "Provider: provider1" in first
+        assert "Provider: provider1" in retry
+        assert "- missing key" in retry
@@ -31,6 +31,7 @@ from llm_council.providers.base import (
     StructuredOutputConfig,
     classify_error,
 )
+from llm_council.providers.cache import ResponseCache, canonical_json
 from llm_council.providers.cli.claude_code import ClaudeCodeCLIProvider
 from llm_council.providers.cli.codex import CodexCLIProvider
 from llm_council.providers.cli.gemini_cli import GeminiCLIProvider
@@ -39,6 +40,8 @@ from llm_council.providers.gemini import (
 )
 from llm_council.providers.gemini import (
     GeminiProvider,
+    _strip_schema_meta_fields,
+    _thinking_config,
 )
 from llm_council.providers.openai import (
     DEFAULT_MODEL as OPENAI_DEFAULT_MODEL,
@@ -456,6 +459,348 @@ class TestAnthropicStructuredSchemaNormalization:
         assert item_required == {"path", "language", "code"}
 
 
+class TestAnthropicDoctor:
+    """Tests for the Anthropic provider health check."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_doctor_cache(self):
+        from llm_council.providers import anthropic as anthropic_provider
+
+        with patch.dict(anthropic_provider._DOCTOR_RESULTS, clear=True):
+            yield
+
+    @staticmethod
+    async def _doctor(provider: AnthropicProvider):
+        anthropic_module = ModuleType("anthropic")
+        anthropic_module.AsyncAnthropic = MagicMock()
+        with patch.dict(sys.modules, {"anthropic": anthropic_module}):
+            return await provider.doctor()
+
+    @pytest.mark.asyncio
+    async def test_doctor_lists_models_instead_of_generating(self):
+        provider = AnthropicProvider(api_key="test-key")
+        client = MagicMock()
+        client.models.list = AsyncMock(return_value=SimpleNamespace(data=[]))
+        client.messages.create = AsyncMock()
+        provider._get_client = MagicMock(return_value=client)
+
+        anthropic_module = ModuleType("anthropic")
+        anthropic_module.AsyncAnthropic = MagicMock()
+        with patch.dict(sys.modules, {"anthropic": anthropic_module}):
+            result = await provider.doctor()
+
+        assert result.ok is True
+        client.models.list.assert_awaited_once_with(limit=1)
+        client.messages.create.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_doctor_reports_api_errors(self):
+        provider = AnthropicProvider(api_key="test-key")
+        client = MagicMock()
+        client.models.list = AsyncMock(side_effect=RuntimeError("401 invalid x-api-key"))
+        provider._get_client = MagicMock(return_value=client)
+
+        anthropic_module = ModuleType("anthropic")
+        anthropic_module.AsyncAnthropic = MagicMock()
+        with patch.dict(sys.modules, {"anthropic": anthropic_module}):
+            result = await provider.doctor()
+
+        assert result.ok is False
+        assert result.message == "API error: 401 invalid x-api-key"
+
+    @pytest.mark.asyncio
+    async def test_doctor_falls_back_to_one_token_call_when_models_endpoint_is_missing(self):
+        provider = AnthropicProvider(api_key="test-key")
+        client = MagicMock()
+        not_found = RuntimeError("not found")
+        not_found.status_code = 404
+        client.models.list = AsyncMock(side_effect=not_found)
+        client.messages.create = AsyncMock()
+        provider._get_client = MagicMock(return_value=client)
+
+        result = await self._doctor(provider)
+
+        assert result.ok is True
+        assert client.messages.create.await_args.kwargs["max_tokens"] == 1
+
+    @pytest.mark.asyncio
+    async def test_doctor_reuses_recent_success_for_the_same_key(self):
+        client = MagicMock()
+        client.models.list = AsyncMock(return_value=SimpleNamespace(data=[]))
+        providers = [AnthropicProvider(api_key="test-key") for _ in range(2)]
+        for provider in providers:
+            provider._get_client = MagicMock(return_value=client)
+
+        first = await self._doctor(providers[0])
+        second = await self._doctor(providers[1])
+
+        assert first.ok is second.ok is True
+        client.models.list.assert_awaited_once()
+
+
+class TestAnthropicMessageBuilding:
+    """Tests for Anthropic message and system prompt assembly."""
+
+    @pytest.mark.asyncio
+    async def test_system_messages_are_lifted_out_and_last_one_wins(self):
+        provider = AnthropicProvider(api_key="test-key")
+        client = AsyncMock()
+        provider._get_client = MagicMock(return_value=client)
+        client.messages.create = AsyncMock(
+            return_value=SimpleNamespace(
+                content=[SimpleNamespace(text="ok")],
+                model="claude-opus-4-6",
+                stop_reason="end_turn",
+                usage=None,
+            )
+        )
+
+        await provider.generate(
+            GenerateRequest(
+                messages=[
+                    Message(role="system", content="first system"),
+                    Message(role="user", content="question"),
+                    Message(role="assistant", content="answer"),
+                    Message(role="system", content="final system"),
+                    Message(role="user", content="follow-up"),
+                ],
+                model="claude-opus-4-6",
+            )
+        )
+
+        call_kwargs = client.messages.create.await_args.kwargs
+        assert call_kwargs["system"] == "final system"
+        assert call_kwargs["messages"] == [
+            {"role": "user", "content": "question"},
+            {"role": "assistant", "content": "answer"},
+            {"role": "user", "content": "follow-up"},
+        ]
+
+
+class TestAnthropicRequestCoalescing:
+    """Tests for sharing identical in-flight Anthropic calls."""
+
+    @staticmethod
+    def _provider_with_slow_client(release: asyncio.Event) -> tuple[AnthropicProvider, MagicMock]:
+        provider = AnthropicProvider(api_key="test-key")
+        client = MagicMock()
+
+        async def create(**kwargs):
+            await release.wait()
+            return SimpleNamespace(
+                content=[SimpleNamespace(text=kwargs["messages"][-1]["content"])],
+                model=kwargs["model"],
+                stop_reason="end_turn",
+                usage=None,
+            )
+
+        client.messages.create = AsyncMock(side_effect=create)
+        provider._get_client = MagicMock(return_value=client)
+        return provider, client
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_requests_share_one_call(self):
+        release = asyncio.Event()
+        provider, client = self._provider_with_slow_client(release)
+
+        def request(content: str) -> GenerateRequest:
+            return GenerateRequest(
+                messages=[Message(role="user", content=content)], model="claude-opus-4-6"
+            )
+
+        calls = [
+            asyncio.create_task(provider.generate(request("same"))),
+            asyncio.create_task(provider.generate(request("same"))),
+            asyncio.create_task(provider.generate(request("other"))),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        first, second, other = await asyncio.gather(*calls)
+
+        assert first.text == second.text == "same"
+        assert other.text == "other"
+        assert client.messages.create.await_count == 2
+        assert provider._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelling_every_caller_cancels_the_shared_call(self):
+        release = asyncio.Event()
+        provider, client = self._provider_with_slow_client(release)
+        request = GenerateRequest(
+            messages=[Message(role="user", content="same")], model="claude-opus-4-6"
+        )
+
+        caller = asyncio.create_task(provider.generate(request))
+        await asyncio.sleep(0)
+        (entry,) = provider._inflight.values()
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+
+        assert entry.task.cancelled()
+        assert provider._inflight == {}
+
+
+class TestAnthropicConcurrencyLimit:
+    """Tests for the per-key cap on concurrent Anthropic calls."""
+
+    @pytest.mark.asyncio
+    async def test_calls_sharing_a_key_respect_max_concurrent(self):
+        active = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return SimpleNamespace(
+                content=[SimpleNamespace(text="ok")],
+                model=kwargs["model"],
+                stop_reason="end_turn",
+                usage=None,
+            )
+
+        client = MagicMock()
+        client.messages.create = AsyncMock(side_effect=create)
+        providers = [
+            AnthropicProvider(api_key="limit-test-key", max_concurrent=2) for _ in range(2)
+        ]
+        for provider in providers:
+            provider._get_client = MagicMock(return_value=client)
+
+        await asyncio.gather(
+            *(
+                providers[i % 2].generate(
+                    GenerateRequest(prompt=f"judge {i}", model="claude-opus-4-6")
+                )
+                for i in range(6)
+            )
+        )
+
+        assert client.messages.create.await_count == 6
+        assert peak == 2
+
+    def test_max_concurrent_must_be_positive(self):
+        with pytest.raises(ValueError, match="max_concurrent"):
+            AnthropicProvider(api_key="test-key", max_concurrent=0)
+
+
+class TestAnthropicResponseCache:
+    """Tests for the opt-in Anthropic response cache."""
+
+    @staticmethod
+    def _provider(cache: ResponseCache) -> tuple[AnthropicProvider, MagicMock]:
+        provider = AnthropicProvider(api_key="test-key", response_cache=cache)
+        client = MagicMock()
+        client.messages.create = AsyncMock(
+            return_value=SimpleNamespace(
+                content=[SimpleNamespace(text="verdict")],
+                model="claude-opus-4-6",
+                stop_reason="end_turn",
+                usage=None,
+            )
+        )
+        provider._get_client = MagicMock(return_value=client)
+        return provider, client
+
+    @pytest.mark.asyncio
+    async def test_temperature_zero_repeat_is_served_from_cache(self):
+        provider, client = self._provider(ResponseCache())
+        request = GenerateRequest(prompt="judge this", model="claude-opus-4-6", temperature=0)
+
+        first = await provider.generate(request)
+        second = await provider.generate(request)
+
+        assert first.text == second.text == "verdict"
+        assert client.messages.create.await_count == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"temperature": 0.7},
+            {"temperature": 0, "tools": [{"name": "lookup", "input_schema": {}}]},
+        ],
+    )
+    async def test_non_deterministic_or_tool_requests_are_not_cached(self, overrides):
+        cache = ResponseCache()
+        provider, client = self._provider(cache)
+        request = GenerateRequest(prompt="judge this", model="claude-opus-4-6", **overrides)
+
+        await provider.generate(request)
+        await provider.generate(request)
+
+        assert client.messages.create.await_count == 2
+        assert len(cache) == 0
+
+
+class TestResponseCache:
+    """Tests for the LRU + TTL response cache."""
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = ResponseCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_entries_expire_after_ttl(self):
+        cache = ResponseCache(ttl_seconds=10)
+        with patch("llm_council.providers.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("llm_council.providers.cache.time.monotonic", return_value=109.0):
+            assert cache.get("a") == 1
+        with patch("llm_council.providers.cache.time.monotonic", return_value=110.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_make_key_ignores_dict_order(self):
+        assert ResponseCache.make_key({"a": 1, "b": 2}) == ResponseCache.make_key({"b": 2, "a": 1})
+
+    def test_canonical_json_falls_back_for_payloads_orjson_rejects(self):
+        assert canonical_json({"b": 1, "a": [2]}) == canonical_json({"a": [2], "b": 1})
+        assert str(2**70).encode() in canonical_json({"n": 2**70})
+
+
+class TestAnthropicStructuredOutputModels:
+    """Tests for Anthropic structured-output model detection."""
+
+    @pytest.mark.parametrize(
+        ("model", "expected"),
+        [
+            ("claude-opus-4-6", True),
+            ("claude-sonnet-4-5-20251201", True),
+            ("claude-haiku-4-5-20251001", True),
+            ("claude-4-opus", True),
+            ("claude-3-5-sonnet-20241022", False),
+            ("claude-3-opus-20240229", False),
+        ],
+    )
+    def test_model_support(self, model, expected):
+        provider = AnthropicProvider(api_key="test-key")
+        assert provider._model_supports_structured_output(model) is expected
+
+    def test_model_support_is_memoized(self):
+        from llm_council.providers.anthropic import _model_supports_structured_output
+
+        _model_supports_structured_output.cache_clear()
+        provider = AnthropicProvider(api_key="test-key")
+        for _ in range(3):
+            provider._model_supports_structured_output("claude-sonnet-4-6")
+
+        info = _model_supports_structured_output.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+
 class TestAnthropicThinkingType:
     """Tests for Anthropic thinking/reasoning configuration."""
 
@@ -464,7 +809,7 @@ class TestAnthropicThinkingType:
         """Anthropic adaptive thinking must not include budget_tokens."""
         provider = AnthropicProvider(api_key="test-key")
         client = AsyncMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         response_obj = SimpleNamespace(
             content=[SimpleNamespace(text="ok")],
@@ -494,7 +839,7 @@ class TestAnthropicPromptCaching:
     async def test_generate_sends_default_cache_control_through_extra_body(self):
         provider = AnthropicProvider(api_key="test-key")
         client = AsyncMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         response_obj = SimpleNamespace(
             content=[SimpleNamespace(text="ok")],
@@ -516,11 +861,84 @@ class TestAnthropicPromptCaching:
         assert call_kwargs["extra_body"]["cache_control"] == {"type": "ephemeral"}
         assert "cache_control" not in call_kwargs
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("system", "prompt_cache", "expect_blocks"),
+        [
+            ("x" * 5000, PromptCacheConfig(), True),
+            ("x" * 5000, None, False),
+            ("short system prompt", PromptCacheConfig(), False),
+        ],
+    )
+    async def test_generate_marks_long_system_prompt_as_cache_breakpoint(
+        self, system, prompt_cache, expect_blocks
+    ):
+        provider = AnthropicProvider(api_key="test-key")
+        client = AsyncMock()
+        provider._get_client = MagicMock(return_value=client)
+        client.messages.create = AsyncMock(
+            return_value=SimpleNamespace(
+                content=[SimpleNamespace(text="ok")],
+                model="claude-opus-4-6",
+                stop_reason="end_turn",
+                usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+            )
+        )
+
+        await provider.generate(
+            GenerateRequest(
+                messages=[
+                    Message(role="system", content=system),
+                    Message(role="user", content="test"),
+                ],
+                model="claude-opus-4-6",
+                prompt_cache=prompt_cache,
+            )
+        )
+
+        call_kwargs = client.messages.create.await_args_list[0].kwargs
+        if expect_blocks:
+            assert call_kwargs["system"] == [
+                {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+            ]
+        else:
+            assert call_kwargs["system"] == system
+
+    @pytest.mark.asyncio
+    async def test_cache_system_flag_disables_system_breakpoint(self):
+        provider = AnthropicProvider(api_key="test-key", cache_system=False)
+        client = AsyncMock()
+        provider._get_client = MagicMock(return_value=client)
+        client.messages.create = AsyncMock(
+            return_value=SimpleNamespace(
+                content=[SimpleNamespace(text="ok")],
+                model="claude-opus-4-6",
+                stop_reason="end_turn",
+                usage=None,
+            )
+        )
+        system = "x" * 5000
+
+        await provider.generate(
+            GenerateRequest(
+                messages=[
+                    Message(role="system", content=system),
+                    Message(role="user", content="test"),
+                ],
+                model="claude-opus-4-6",
+                prompt_cache=PromptCacheConfig(),
+            )
+        )
+
+        call_kwargs = client.messages.create.await_args.kwargs
+        assert call_kwargs["system"] == system
+        assert call_kwargs["extra_body"]["cache_control"] == {"type": "ephemeral"}
+
     @pytest.mark.asyncio
     async def test_generate_sends_one_hour_cache_control_through_extra_body(self):
         provider = AnthropicProvider(api_key="test-key")
         client = AsyncMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         response_obj = SimpleNamespace(
             content=[SimpleNamespace(text="ok")],
@@ -546,7 +964,7 @@ class TestAnthropicPromptCaching:
     async def test_generate_without_prompt_cache_omits_cache_control(self):
         provider = AnthropicProvider(api_key="test-key")
         client = AsyncMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         response_obj = SimpleNamespace(
             content=[SimpleNamespace(text="ok")],
@@ -572,7 +990,7 @@ class TestAnthropicPromptCaching:
         """Structured-output beta calls should still receive prompt-cache controls."""
         provider = AnthropicProvider(api_key="test-key")
         client = AsyncMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         response_obj = SimpleNamespace(
             content=[SimpleNamespace(text='{"ok":true}')],
@@ -607,7 +1025,7 @@ class TestAnthropicPromptCaching:
         """Streaming calls should receive the same prompt-cache request shape."""
         provider = AnthropicProvider(api_key="test-key")
         client = AsyncMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         async def stream_iter():
             if False:
@@ -630,6 +1048,72 @@ class TestAnthropicPromptCaching:
         assert call_kwargs["extra_body"]["cache_control"] == {"type": "ephemeral"}
         assert "cache_control" not in call_kwargs
 
+    @pytest.mark.asyncio
+    async def test_generate_stream_yields_text_deltas_from_raw_events(self):
+        provider = AnthropicProvider(api_key="test-key")
+        events = [
+            SimpleNamespace(type="message_start"),
+            SimpleNamespace(
+                type="content_block_delta", delta=SimpleNamespace(type="text_delta", text="Hel")
+            ),
+            SimpleNamespace(
+                type="content_block_delta",
+                delta=SimpleNamespace(type="input_json_delta", partial_json="{"),
+            ),
+            SimpleNamespace(
+                type="content_block_delta", delta=SimpleNamespace(type="text_delta", text="lo")
+            ),
+            SimpleNamespace(type="message_stop"),
+        ]
+
+        class FakeStream:
+            def __init__(self):
+                self.close = AsyncMock()
+
+            async def __aiter__(self):
+                for event in events:
+                    yield event
+
+        raw_stream = FakeStream()
+        client = MagicMock()
+        client.messages.create = AsyncMock(return_value=raw_stream)
+        provider._get_client = MagicMock(return_value=client)
+
+        result = await provider.generate(
+            GenerateRequest(prompt="hi", model="claude-opus-4-6", stream=True)
+        )
+        chunks = [chunk.text async for chunk in result]
+
+        assert chunks == ["Hel", "lo"]
+        assert client.messages.create.await_args.kwargs["stream"] is True
+        raw_stream.close.assert_awaited_once()
+
+    def test_parse_response_joins_text_blocks_and_collects_tool_calls(self):
+        provider = AnthropicProvider(api_key="test-key")
+        response_obj = SimpleNamespace(
+            content=[
+                SimpleNamespace(type="thinking", thinking="weighing options"),
+                SimpleNamespace(text='{"ok": '),
+                SimpleNamespace(type="tool_use", id="tool-1", name="lookup", input={"q": "x"}),
+                SimpleNamespace(type="text", text="true}"),
+            ],
+            model="claude-opus-4-6",
+            stop_reason="end_turn",
+            usage=None,
+        )
+
+        response = provider._parse_response(response_obj)
+
+        assert response.text == '{"ok": true}'
+        assert response.content == response.text
+        assert response.tool_calls == [
+            {
+                "id": "tool-1",
+                "type": "function",
+                "function": {"name": "lookup", "arguments": {"q": "x"}},
+            }
+        ]
+
     def test_parse_response_includes_cache_usage_tokens(self):
         provider = AnthropicProvider(api_key="test-key")
         response_obj = SimpleNamespace(
@@ -691,7 +1175,7 @@ class TestAnthropicStructuredOutputFallback:
     async def test_generate_retries_without_output_format_on_schema_rejection(self):
         provider = AnthropicProvider(api_key="test-key")
         client = AsyncMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         structured_error = RuntimeError(
             "output_format.schema: For 'number' type, properties maximum, minimum are not supported"
@@ -960,6 +1444,56 @@ class TestProviderTransportDefaults:
         assert kwargs["timeout"] == 60.0
         assert kwargs["max_retries"] == 0
 
+    @pytest.mark.asyncio
+    async def test_anthropic_client_is_shared_per_api_key(self):
+        """Anthropic providers with the same key reuse one client and pool."""
+        from llm_council.providers import anthropic as anthropic_provider
+
+        anthropic_module = ModuleType("anthropic")
+        mock_client = MagicMock(side_effect=lambda **kwargs: object())
+        anthropic_module.AsyncAnthropic = mock_client
+
+        with (
+            patch.dict(sys.modules, {"anthropic": anthropic_module}),
+            patch.dict(anthropic_provider._CLIENTS, clear=True),
+        ):
+            first = AnthropicProvider(api_key="key-a")._get_client()
+            second = AnthropicProvider(api_key="key-a")._get_client()
+            other = AnthropicProvider(api_key="key-b")._get_client()
+
+        assert first is second
+        assert other is not first
+        assert mock_client.call_count == 2
+        assert mock_client.call_args.kwargs["max_retries"] == 0
+        http_client = mock_client.call_args.kwargs["http_client"]
+        assert http_client._transport._pool._max_connections == 100
+        assert http_client._transport._pool._max_keepalive_connections == 50
+        await http_client.aclose()
+
+    def test_anthropic_client_is_rebuilt_for_a_new_event_loop(self):
+        """A provider reused across asyncio.run() calls never keeps a stale client."""
+        from llm_council.providers import anthropic as anthropic_provider
+
+        anthropic_module = ModuleType("anthropic")
+        mock_client = MagicMock(side_effect=lambda **kwargs: MagicMock())
+        anthropic_module.AsyncAnthropic = mock_client
+        provider = AnthropicProvider(api_key="key-a")
+
+        async def lookup() -> tuple[object, object]:
+            return provider._get_client(), provider._get_client()
+
+        with (
+            patch.dict(sys.modules, {"anthropic": anthropic_module}),
+            patch.dict(anthropic_provider._CLIENTS, clear=True),
+        ):
+            first, first_again = asyncio.run(lookup())
+            second, _ = asyncio.run(lookup())
+            assert list(anthropic_provider._CLIENTS.values())[0][1] is second
+
+        assert first is first_again
+        assert second is not first
+        assert mock_client.call_count == 2
+
     def test_gemini_client_uses_bounded_http_options(self, monkeypatch):
         """Gemini provider should clamp SDK timeout and retry attempts."""
         monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
@@ -974,7 +1508,12 @@ class TestProviderTransportDefaults:
         )
         google_module.genai = genai_module
 
-        with patch.dict(sys.modules, {"google": google_module, "google.genai": genai_module}):
+        from llm_council.providers import gemini as gemini_provider
+
+        with (
+            patch.dict(sys.modules, {"google": google_module, "google.genai": genai_module}),
+            patch.dict(gemini_provider._CLIENTS, clear=True),
+        ):
             provider = GeminiProvider()
             provider._get_client()
 
@@ -982,6 +1521,67 @@ class TestProviderTransportDefaults:
         assert http_options.timeout == 15000
         assert http_options.retry_options.attempts == 1
 
+    def test_gemini_client_is_shared_per_key_and_timeout(self, monkeypatch):
+        monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+
+        google_module = ModuleType("google")
+        genai_module = ModuleType("google.genai")
+        mock_client = MagicMock(side_effect=lambda **kwargs: MagicMock())
+        genai_module.Client = mock_client
+        genai_module.types = SimpleNamespace(
+            HttpOptions=lambda **kwargs: SimpleNamespace(**kwargs),
+            HttpRetryOptions=lambda **kwargs: SimpleNamespace(**kwargs),
+        )
+        google_module.genai = genai_module
+
+        from llm_council.providers import gemini as gemini_provider
+
+        with (
+            patch.dict(sys.modules, {"google": google_module, "google.genai": genai_module}),
+            patch.dict(gemini_provider._CLIENTS, clear=True),
+        ):
+            provider = GeminiProvider()
+            first = provider._get_client(timeout_ms=30000)
+            second = provider._get_client(timeout_ms=30000)
+            default = provider._get_client()
+            shared = GeminiProvider()._get_client()
+            other = GeminiProvider(api_key="other-key")._get_client()
+
+            async def in_loop():
+                return provider._get_client()
+
+            in_new_loop = asyncio.run(in_loop())
+            after_loop = provider._get_client()
+
+        assert first is second
+        assert default is not first
+        assert shared is default
+        assert other is not default
+        # A client built on another event loop is replaced, even for the same instance
+        assert in_new_loop is not default
+        assert after_loop is not in_new_loop
+        assert mock_client.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_gemini_doctor_fetches_single_model_page(self, monkeypatch):
+        monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+
+        google_module = ModuleType("google")
+        google_module.genai = ModuleType("google.genai")
+        provider = GeminiProvider()
+        client = MagicMock()
+        client.aio.models.list = AsyncMock(return_value=[])
+        provider._get_client = MagicMock(return_value=client)
+
+        with patch.dict(
+            sys.modules, {"google": google_module, "google.genai": google_module.genai}
+        ):
+            result = await provider.doctor()
+
+        assert result.ok is True
+        client.aio.models.list.assert_awaited_once_with(config={"page_size": 1})
+        client.models.list.assert_not_called()
+
     def test_vertex_gemini_client_uses_bounded_http_options(self, monkeypatch):
         """Vertex Gemini client should use the same bounded HTTP settings."""
         monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "test-project")
@@ -1225,7 +1825,7 @@ class TestVertexPromptCaching:
     async def test_stream_does_not_retry_expiry_after_partial_output(self):
         provider = GeminiProvider(api_key="test-key")
         client = MagicMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         async def failing_stream():
             yield SimpleNamespace(text="partial")
@@ -1283,6 +1883,145 @@ class TestAnthropicProviderEnvModel:
         assert provider._default_model == "claude-sonnet-4-5"
 
 
+class TestGeminiResponseParsing:
+    """Tests for Gemini response parsing."""
+
+    def test_parse_response_falls_back_to_candidate_parts(self):
+        class BlockedText:
+            @property
+            def text(self):
+                raise ValueError("no text accessor")
+
+            candidates = [
+                SimpleNamespace(
+                    content=SimpleNamespace(
+                        parts=[
+                            SimpleNamespace(text="he"),
+                            SimpleNamespace(),
+                            SimpleNamespace(text="y"),
+                        ]
+                    ),
+                    finish_reason="STOP",
+                )
+            ]
+            usage_metadata = SimpleNamespace(
+                prompt_token_count=3, candidates_token_count=2, total_token_count=5
+            )
+
+        response = GeminiProvider(api_key="test-key")._parse_response(BlockedText())
+
+        assert response.text == "hey"
+        assert response.finish_reason == "STOP"
+        assert response.usage == {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5}
+
+    def test_parse_response_without_candidates_or_usage(self):
+        response = GeminiProvider(api_key="test-key")._parse_response(
+            SimpleNamespace(text="ok", candidates=None)
+        )
+
+        assert response.text == "ok"
+        assert response.finish_reason is None
+        assert response.usage is None
+
+
+class TestGeminiSchemaStripping:
+    """Tests for Gemini response-schema normalization."""
+
+    def test_strips_unsupported_fields_and_schema_titles(self):
+        schema = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "title": "Output",
+            "type": "object",
+            "additionalProperties": False,
+            "properties": {
+                "title": {"type": "string", "title": "Title", "maxLength": 80},
+                "tags": {"type": "array", "items": {"type": "string"}, "minItems": 1},
+            },
+            "required": ["title"],
+        }
+
+        stripped = _strip_schema_meta_fields(schema)
+
+        assert stripped == {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "title": "Title"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["title"],
+        }
+        assert "$schema" in schema
+        assert schema["properties"]["tags"]["minItems"] == 1
+
+    def test_shares_no_subtrees_with_the_input_schema(self):
+        """google-genai edits response_schema in place, so clean subtrees are copied too."""
+        clean = {"type": "object", "properties": {"ok": {"type": "boolean"}}}
+        schema = {"$id": "council", "type": "object", "properties": {"nested": clean}}
+
+        stripped = _strip_schema_meta_fields(schema)
+        stripped["properties"]["nested"]["property_ordering"] = ["ok"]
+
+        assert stripped["properties"] is not schema["properties"]
+        assert _strip_schema_meta_fields(clean) is not clean
+        assert clean == {"type": "object", "properties": {"ok": {"type": "boolean"}}}
+
+
+class TestGeminiConcurrencyLimit:
+    """Tests for the per-key cap on concurrent Gemini calls."""
+
+    @pytest.mark.asyncio
+    async def test_calls_sharing_a_key_respect_max_concurrent(self):
+        active = 0
+        peak = 0
+
+        async def generate_content(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return SimpleNamespace(text="ok", candidates=[], usage_metadata=None)
+
+        client = MagicMock()
+        client.aio.models.generate_content = AsyncMock(side_effect=generate_content)
+        providers = [GeminiProvider(api_key="limit-test-key", max_concurrent=2) for _ in range(2)]
+        for provider in providers:
+            provider._get_client = MagicMock(return_value=client)
+
+        await asyncio.gather(
+            *(providers[i % 2].generate(GenerateRequest(prompt=f"judge {i}")) for i in range(6))
+        )
+
+        assert client.aio.models.generate_content.await_count == 6
+        assert peak == 2
+
+    def test_max_concurrent_must_be_positive(self):
+        with pytest.raises(ValueError, match="max_concurrent"):
+            GeminiProvider(api_key="test-key", max_concurrent=0)
+
+
+class TestGeminiThinkingConfig:
+    """Tests for mapping ReasoningConfig to Gemini thinking_config."""
+
+    def test_thinking_level_maps_to_upper_case(self):
+        reasoning = ReasoningConfig(enabled=True, thinking_level="minimal")
+
+        assert _thinking_config(reasoning, "Google") == {"thinking_level": "MINIMAL"}
+
+    def test_budget_is_capped_at_provider_maximum(self):
+        assert _thinking_config(ReasoningConfig(enabled=True, budget_tokens=2048), "Google") == {
+            "thinking_budget": 2048
+        }
+        assert _thinking_config(ReasoningConfig(enabled=True, budget_tokens=64000), "Google") == {
+            "thinking_budget": 24576
+        }
+
+    def test_defaults_to_medium_level(self):
+        assert _thinking_config(ReasoningConfig(enabled=True), "Google") == {
+            "thinking_level": "MEDIUM"
+        }
+
+
 class TestGeminiProviderEnvModel:
     """Tests for GEMINI_MODEL env var fallback in GeminiProvider."""
 
@@ -1321,7 +2060,7 @@ class TestGeminiPromptCaching:
     async def test_generate_passes_cached_content_name_in_config(self):
         provider = GeminiProvider(api_key="test-key")
         client = MagicMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         response_obj = SimpleNamespace(
             text="ok",
@@ -1352,7 +2091,7 @@ class TestGeminiPromptCaching:
     async def test_generate_without_prompt_cache_omits_cached_content(self):
         provider = GeminiProvider(api_key="test-key")
         client = MagicMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         response_obj = SimpleNamespace(
             text="ok",
@@ -1396,7 +2135,7 @@ class TestGeminiPromptCaching:
     async def test_generate_creates_cached_content_when_name_is_missing(self):
         provider = GeminiProvider(api_key="test-key")
         client = MagicMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         client.aio.caches.create = AsyncMock(
             return_value=SimpleNamespace(name="cachedContents/generated")
@@ -1442,7 +2181,7 @@ class TestGeminiPromptCaching:
     async def test_generate_refreshes_ttl_for_existing_cached_content(self):
         provider = GeminiProvider(api_key="test-key")
         client = MagicMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         client.aio.caches.update = AsyncMock(return_value=SimpleNamespace())
         client.aio.models.generate_content = AsyncMock(
@@ -1478,7 +2217,7 @@ class TestGeminiPromptCaching:
     async def test_generate_deletes_created_cache_after_success(self):
         provider = GeminiProvider(api_key="test-key")
         client = MagicMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         client.aio.caches.create = AsyncMock(
             return_value=SimpleNamespace(name="cachedContents/tmp")
@@ -1516,7 +2255,7 @@ class TestGeminiPromptCaching:
     async def test_generate_warns_when_cache_cleanup_fails(self):
         provider = GeminiProvider(api_key="test-key")
         client = MagicMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         client.aio.caches.create = AsyncMock(
             return_value=SimpleNamespace(name="cachedContents/tmp")
@@ -1554,7 +2293,7 @@ class TestGeminiPromptCaching:
     async def test_generate_recreates_expired_cached_content_once(self):
         provider = GeminiProvider(api_key="test-key")
         client = MagicMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         client.aio.caches.create = AsyncMock(
             return_value=SimpleNamespace(name="cachedContents/recreated")
@@ -1595,7 +2334,7 @@ class TestGeminiPromptCaching:
     async def test_stream_deletes_created_cache_after_success(self):
         provider = GeminiProvider(api_key="test-key")
         client = MagicMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         async def stream_chunks():
             yield SimpleNamespace(text="ok")
@@ -1630,7 +2369,7 @@ class TestGeminiPromptCaching:
     async def test_generate_deletes_created_cache_after_generation_failure(self):
         provider = GeminiProvider(api_key="test-key")
         client = MagicMock()
-        provider._client = client
+        provider._get_client = MagicMock(return_value=client)
 
         client.aio.caches.create = AsyncMock(
             return_value=SimpleNamespace(name="cachedContents/tmp")
@@ -1757,6 +2496,37 @@ class TestCodexCLIProviderDoctor:
         assert "Attempted to create a NULL object" in result.message
 
 
+class TestCodexCLIProviderCommand:
+    """Tests for Codex CLI argv construction."""
+
+    def test_default_flags_are_split_once(self):
+        provider = CodexCLIProvider(
+            cli_path="/usr/local/bin/codex", default_flags="--sandbox read-only --profile 'ci run'"
+        )
+        request = GenerateRequest(prompt="hello")
+
+        with patch("llm_council.providers.cli.codex.shlex.split") as split:
+            cmd = provider._build_command(request, model="gpt-5")
+            provider._build_command(request, model="gpt-5")
+
+        split.assert_not_called()
+        assert cmd[:6] == [
+            "/usr/local/bin/codex",
+            "exec",
+            "--sandbox",
+            "read-only",
+            "--profile",
+            "ci run",
+        ]
+        assert cmd[-1] == "hello"
+
+    def test_unsafe_flags_warn(self):
+        provider = CodexCLIProvider(cli_path="/usr/local/bin/codex", default_flags="--full-auto")
+
+        with pytest.warns(UserWarning):
+            provider._check_unsafe_flags()
+
+
 class TestCLIProviderTimeouts:
     """Tests for CLI provider request timeout overrides."""
 
@@ -1779,6 +2549,30 @@ class TestCLIProviderTimeouts:
         request = GenerateRequest(prompt="test", timeout_seconds=23)
         assert provider._request_timeout(request) == 23.0
 
+    @pytest.mark.asyncio
+    async def test_terminate_process_tree_bounds_reaping_when_pipes_stay_open(self):
+        """An escaped child holding stdout must not block reaping the killed parent."""
+        from llm_council.providers.cli._subprocess import terminate_process_tree
+
+        never = asyncio.Event()
+        # spec= limits the mock to Process's public API
+        process = MagicMock(spec=asyncio.subprocess.Process)
+        process.returncode = None
+        process.pid = 4242
+
+        async def blocked():
+            await never.wait()
+
+        process.communicate = MagicMock(side_effect=blocked)
+        process.wait = MagicMock(side_effect=blocked)
+
+        with patch("llm_council.providers.cli._subprocess.os.killpg"):
+            await asyncio.wait_for(terminate_process_tree(process, grace_seconds=0.01), 1.0)
+
+        process.kill.assert_called_once()
+        process.wait.assert_called_once()
+        assert process.communicate.call_count == 1
+
     @pytest.mark.asyncio
     async def test_gemini_cli_starts_new_session(self):
         provider = GeminiCLIProvider(cli_path="/opt/homebrew/bin/gemini")
@@ -1923,6 +2717,15 @@ class TestCLIProviderTimeouts:
         assert response.text == "ok"
         assert mock_exec.await_args.kwargs["start_new_session"] is True
 
+    def test_claude_cli_minimal_env_keeps_only_allowlisted_vars(self):
+        provider = ClaudeCodeCLIProvider(cli_path="/usr/local/bin/claude")
+        environ = {"PATH": "/usr/bin", "ANTHROPIC_API_KEY": "sk-test", "AWS_SECRET": "x"}
+
+        with patch.dict("os.environ", environ, clear=True):
+            env = provider._get_minimal_env()
+
+        assert env == {"PATH": "/usr/bin", "ANTHROPIC_API_KEY": "sk-test"}
+
     @pytest.mark.asyncio
     async def test_claude_cli_parses_list_envelopes(self):
         provider = ClaudeCodeCLIProvider(cli_path="/usr/local/bin/claude")
@@ -63,6 +63,19 @@ def test_register_duplicate_name_rejected() -> None:
         registry.register_provider("dummy", OtherDummyProvider)
 
 
+def test_version_bumps_only_for_new_registrations() -> None:
+    _reset_registry_singleton()
+    registry = ProviderRegistry()
+    start = registry.version
+
+    registry.register_provider("dummy", DummyProvider)
+    registry.register_provider("dummy", DummyProvider)
+    assert registry.version == start + 1
+
+    registry.register_provider("dummy2", OtherDummyProvider)
+    assert registry.version == start + 2
+
+
 @dataclass(frozen=True)
 class _FakeEntryPoint:
     name: str
@@ -134,3 +147,88 @@ def test_entry_point_auto_discovery(monkeypatch: pytest.MonkeyPatch) -> None:
 
     registry = ProviderRegistry()
     assert "dummy" in registry.list_providers()
+
+
+def test_entry_points_are_scanned_on_first_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    _reset_registry_singleton()
+
+    from llm_council.providers import registry as registry_module
+
+    calls: list[int] = []
+
+    def fake_entry_points() -> _FakeEntryPoints:
+        calls.append(1)
+        return _FakeEntryPoints([_FakeEntryPoint(name="dummy", value=DummyProvider)])
+
+    monkeypatch.setattr(registry_module.metadata, "entry_points", fake_entry_points)
+
+    registry = ProviderRegistry()
+    registry.register_provider("dummy2", OtherDummyProvider)
+    assert calls == []
+
+    assert isinstance(registry.get_provider("dummy"), DummyProvider)
+    assert registry.list_providers() == ["dummy", "dummy2"]
+    assert calls == [1]
+
+
+def test_entry_point_modules_load_on_first_instantiation(monkeypatch: pytest.MonkeyPatch) -> None:
+    _reset_registry_singleton()
+
+    from llm_council.providers import registry as registry_module
+
+    loads: list[str] = []
+
+    @dataclass(frozen=True)
+    class _CountingEntryPoint(_FakeEntryPoint):
+        def load(self) -> Any:
+            loads.append(self.name)
+            return self.value
+
+    def fake_entry_points() -> _FakeEntryPoints:
+        return _FakeEntryPoints(
+            [
+                _CountingEntryPoint(name="dummy", value=DummyProvider),
+                _CountingEntryPoint(name="dummy2", value=OtherDummyProvider),
+            ]
+        )
+
+    monkeypatch.setattr(registry_module.metadata, "entry_points", fake_entry_points)
+
+    registry = ProviderRegistry()
+    assert registry.list_providers() == ["dummy", "dummy2"]
+    assert loads == []
+
+    assert isinstance(registry.get_provider("dummy"), DummyProvider)
+    assert isinstance(registry.get_provider("dummy"), DummyProvider)
+    assert loads == ["dummy"]
+
+
+def test_invalid_entry_point_is_dropped_on_first_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    _reset_registry_singleton()
+
+    from llm_council.providers import registry as registry_module
+
+    def fake_entry_points() -> _FakeEntryPoints:
+        return _FakeEntryPoints([_FakeEntryPoint(name="broken", value=object())])
+
+    monkeypatch.setattr(registry_module.metadata, "entry_points", fake_entry_points)
+
+    registry = ProviderRegistry()
+    start = registry.version
+    with pytest.raises(KeyError):
+        registry.get_provider("broken")
+    assert "broken" not in registry.list_providers()
+    assert registry.version == start + 1
+
+
+def test_register_provider_accepts_import_path() -> None:
+    _reset_registry_singleton()
+    registry = ProviderRegistry()
+
+    registry.register_provider("lazy", f"{__name__}:DummyProviderWithModel")
+    provider = registry.get_provider("lazy", default_model="m")
+
+    assert isinstance(provider, DummyProviderWithModel)
+    assert provider.default_model == "m"
+    with pytest.raises(ValueError):
+        registry.register_provider("bad", "no_class_here")